@@ -1,23 +1,121 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Names equal to their submodule names are imported eagerly,
+# because importing the submodule would shadow a lazy attribute.
 from arbitragepy.arbitrage import arbitrage
-from arbitragepy.exceptions import (
-    ImcompabileQuantityIncrementsError,
-    NotionalLessThanMinNotionalError,
-    QuantityLessThanMinQuantityError,
-)
-from arbitragepy.fee import minus_fee, plus_fee
-from arbitragepy.models import (
-    ArbitragePayload,
-    ArbitrageResult,
-    OrderInfo,
-    OrderPayload,
-    SymbolInfo,
-)
-from arbitragepy.quantity_increment import (
-    is_compatible_quantity_increments,
-    to_compatible_quantity_increment,
-    validate_quantity_increments,
-)
-from arbitragepy.spread import get_spread
+from arbitragepy.sweep import sweep
+
+if TYPE_CHECKING:
+    from arbitragepy.backends import (
+        DECIMAL_BACKEND,
+        BackendOrder,
+        BackendOrderPayload,
+        BackendPayload,
+        BackendResult,
+        BackendSymbol,
+        NumericBackend,
+        convert_payload,
+        get_backend,
+        make_arbitrage,
+        numpy_backend,
+        result_to_decimal,
+        scaled_backend,
+        use_backend,
+    )
+    from arbitragepy.conversion import (
+        ConversionRates,
+        CrossArbitrageResult,
+        cross_arbitrage,
+    )
+    from arbitragepy.depth import DepthIndex
+    from arbitragepy.enums import (
+        FsyncPolicy,
+        Liquidity,
+        OrderSide,
+        OrderStatus,
+        RankBy,
+        RecordKind,
+    )
+    from arbitragepy.exceptions import (
+        ArbitrageError,
+        ImcompabileQuantityIncrementsError,
+        InsufficientBalanceError,
+        NotionalLessThanMinNotionalError,
+        PriceNotAlignedError,
+        QuantityGreaterThanMaxQuantityError,
+        QuantityLessThanMinQuantityError,
+        QuantityNotAlignedError,
+        ZeroQuantityError,
+    )
+    from arbitragepy.exchange import ExecutionReport, SimulatedExchange
+    from arbitragepy.feasibility import Infeasibility, NegativeCache, find_infeasibility
+    from arbitragepy.fee import minus_fee, plus_fee
+    from arbitragepy.fee_schedule import FeeSchedule, FeeTier
+    from arbitragepy.ledger import BalanceLedger, Reservation
+    from arbitragepy.matrix import SpreadMatrix, best_pairs, spread_matrix
+    from arbitragepy.models import (
+        ArbitragePayload,
+        ArbitrageResult,
+        OrderInfo,
+        OrderPayload,
+        SymbolInfo,
+    )
+    from arbitragepy.opportunity_log import (
+        LoggedOpportunity,
+        OpportunityLogReader,
+        OpportunityLogWriter,
+        log_files,
+    )
+    from arbitragepy.parallel import ARBITRAGE_CONTEXT, ConcurrentEvaluator
+    from arbitragepy.parsing import (
+        parse_levels,
+        parse_quantity,
+        parse_scaled,
+        parse_scaled_levels,
+        to_scaled,
+    )
+    from arbitragepy.quantity_increment import (
+        is_compatible_quantity_increments,
+        to_compatible_quantity_increment,
+        validate_quantity_increments,
+    )
+    from arbitragepy.quantize import get_quantizer, quantize_down, quantize_up
+    from arbitragepy.ranking import OpportunityHeap
+    from arbitragepy.reactor import ArbitrageReactor, MarketState, PairContext
+    from arbitragepy.registry import SymbolRegistry, symbol_info_from_dict
+    from arbitragepy.shared_quotes import SharedQuoteTable
+    from arbitragepy.simulation import (
+        RandomFillModel,
+        ScriptedFillModel,
+        SimulationResult,
+        simulate_execution,
+    )
+    from arbitragepy.spread import get_spread
+    from arbitragepy.staleness import QuoteStalenessIndex, TimerWheel, VenueStaleness
+    from arbitragepy.sweep import SweepCell, SweepResult
+    from arbitragepy.synthetic import (
+        MarketGenerator,
+        QuoteBatch,
+        SyntheticSymbol,
+        read_quotes,
+        write_quotes,
+    )
+    from arbitragepy.verification import (
+        Engine,
+        EngineReport,
+        Mismatch,
+        VerificationReport,
+        generate_cases,
+        verify,
+    )
+    from arbitragepy.wire import (
+        RecordView,
+        decode_outcome,
+        encode_outcome,
+        pack_outcomes,
+        unpack_outcomes,
+    )
 
 __all__ = [
     "arbitrage",
@@ -28,12 +126,220 @@ __all__ = [
     "SymbolInfo",
     "OrderInfo",
     "OrderPayload",
+    "ArbitrageError",
     "ImcompabileQuantityIncrementsError",
     "NotionalLessThanMinNotionalError",
     "QuantityLessThanMinQuantityError",
+    "ZeroQuantityError",
     "is_compatible_quantity_increments",
     "to_compatible_quantity_increment",
     "validate_quantity_increments",
     "get_spread",
+    "simulate_execution",
+    "RandomFillModel",
+    "ScriptedFillModel",
+    "SimulationResult",
+    "ArbitrageReactor",
+    "MarketState",
+    "PairContext",
+    "OpportunityHeap",
+    "OrderSide",
+    "RankBy",
+    "FsyncPolicy",
+    "LoggedOpportunity",
+    "OpportunityLogReader",
+    "OpportunityLogWriter",
+    "log_files",
+    "QuantityNotAlignedError",
+    "parse_levels",
+    "parse_quantity",
+    "parse_scaled",
+    "parse_scaled_levels",
+    "to_scaled",
+    "SpreadMatrix",
+    "best_pairs",
+    "spread_matrix",
+    "ARBITRAGE_CONTEXT",
+    "ConcurrentEvaluator",
+    "SharedQuoteTable",
+    "SymbolRegistry",
+    "symbol_info_from_dict",
+    "Infeasibility",
+    "NegativeCache",
+    "find_infeasibility",
+    "InsufficientBalanceError",
+    "BalanceLedger",
+    "Reservation",
+    "MarketGenerator",
+    "QuoteBatch",
+    "SyntheticSymbol",
+    "read_quotes",
+    "write_quotes",
+    "ExecutionReport",
+    "OrderStatus",
+    "SimulatedExchange",
+    "DECIMAL_BACKEND",
+    "NumericBackend",
+    "convert_payload",
+    "get_backend",
+    "make_arbitrage",
+    "numpy_backend",
+    "result_to_decimal",
+    "scaled_backend",
+    "use_backend",
+    "BackendOrder",
+    "BackendOrderPayload",
+    "BackendPayload",
+    "BackendResult",
+    "BackendSymbol",
+    "get_quantizer",
+    "quantize_down",
+    "quantize_up",
+    "QuoteStalenessIndex",
+    "TimerWheel",
+    "VenueStaleness",
+    "ConversionRates",
+    "CrossArbitrageResult",
+    "cross_arbitrage",
+    "SweepCell",
+    "SweepResult",
+    "sweep",
+    "Engine",
+    "EngineReport",
+    "Mismatch",
+    "VerificationReport",
+    "generate_cases",
+    "verify",
+    "RecordKind",
+    "RecordView",
+    "decode_outcome",
+    "encode_outcome",
+    "pack_outcomes",
+    "unpack_outcomes",
+    "FeeSchedule",
+    "FeeTier",
+    "Liquidity",
+    "DepthIndex",
+    "PriceNotAlignedError",
+    "QuantityGreaterThanMaxQuantityError",
 ]
 __version__ = "3.0.0"
+
+_LAZY_IMPORTS = {
+    "minus_fee": "arbitragepy.fee",
+    "plus_fee": "arbitragepy.fee",
+    "ArbitragePayload": "arbitragepy.models",
+    "ArbitrageResult": "arbitragepy.models",
+    "SymbolInfo": "arbitragepy.models",
+    "OrderInfo": "arbitragepy.models",
+    "OrderPayload": "arbitragepy.models",
+    "ArbitrageError": "arbitragepy.exceptions",
+    "ImcompabileQuantityIncrementsError": "arbitragepy.exceptions",
+    "NotionalLessThanMinNotionalError": "arbitragepy.exceptions",
+    "QuantityLessThanMinQuantityError": "arbitragepy.exceptions",
+    "ZeroQuantityError": "arbitragepy.exceptions",
+    "is_compatible_quantity_increments": "arbitragepy.quantity_increment",
+    "to_compatible_quantity_increment": "arbitragepy.quantity_increment",
+    "validate_quantity_increments": "arbitragepy.quantity_increment",
+    "get_spread": "arbitragepy.spread",
+    "simulate_execution": "arbitragepy.simulation",
+    "RandomFillModel": "arbitragepy.simulation",
+    "ScriptedFillModel": "arbitragepy.simulation",
+    "SimulationResult": "arbitragepy.simulation",
+    "ArbitrageReactor": "arbitragepy.reactor",
+    "MarketState": "arbitragepy.reactor",
+    "PairContext": "arbitragepy.reactor",
+    "OpportunityHeap": "arbitragepy.ranking",
+    "OrderSide": "arbitragepy.enums",
+    "RankBy": "arbitragepy.enums",
+    "FsyncPolicy": "arbitragepy.enums",
+    "LoggedOpportunity": "arbitragepy.opportunity_log",
+    "OpportunityLogReader": "arbitragepy.opportunity_log",
+    "OpportunityLogWriter": "arbitragepy.opportunity_log",
+    "log_files": "arbitragepy.opportunity_log",
+    "QuantityNotAlignedError": "arbitragepy.exceptions",
+    "parse_levels": "arbitragepy.parsing",
+    "parse_quantity": "arbitragepy.parsing",
+    "parse_scaled": "arbitragepy.parsing",
+    "parse_scaled_levels": "arbitragepy.parsing",
+    "to_scaled": "arbitragepy.parsing",
+    "SpreadMatrix": "arbitragepy.matrix",
+    "best_pairs": "arbitragepy.matrix",
+    "spread_matrix": "arbitragepy.matrix",
+    "ARBITRAGE_CONTEXT": "arbitragepy.parallel",
+    "ConcurrentEvaluator": "arbitragepy.parallel",
+    "SharedQuoteTable": "arbitragepy.shared_quotes",
+    "SymbolRegistry": "arbitragepy.registry",
+    "symbol_info_from_dict": "arbitragepy.registry",
+    "Infeasibility": "arbitragepy.feasibility",
+    "NegativeCache": "arbitragepy.feasibility",
+    "find_infeasibility": "arbitragepy.feasibility",
+    "InsufficientBalanceError": "arbitragepy.exceptions",
+    "BalanceLedger": "arbitragepy.ledger",
+    "Reservation": "arbitragepy.ledger",
+    "MarketGenerator": "arbitragepy.synthetic",
+    "QuoteBatch": "arbitragepy.synthetic",
+    "SyntheticSymbol": "arbitragepy.synthetic",
+    "read_quotes": "arbitragepy.synthetic",
+    "write_quotes": "arbitragepy.synthetic",
+    "ExecutionReport": "arbitragepy.exchange",
+    "OrderStatus": "arbitragepy.enums",
+    "SimulatedExchange": "arbitragepy.exchange",
+    "DECIMAL_BACKEND": "arbitragepy.backends",
+    "NumericBackend": "arbitragepy.backends",
+    "convert_payload": "arbitragepy.backends",
+    "get_backend": "arbitragepy.backends",
+    "make_arbitrage": "arbitragepy.backends",
+    "numpy_backend": "arbitragepy.backends",
+    "result_to_decimal": "arbitragepy.backends",
+    "scaled_backend": "arbitragepy.backends",
+    "use_backend": "arbitragepy.backends",
+    "BackendOrder": "arbitragepy.backends",
+    "BackendOrderPayload": "arbitragepy.backends",
+    "BackendPayload": "arbitragepy.backends",
+    "BackendResult": "arbitragepy.backends",
+    "BackendSymbol": "arbitragepy.backends",
+    "get_quantizer": "arbitragepy.quantize",
+    "quantize_down": "arbitragepy.quantize",
+    "quantize_up": "arbitragepy.quantize",
+    "QuoteStalenessIndex": "arbitragepy.staleness",
+    "TimerWheel": "arbitragepy.staleness",
+    "VenueStaleness": "arbitragepy.staleness",
+    "ConversionRates": "arbitragepy.conversion",
+    "CrossArbitrageResult": "arbitragepy.conversion",
+    "cross_arbitrage": "arbitragepy.conversion",
+    "SweepCell": "arbitragepy.sweep",
+    "SweepResult": "arbitragepy.sweep",
+    "Engine": "arbitragepy.verification",
+    "EngineReport": "arbitragepy.verification",
+    "Mismatch": "arbitragepy.verification",
+    "VerificationReport": "arbitragepy.verification",
+    "generate_cases": "arbitragepy.verification",
+    "verify": "arbitragepy.verification",
+    "RecordKind": "arbitragepy.enums",
+    "RecordView": "arbitragepy.wire",
+    "decode_outcome": "arbitragepy.wire",
+    "encode_outcome": "arbitragepy.wire",
+    "pack_outcomes": "arbitragepy.wire",
+    "unpack_outcomes": "arbitragepy.wire",
+    "FeeSchedule": "arbitragepy.fee_schedule",
+    "FeeTier": "arbitragepy.fee_schedule",
+    "Liquidity": "arbitragepy.enums",
+    "DepthIndex": "arbitragepy.depth",
+    "PriceNotAlignedError": "arbitragepy.exceptions",
+    "QuantityGreaterThanMaxQuantityError": "arbitragepy.exceptions",
+}
+"""Submodule of every public name, imported on first access of the name."""
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
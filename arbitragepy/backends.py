@@ -0,0 +1,522 @@
+import operator
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from decimal import ROUND_DOWN, ROUND_FLOOR, ROUND_UP, Decimal
+from functools import cache
+from typing import Any
+
+from arbitragepy.enums import OrderSide
+from arbitragepy.exceptions import (
+    ImcompabileQuantityIncrementsError,
+    NotionalLessThanMinNotionalError,
+    QuantityLessThanMinQuantityError,
+    ZeroQuantityError,
+)
+from arbitragepy.fee import minus_fee
+from arbitragepy.models import ArbitragePayload, ArbitrageResult, OrderPayload
+from arbitragepy.parsing import to_scaled
+from arbitragepy.quantity_increment import (
+    is_compatible_quantity_increments,
+    to_compatible_quantity_increment,
+)
+from arbitragepy.quantize import get_quantizer
+from arbitragepy.spread import get_spread
+
+ArbitrageFunction = Callable[..., Any]
+
+_SCALED_INFINITY = 2**63 - 1
+
+
+@dataclass(frozen=True)
+class NumericBackend:
+    """Numeric primitives used by arbitrage calculations.
+
+    Values are whatever the backend works with: `Decimal`, fixed-point `int`
+    or NumPy array. Addition and subtraction use operators of the values.
+
+    Args:
+        name: backend name.
+        convert: converts `Decimal` to backend value.
+        to_decimal: converts backend value to `Decimal`.
+        multiply: returns `a * b`.
+        divide: returns `a / b`.
+        fee_of: returns `fee` percent of `n`.
+        minus_fee: same as :func:`arbitragepy.minus_fee`.
+        floor_to_increment: same as :func:`arbitragepy.to_compatible_quantity_increment`.
+        quantize: returns `n` rounded to multiple of `step` with `decimal`
+            rounding mode `ROUND_UP`, `ROUND_DOWN` or `ROUND_FLOOR`.
+        is_compatible_increments: same as :func:`arbitragepy.is_compatible_quantity_increments`.
+        spread: same as :func:`arbitragepy.get_spread`.
+        minimum: returns element-wise min of `a` and `b`.
+        is_less: returns True if `a` is less than `b`,
+            for arrays if any element of `a` is less than `b`.
+        lowest: returns the lowest element of array, other values unchanged.
+            Values of rejections are reported with it.
+        decimal_values: True if values are `Decimal`, then functions of
+            :func:`make_arbitrage` return `ArbitrageResult`.
+    """
+
+    name: str
+    convert: Callable[[Decimal], Any]
+    to_decimal: Callable[[Any], Decimal]
+    multiply: Callable[[Any, Any], Any]
+    divide: Callable[[Any, Any], Any]
+    fee_of: Callable[[Any, Any], Any]
+    minus_fee: Callable[[Any, Any], Any]
+    floor_to_increment: Callable[[Any, Any], Any]
+    quantize: Callable[[Any, Any, str], Any]
+    is_compatible_increments: Callable[[Any, Any], bool]
+    spread: Callable[[Any, Any], Any]
+    minimum: Callable[[Any, Any], Any]
+    is_less: Callable[[Any, Any], bool]
+    lowest: Callable[[Any], Any] = lambda n: n
+    decimal_values: bool = False
+
+
+DECIMAL_BACKEND = NumericBackend(
+    name="decimal",
+    convert=lambda n: n,
+    to_decimal=lambda n: n,
+    multiply=operator.mul,
+    divide=operator.truediv,
+    fee_of=lambda n, fee: n * fee / 100,
+    minus_fee=minus_fee,
+    floor_to_increment=to_compatible_quantity_increment,
+    quantize=lambda n, step, rounding: get_quantizer(step, rounding)(n),
+    is_compatible_increments=is_compatible_quantity_increments,
+    spread=get_spread,
+    minimum=min,
+    is_less=operator.lt,
+    decimal_values=True,
+)
+"""Reference backend, :func:`arbitragepy.arbitrage` is implemented with it."""
+
+
+@dataclass(frozen=True)
+class BackendSymbol:
+    """Symbol limits converted to backend values, see :class:`arbitragepy.SymbolInfo`.
+
+    Args:
+        quantity_increment: step size for currency quantity in order.
+        min_quantity: min quantity of currency in order.
+        max_quantity: max quantity of currency in order.
+        min_notional: min value of quantity * price.
+        fee_in_base_currency: True if fee after purchase
+            will be taken in the base currency.
+        taker_fee: fee in percent of orders which take liquidity.
+        price_precision: step of order price. None if prices are not rounded.
+        notional_precision: step of notional value and fee in quote currency.
+            None if notional values are not rounded.
+    """
+
+    quantity_increment: Any
+    min_quantity: Any
+    max_quantity: Any
+    min_notional: Any
+    fee_in_base_currency: bool
+    taker_fee: Any
+    price_precision: Any = None
+    notional_precision: Any = None
+
+
+@dataclass(frozen=True)
+class BackendOrder:
+    """Order price and quantity as backend values."""
+
+    price: Any
+    quantity: Any
+
+
+@dataclass(frozen=True)
+class BackendPayload:
+    """Symbol, order and balance as backend values, see :func:`convert_payload`."""
+
+    symbol: BackendSymbol
+    order: BackendOrder
+    balance: Any = None
+
+
+@dataclass(frozen=True)
+class BackendOrderPayload:
+    """Order of backend result, see :class:`arbitragepy.OrderPayload`."""
+
+    price: Any
+    quantity: Any
+    notional_value: Any
+    taken_fee: Any
+
+
+@dataclass(frozen=True)
+class BackendResult:
+    """Result of arbitrage with backend values, see :func:`result_to_decimal`."""
+
+    ask_order: BackendOrderPayload
+    bid_order: BackendOrderPayload
+    spread: Any
+    profit: Any
+
+
+@cache
+def scaled_backend(scale: int = 8) -> NumericBackend:
+    """Returns backend of fixed-point integers with `scale` fractional digits.
+
+    Results of multiplication and division are rounded down to `scale` digits,
+    so they may differ from :data:`DECIMAL_BACKEND` in the last digit.
+    Infinite values are converted to the max int64 value.
+    """
+
+    unit = 10**scale
+    percent = 100 * unit
+
+    def convert(n: Decimal) -> int:
+        if not n.is_finite():
+            return _SCALED_INFINITY
+        return to_scaled(n, scale)
+
+    def quantize(n: int, step: int, rounding: str) -> int:
+        if rounding == ROUND_FLOOR:
+            return n // step * step
+        if rounding == ROUND_DOWN:
+            magnitude = abs(n) // step * step
+        elif rounding == ROUND_UP:
+            magnitude = -(-abs(n) // step) * step
+        else:
+            raise ValueError(f"{rounding} rounding is not supported.")
+        return magnitude if n >= 0 else -magnitude
+
+    return NumericBackend(
+        name=f"scaled{scale}",
+        convert=convert,
+        to_decimal=lambda n: Decimal(n).scaleb(-scale),
+        multiply=lambda a, b: a * b // unit,
+        divide=lambda a, b: a * unit // b,
+        fee_of=lambda n, fee: n * fee // percent,
+        minus_fee=lambda n, fee: n * percent // (percent + fee),
+        floor_to_increment=lambda n, inc: n // inc * inc,
+        quantize=quantize,
+        is_compatible_increments=lambda a, b: a % b == 0 or b % a == 0,
+        spread=lambda ask, bid: bid * percent // ask - percent,
+        minimum=min,
+        is_less=operator.lt,
+    )
+
+
+@cache
+def numpy_backend() -> NumericBackend:
+    """Returns backend of NumPy float64 arrays.
+
+    Orders and balances of many pairs with the same symbol infos
+    can be evaluated in one call. Floats are approximate, so values
+    are rounded to increments and precisions with 1e-13 relative tolerance
+    of the count of steps, and a batch
+    is rejected as a whole if any of its pairs breaks a limit.
+
+    Raises:
+        ImportError: if NumPy is not installed.
+    """
+
+    import numpy as np
+
+    def count_steps(n: Any, step: Any) -> Any:
+        # Counts within relative tolerance of a whole number are whole.
+        steps = n / step
+        nearest = np.round(steps)
+        return np.where(
+            np.isclose(steps, nearest, rtol=1e-13, atol=1e-9), nearest, steps
+        )
+
+    def floor_to_increment(n: Any, inc: Any) -> Any:
+        return np.floor(count_steps(n, inc)) * inc
+
+    def quantize(n: Any, step: Any, rounding: str) -> Any:
+        steps = count_steps(n, step)
+        if rounding == ROUND_FLOOR:
+            return np.floor(steps) * step
+        if rounding == ROUND_DOWN:
+            return np.trunc(steps) * step
+        if rounding == ROUND_UP:
+            return np.sign(steps) * np.ceil(np.abs(steps)) * step
+        raise ValueError(f"{rounding} rounding is not supported.")
+
+    def divides(a: float, b: float) -> bool:
+        ratio = a / b
+        return bool(np.isclose(ratio, np.round(ratio), rtol=0, atol=1e-9))
+
+    return NumericBackend(
+        name="numpy",
+        convert=float,
+        to_decimal=lambda n: Decimal(repr(float(n))),
+        multiply=np.multiply,
+        divide=np.divide,
+        fee_of=lambda n, fee: n * fee / 100,
+        minus_fee=lambda n, fee: n / (1 + fee / 100),
+        floor_to_increment=floor_to_increment,
+        quantize=quantize,
+        is_compatible_increments=lambda a, b: divides(a, b) or divides(b, a),
+        spread=lambda ask, bid: (bid / ask - 1) * 100,
+        minimum=np.minimum,
+        is_less=lambda a, b: bool(np.any(a < b)),
+        lowest=np.min,
+    )
+
+
+_current_backend: ContextVar[NumericBackend] = ContextVar(
+    "arbitragepy_backend", default=DECIMAL_BACKEND
+)
+
+
+def get_backend() -> NumericBackend:
+    """Returns backend of the current context."""
+
+    return _current_backend.get()
+
+
+@contextmanager
+def use_backend(backend: NumericBackend) -> Iterator[NumericBackend]:
+    """Makes `backend` the backend of the current context inside `with` block."""
+
+    token = _current_backend.set(backend)
+    try:
+        yield backend
+    finally:
+        _current_backend.reset(token)
+
+
+def convert_payload(
+    payload: ArbitragePayload, backend: NumericBackend
+) -> BackendPayload:
+    """Converts `Decimal` fields of `payload` to `backend` values.
+
+    Fee schedule is resolved to the current taker fee.
+    """
+
+    convert = backend.convert
+    symbol = payload.symbol
+    return BackendPayload(
+        symbol=BackendSymbol(
+            quantity_increment=convert(symbol.quantity_increment),
+            min_quantity=convert(symbol.min_quantity),
+            max_quantity=convert(symbol.max_quantity),
+            min_notional=convert(symbol.min_notional),
+            fee_in_base_currency=symbol.fee_in_base_currency,
+            taker_fee=convert(symbol.taker_fee),
+            price_precision=_convert_optional(symbol.price_precision, convert),
+            notional_precision=_convert_optional(symbol.notional_precision, convert),
+        ),
+        order=BackendOrder(
+            price=convert(payload.order.price),
+            quantity=convert(payload.order.quantity),
+        ),
+        balance=_convert_optional(payload.balance, convert),
+    )
+
+
+def result_to_decimal(
+    result: BackendResult | ArbitrageResult, backend: NumericBackend
+) -> ArbitrageResult:
+    """Converts scalar `backend` values of `result` to `Decimal`."""
+
+    to_decimal = backend.to_decimal
+
+    def order(payload: BackendOrderPayload | OrderPayload) -> OrderPayload:
+        return OrderPayload(
+            price=to_decimal(payload.price),
+            quantity=to_decimal(payload.quantity),
+            notional_value=to_decimal(payload.notional_value),
+            taken_fee=to_decimal(payload.taken_fee),
+        )
+
+    return ArbitrageResult(
+        ask_order=order(result.ask_order),
+        bid_order=order(result.bid_order),
+        spread=to_decimal(result.spread),
+        profit=to_decimal(result.profit),
+    )
+
+
+def make_arbitrage(backend: NumericBackend | None = None) -> ArbitrageFunction:
+    """Returns :func:`arbitragepy.arbitrage` implemented with `backend` primitives.
+
+    :func:`arbitragepy.arbitrage` itself is the function of :data:`DECIMAL_BACKEND`,
+    so all backends share one sizing algorithm. Payloads must have `backend` values,
+    see :func:`convert_payload`, and so must `spread_precision`.
+    Functions of backends with `decimal_values`, like :data:`DECIMAL_BACKEND`,
+    take and return `ArbitragePayload` and `ArbitrageResult`,
+    other backends return :class:`BackendResult`. Values of rejections
+    are converted to `Decimal` whatever the backend is.
+    Primitives are bound to the returned function once, so get it at setup time
+    and call it on the hot path without any dispatch. Functions are cached per backend.
+
+    Args:
+        backend: numeric backend. Defaults to backend of the current context.
+    """
+
+    return _make_arbitrage(backend or _current_backend.get())
+
+
+@cache
+def _make_arbitrage(backend: NumericBackend) -> ArbitrageFunction:
+    multiply = backend.multiply
+    divide = backend.divide
+    fee_of = backend.fee_of
+    minus_fee_ = backend.minus_fee
+    floor = backend.floor_to_increment
+    quantize = backend.quantize
+    is_compatible = backend.is_compatible_increments
+    spread_of = backend.spread
+    minimum = backend.minimum
+    is_less = backend.is_less
+    to_decimal = backend.to_decimal
+    lowest = backend.lowest
+    if backend.decimal_values:
+        order_type: Any = OrderPayload
+        result_type: Any = ArbitrageResult
+    else:
+        order_type = BackendOrderPayload
+        result_type = BackendResult
+
+    def arbitrage(
+        ask: Any,
+        bid: Any,
+        make_compatible_quantity_increments: bool = True,
+        spread_precision: Any = None,
+    ) -> Any:
+        ask_symbol = ask.symbol
+        bid_symbol = bid.symbol
+        ask_price = ask.order.price
+        bid_price = bid.order.price
+        if ask_symbol.price_precision is not None:
+            ask_price = quantize(ask_price, ask_symbol.price_precision, ROUND_UP)
+        if bid_symbol.price_precision is not None:
+            bid_price = quantize(bid_price, bid_symbol.price_precision, ROUND_DOWN)
+        ask_fee = ask_symbol.taker_fee
+        bid_fee = bid_symbol.taker_fee
+        ask_qty_inc = ask_symbol.quantity_increment
+        bid_qty_inc = bid_symbol.quantity_increment
+        ask_balance = ask.balance
+        bid_balance = bid.balance
+        ask_fee_in_base_currency = ask_symbol.fee_in_base_currency
+        ask_notional_precision = ask_symbol.notional_precision
+        bid_notional_precision = bid_symbol.notional_precision
+
+        if make_compatible_quantity_increments:
+            if not is_compatible(ask_qty_inc, bid_qty_inc):
+                raise ImcompabileQuantityIncrementsError(
+                    to_decimal(ask_qty_inc), to_decimal(bid_qty_inc)
+                )
+            ask_qty_inc = bid_qty_inc = max(ask_qty_inc, bid_qty_inc)
+
+        # Select lowest order quantity among ask, bid orders and max quantity limit
+        ask_quantity = bid_quantity = minimum(
+            minimum(ask.order.quantity, bid.order.quantity),
+            min(ask_symbol.max_quantity, bid_symbol.max_quantity),
+        )
+        ask_quantity = floor(ask_quantity, ask_qty_inc)
+        bid_quantity = floor(bid_quantity, bid_qty_inc)
+
+        if ask_balance is not None and bid_balance is not None:
+            if not ask_fee_in_base_currency:
+                ask_balance = minus_fee_(ask_balance, ask_fee)
+
+            # Select lowest quantity among max available quantity and order quantity on ask exchange
+            max_ask_quantity = floor(divide(ask_balance, ask_price), ask_qty_inc)
+            ask_quantity = floor(minimum(ask_quantity, max_ask_quantity), ask_qty_inc)
+
+            # Select lowest quantity among max available quantity and order quantity on bid exchange
+            bid_quantity = floor(minimum(bid_quantity, bid_balance), bid_qty_inc)
+
+            ask_quantity = bid_quantity = minimum(ask_quantity, bid_quantity)
+            bid_quantity = floor(bid_quantity, bid_qty_inc)
+            ask_quantity = floor(ask_quantity, ask_qty_inc)
+
+        ask_notional_value = multiply(ask_quantity, ask_price)
+
+        if ask_fee_in_base_currency:
+            ask_taken_fee = fee_of(ask_quantity, ask_fee)
+            bid_quantity = floor(ask_quantity - ask_taken_fee, bid_qty_inc)
+        else:
+            ask_taken_fee = fee_of(ask_notional_value, ask_fee)
+            if ask_notional_precision is not None:
+                ask_taken_fee = quantize(
+                    ask_taken_fee, ask_notional_precision, ROUND_UP
+                )
+            ask_notional_value = ask_notional_value + ask_taken_fee
+
+        if ask_notional_precision is not None:
+            ask_notional_value = quantize(
+                ask_notional_value, ask_notional_precision, ROUND_UP
+            )
+
+        bid_notional_value = multiply(bid_quantity, bid_price)
+        bid_taken_fee = fee_of(bid_notional_value, bid_fee)
+        if bid_notional_precision is not None:
+            bid_taken_fee = quantize(bid_taken_fee, bid_notional_precision, ROUND_UP)
+            bid_notional_value = quantize(
+                bid_notional_value - bid_taken_fee, bid_notional_precision, ROUND_DOWN
+            )
+        else:
+            bid_notional_value = bid_notional_value - bid_taken_fee
+
+        if is_less(bid_quantity, bid_symbol.min_quantity):
+            raise QuantityLessThanMinQuantityError(
+                side=OrderSide.BID,
+                quantity=to_decimal(lowest(bid_quantity)),
+                min_quantity=to_decimal(bid_symbol.min_quantity),
+            )
+        if is_less(bid_notional_value, bid_symbol.min_notional):
+            raise NotionalLessThanMinNotionalError(
+                side=OrderSide.BID,
+                notional=to_decimal(lowest(bid_notional_value)),
+                min_notional=to_decimal(bid_symbol.min_notional),
+            )
+        if is_less(ask_quantity, ask_symbol.min_quantity):
+            raise QuantityLessThanMinQuantityError(
+                side=OrderSide.ASK,
+                quantity=to_decimal(lowest(ask_quantity)),
+                min_quantity=to_decimal(ask_symbol.min_quantity),
+            )
+        if is_less(ask_notional_value, ask_symbol.min_notional):
+            raise NotionalLessThanMinNotionalError(
+                side=OrderSide.ASK,
+                notional=to_decimal(lowest(ask_notional_value)),
+                min_notional=to_decimal(ask_symbol.min_notional),
+            )
+
+        # Quantities are floored to increments, so less than increment means zero.
+        if is_less(ask_quantity, ask_qty_inc):
+            raise ZeroQuantityError(
+                side=OrderSide.ASK, quantity_increment=to_decimal(ask_qty_inc)
+            )
+        if is_less(bid_quantity, bid_qty_inc):
+            raise ZeroQuantityError(
+                side=OrderSide.BID, quantity_increment=to_decimal(bid_qty_inc)
+            )
+
+        spread = spread_of(ask_notional_value, bid_notional_value)
+        if spread_precision is not None:
+            spread = quantize(spread, spread_precision, ROUND_FLOOR)
+
+        return result_type(
+            ask_order=order_type(
+                price=ask_price,
+                quantity=ask_quantity,
+                notional_value=ask_notional_value,
+                taken_fee=ask_taken_fee,
+            ),
+            bid_order=order_type(
+                price=bid_price,
+                quantity=bid_quantity,
+                notional_value=bid_notional_value,
+                taken_fee=bid_taken_fee,
+            ),
+            spread=spread,
+            profit=bid_notional_value - ask_notional_value,
+        )
+
+    return arbitrage
+
+
+def _convert_optional(n: Decimal | None, convert: Callable[[Decimal], Any]) -> Any:
+    return None if n is None else convert(n)
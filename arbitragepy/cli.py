@@ -0,0 +1,431 @@
+import argparse
+import itertools
+import json
+import multiprocessing
+import queue
+import random
+import sys
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, TextIO
+
+from arbitragepy.models import ArbitrageResult, OrderInfo, SymbolInfo
+from arbitragepy.reactor import ArbitrageReactor
+from arbitragepy.registry import SymbolRegistry, symbol_info_from_dict
+
+_BATCH_SIZE = 1000
+_QUEUE_SIZE = 16
+_RESERVOIR_SIZE = 10000
+_POLL_SECONDS = 0.1
+
+Symbols = dict[tuple[str, str], SymbolInfo]
+
+
+class WorkerError(RuntimeError):
+    """Will be raised if a scan worker process exits with an error."""
+
+    def __init__(self, worker: int, exitcode: int) -> None:
+        self.worker = worker
+        self.exitcode = exitcode
+
+    def __str__(self) -> str:
+        return f"scan worker {self.worker} exited with code {self.exitcode}"
+
+
+@dataclass
+class ScanStats:
+    """Counters and latency sample of scan.
+
+    Args:
+        events: count of processed quote snapshots.
+        skipped: count of snapshots of unknown symbols.
+        rejected: count of malformed snapshots, like invalid JSON or numbers.
+        opportunities: count of printed opportunities.
+        latencies: reservoir sample of processing time of one snapshot in seconds.
+        seen_latencies: count of latencies offered to the reservoir.
+    """
+
+    events: int = 0
+    skipped: int = 0
+    rejected: int = 0
+    opportunities: int = 0
+    latencies: list[float] = field(default_factory=list)
+    seen_latencies: int = 0
+
+    def add_latency(self, latency: float, rng: random.Random) -> None:
+        """Adds `latency` to the reservoir keeping memory constant."""
+
+        self.seen_latencies += 1
+        if len(self.latencies) < _RESERVOIR_SIZE:
+            self.latencies.append(latency)
+            return
+        i = rng.randrange(self.seen_latencies)
+        if i < _RESERVOIR_SIZE:
+            self.latencies[i] = latency
+
+    def merge(self, other: "ScanStats", rng: random.Random) -> None:
+        """Adds counters and latencies of `other`.
+
+        Merged reservoir is a uniform sample of latencies seen by both:
+        every drawn latency comes from a reservoir with probability
+        proportional to the count of latencies it has not drawn yet.
+        """
+
+        self.events += other.events
+        self.skipped += other.skipped
+        self.rejected += other.rejected
+        self.opportunities += other.opportunities
+
+        seen = self.seen_latencies
+        other_seen = other.seen_latencies
+        size = min(_RESERVOIR_SIZE, len(self.latencies) + len(other.latencies))
+        taken = 0
+        for _ in range(size):
+            if rng.randrange(seen + other_seen) < seen:
+                taken += 1
+                seen -= 1
+            else:
+                other_seen -= 1
+        self.latencies = rng.sample(self.latencies, taken) + rng.sample(
+            other.latencies, size - taken
+        )
+        self.seen_latencies += other.seen_latencies
+
+
+class Scanner:
+    """Feeds JSONL quote snapshots to :class:`ArbitrageReactor`
+    and formats profitable pairs as JSONL.
+
+    Every snapshot is an object with `venue`, `symbol`, `ask` and `bid` keys,
+    where `ask` and `bid` are `[price, quantity]` strings or null.
+
+    Args:
+        symbols: info of every (venue, symbol).
+        min_profit: min profit of printed opportunity. Defaults to 0.
+    """
+
+    def __init__(self, symbols: Symbols, min_profit: Decimal = Decimal(0)) -> None:
+        self.reactor = ArbitrageReactor()
+        for (venue, symbol), info in symbols.items():
+            self.reactor.add_market(venue, symbol, info)
+        self.min_profit = min_profit
+        self.stats = ScanStats()
+        self._rng = random.Random(0)
+
+    def process(self, line: str) -> list[str]:
+        """Processes one snapshot and returns output lines."""
+
+        start = time.perf_counter()
+        try:
+            snapshot = json.loads(line)
+            venue = snapshot["venue"]
+            symbol = snapshot["symbol"]
+            ask = _order(snapshot.get("ask"))
+            bid = _order(snapshot.get("bid"))
+        except (ValueError, LookupError, TypeError, AttributeError, ArithmeticError):
+            # Malformed snapshots, like truncated lines or prices which are not decimals.
+            self.stats.rejected += 1
+            return []
+
+        try:
+            evaluated = self.reactor.update_quote(venue, symbol, ask, bid)
+        except KeyError:
+            self.stats.skipped += 1
+            return []
+        except (TypeError, ArithmeticError):
+            self.stats.rejected += 1
+            return []
+
+        output = []
+        for ctx in evaluated:
+            result = ctx.result
+            if result is not None and result.profit > self.min_profit:
+                symbol, ask_venue, bid_venue = ctx.pair_id
+                output.append(_format(symbol, ask_venue, bid_venue, result))
+
+        self.stats.events += 1
+        self.stats.opportunities += len(output)
+        self.stats.add_latency(time.perf_counter() - start, self._rng)
+        return output
+
+
+def load_symbols(path: str | Path) -> Symbols:
+    """Loads symbol infos from directory of `{venue}.json` files
+    (see :class:`SymbolRegistry`) or from one JSON file
+    which maps venue to symbol to exchange filters.
+    """
+
+    path = Path(path)
+    if path.is_dir():
+        return {(venue, symbol): info for venue, symbol, info in SymbolRegistry(path)}
+
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    return {
+        (venue, symbol): symbol_info_from_dict(filters)
+        for venue, symbols in data.items()
+        for symbol, filters in symbols.items()
+    }
+
+
+def scan(
+    lines: Iterable[str],
+    symbols: Symbols,
+    output: TextIO,
+    min_profit: Decimal = Decimal(0),
+    workers: int = 1,
+) -> ScanStats:
+    """Streams quote snapshots through the reactor and writes opportunities to `output`.
+
+    With several workers snapshots are partitioned between processes by symbol,
+    so every symbol is evaluated by one process and memory stays constant.
+
+    Args:
+        lines: JSONL quote snapshots.
+        symbols: info of every (venue, symbol).
+        output: stream for JSONL opportunities.
+        min_profit: min profit of printed opportunity. Defaults to 0.
+        workers: count of worker processes. Defaults to 1, which means no processes.
+
+    Returns:
+        Scan statistics.
+
+    Raises:
+        WorkerError: if a worker process exits with an error.
+    """
+
+    if workers <= 1:
+        scanner = Scanner(symbols, min_profit)
+        for line in lines:
+            if line.strip():
+                output.writelines(scanner.process(line))
+        return scanner.stats
+
+    return _scan_parallel(lines, symbols, output, min_profit, workers)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry point of `arbitragepy` command."""
+
+    parser = argparse.ArgumentParser(prog="arbitragepy")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scan_parser = commands.add_parser(
+        "scan", help="print arbitrage opportunities for JSONL quote snapshots"
+    )
+    scan_parser.add_argument(
+        "files", nargs="*", help="JSONL files with quote snapshots, stdin if empty"
+    )
+    scan_parser.add_argument(
+        "--symbols",
+        required=True,
+        help="JSON file or directory of {venue}.json files with symbol filters",
+    )
+    scan_parser.add_argument("--min-profit", type=_decimal, default=Decimal(0))
+    scan_parser.add_argument(
+        "--workers", type=int, default=1, help="count of worker processes"
+    )
+
+    args = parser.parse_args(argv)
+    symbols = load_symbols(args.symbols)
+
+    start = time.perf_counter()
+    try:
+        stats = scan(
+            _read_lines(args.files),
+            symbols,
+            sys.stdout,
+            min_profit=args.min_profit,
+            workers=args.workers,
+        )
+    except WorkerError as e:
+        sys.stdout.flush()
+        print(f"arbitragepy: {e}", file=sys.stderr)
+        return 1
+    sys.stdout.flush()
+    _print_summary(stats, time.perf_counter() - start, sys.stderr)
+    return 0
+
+
+def _read_lines(files: Sequence[str]) -> Iterator[str]:
+    if not files:
+        yield from sys.stdin
+        return
+    for name in files:
+        with open(name, encoding="utf-8") as file:
+            yield from file
+
+
+def _decimal(s: str) -> Decimal:
+    try:
+        value = Decimal(s)
+    except ArithmeticError:
+        value = Decimal("NaN")
+    if not value.is_finite():
+        raise argparse.ArgumentTypeError(f"invalid decimal value: {s!r}")
+    return value
+
+
+def _order(level: Sequence[str] | None) -> OrderInfo | None:
+    if level is None:
+        return None
+    if not isinstance(level, list) or len(level) != 2:
+        raise ValueError(f"{level!r} is not [price, quantity].")
+    return OrderInfo(price=Decimal(level[0]), quantity=Decimal(level[1]))
+
+
+def _format(
+    symbol: str, ask_venue: str, bid_venue: str, result: ArbitrageResult
+) -> str:
+    return (
+        json.dumps(
+            {
+                "symbol": symbol,
+                "ask_venue": ask_venue,
+                "bid_venue": bid_venue,
+                "ask_price": str(result.ask_order.price),
+                "ask_quantity": str(result.ask_order.quantity),
+                "bid_price": str(result.bid_order.price),
+                "bid_quantity": str(result.bid_order.quantity),
+                "spread": str(result.spread),
+                "profit": str(result.profit),
+            }
+        )
+        + "\n"
+    )
+
+
+def _scan_parallel(
+    lines: Iterable[str],
+    symbols: Symbols,
+    output: TextIO,
+    min_profit: Decimal,
+    workers: int,
+    target: Callable[..., None] | None = None,
+) -> ScanStats:
+    ctx = multiprocessing.get_context("spawn")
+    inputs = [ctx.Queue(_QUEUE_SIZE) for _ in range(workers)]
+    results: Any = ctx.Queue()
+    processes = [
+        ctx.Process(
+            target=target or _worker, args=(worker_inputs, results, symbols, min_profit)
+        )
+        for worker_inputs in inputs
+    ]
+    for process in processes:
+        process.start()
+
+    stats = ScanStats()
+    failures: list[WorkerError] = []
+    stopped = threading.Event()
+
+    def check_workers() -> None:
+        for i, process in enumerate(processes):
+            if process.exitcode:
+                failures.append(WorkerError(i, process.exitcode))
+                stopped.set()
+                return
+
+    def collect() -> None:
+        rng = random.Random(0)
+        finished = 0
+        while finished < workers and not stopped.is_set():
+            try:
+                message = results.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                # Dead worker never sends its stats.
+                check_workers()
+                continue
+            if isinstance(message, ScanStats):
+                stats.merge(message, rng)
+                finished += 1
+            else:
+                output.writelines(message)
+
+    def put(i: int, batch: list[str] | None) -> None:
+        while not stopped.is_set():
+            try:
+                inputs[i].put(batch, timeout=_POLL_SECONDS)
+                return
+            except queue.Full:
+                check_workers()
+
+    collector = threading.Thread(target=collect)
+    collector.start()
+
+    try:
+        batches: list[list[str]] = [[] for _ in range(workers)]
+        for line in lines:
+            if stopped.is_set():
+                break
+            if not line.strip():
+                continue
+            i = _worker_of(line, workers)
+            batches[i].append(line)
+            if len(batches[i]) == _BATCH_SIZE:
+                put(i, batches[i])
+                batches[i] = []
+        for i, batch in enumerate(batches):
+            if batch:
+                put(i, batch)
+            put(i, None)
+    except BaseException:
+        stopped.set()
+        raise
+    finally:
+        collector.join()
+        if stopped.is_set():
+            for process in processes:
+                process.terminate()
+            for worker_inputs in inputs:
+                # Do not block exit on pipes of terminated workers.
+                worker_inputs.cancel_join_thread()
+        for process in processes:
+            process.join()
+
+    if failures:
+        raise failures[0]
+    return stats
+
+
+def _worker_of(line: str, workers: int) -> int:
+    try:
+        symbol = json.loads(line)["symbol"]
+        return zlib.crc32(symbol.encode()) % workers
+    except (ValueError, LookupError, TypeError, AttributeError):
+        # Any worker counts a malformed snapshot as rejected.
+        return 0
+
+
+def _worker(inputs: Any, results: Any, symbols: Symbols, min_profit: Decimal) -> None:
+    scanner = Scanner(symbols, min_profit)
+    while (batch := inputs.get()) is not None:
+        output = list(
+            itertools.chain.from_iterable(scanner.process(line) for line in batch)
+        )
+        if output:
+            results.put(output)
+    results.put(scanner.stats)
+
+
+def _print_summary(stats: ScanStats, elapsed: float, output: TextIO) -> None:
+    latencies = sorted(stats.latencies)
+
+    def percentile(p: float) -> float:
+        if not latencies:
+            return 0.0
+        return latencies[min(int(p * len(latencies)), len(latencies) - 1)] * 1e6
+
+    rate = stats.events / elapsed if elapsed else 0.0
+    output.write(
+        f"events: {stats.events}, skipped: {stats.skipped}, "
+        f"opportunities: {stats.opportunities}, rejected: {stats.rejected}\n"
+        f"elapsed: {elapsed:.3f}s, throughput: {rate:.0f} events/s\n"
+        f"latency us: p50 {percentile(0.5):.1f}, p99 {percentile(0.99):.1f}, "
+        f"max {percentile(1):.1f}\n"
+    )
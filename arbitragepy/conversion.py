@@ -0,0 +1,226 @@
+from collections import defaultdict, deque
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from decimal import ROUND_DOWN, ROUND_UP, Decimal
+from itertools import pairwise
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.models import ArbitragePayload, OrderInfo, OrderPayload
+from arbitragepy.quantize import get_quantizer
+from arbitragepy.spread import get_spread
+
+
+class ConversionRates:
+    """Conversion rates between currencies.
+
+    Rates are set per currency pair, the inverse rate is derived automatically.
+    Rates between currencies without a direct rate are derived through
+    the shortest chain of known rates and cached. Every cached rate remembers
+    the direct rates it was built from, so changing a rate recomputes
+    only cross rates which depend on it.
+    """
+
+    def __init__(self) -> None:
+        self._rates: dict[tuple[str, str], Decimal] = {}
+        self._graph: dict[str, set[str]] = defaultdict(set)
+        self._cache: dict[tuple[str, str], Decimal] = {}
+        self._dependents: dict[tuple[str, str], set[tuple[str, str]]] = defaultdict(set)
+        self.version = 0
+
+    def set_rate(self, base: str, quote: str, rate: Decimal) -> None:
+        """Sets price of one `base` currency unit in `quote` currency.
+
+        Raises:
+            ValueError: if rate is not positive.
+        """
+
+        if rate <= 0:
+            raise ValueError(f"{base}/{quote} rate must be positive, got {rate}.")
+
+        is_new = quote not in self._graph[base]
+        self._rates[(base, quote)] = rate
+        self._rates[(quote, base)] = 1 / rate
+        self._graph[base].add(quote)
+        self._graph[quote].add(base)
+
+        if is_new:
+            # New rate may give shorter chains for any pair.
+            self._cache.clear()
+            self._dependents.clear()
+        else:
+            for pair in self._dependents.pop(_edge(base, quote), ()):
+                self._cache.pop(pair, None)
+        self.version += 1
+
+    def rate(self, source: str, target: str) -> Decimal:
+        """Returns price of one `source` currency unit in `target` currency.
+
+        Raises:
+            KeyError: if currencies are not connected by known rates.
+        """
+
+        if source == target:
+            return Decimal(1)
+
+        rate = self._cache.get((source, target))
+        if rate is not None:
+            return rate
+
+        path = self._find_path(source, target)
+        rate = Decimal(1)
+        for edge in pairwise(path):
+            rate *= self._rates[edge]
+            self._dependents[_edge(*edge)].add((source, target))
+        self._cache[(source, target)] = rate
+        return rate
+
+    def convert(self, amount: Decimal, source: str, target: str) -> Decimal:
+        """Converts `amount` of `source` currency to `target` currency."""
+
+        return amount * self.rate(source, target)
+
+    def matrix(self, currencies: Sequence[str]) -> list[list[Decimal | None]]:
+        """Returns rates between all `currencies`, None where they are not connected.
+
+        `matrix[i][j]` is price of `currencies[i]` in `currencies[j]`.
+        """
+
+        rows = []
+        for source in currencies:
+            row: list[Decimal | None] = []
+            for target in currencies:
+                try:
+                    row.append(self.rate(source, target))
+                except KeyError:
+                    row.append(None)
+            rows.append(row)
+        return rows
+
+    def _find_path(self, source: str, target: str) -> list[str]:
+        previous: dict[str, str | None] = {source: None}
+        queue = deque([source])
+        while queue:
+            currency = queue.popleft()
+            if currency == target:
+                path = [target]
+                while (step := previous[path[-1]]) is not None:
+                    path.append(step)
+                return path[::-1]
+            for neighbour in self._graph.get(currency, ()):
+                if neighbour not in previous:
+                    previous[neighbour] = currency
+                    queue.append(neighbour)
+        raise KeyError(f"no conversion rate from {source} to {target}.")
+
+
+@dataclass(frozen=True)
+class CrossArbitrageResult:
+    """Result of arbitrage between symbols with different quote currencies.
+
+    Args:
+        ask_order: order on ask exchange in ask quote currency.
+        bid_order: order on bid exchange in bid quote currency.
+        spread: spread in percent between ask and converted bid notional values.
+        profit: profit in settlement currency.
+        settlement_currency: currency of profit.
+        rate: price of one bid quote currency unit in ask quote currency.
+    """
+
+    ask_order: OrderPayload
+    bid_order: OrderPayload
+    spread: Decimal
+    profit: Decimal
+    settlement_currency: str
+    rate: Decimal
+
+
+def cross_arbitrage(
+    ask: ArbitragePayload,
+    bid: ArbitragePayload,
+    ask_quote_currency: str,
+    bid_quote_currency: str,
+    rates: ConversionRates,
+    settlement_currency: str | None = None,
+    make_compatible_quantity_increments: bool = True,
+) -> CrossArbitrageResult:
+    """Do arbitrage calculations between legs quoted in different currencies.
+
+    Bid price and min notional are converted to ask quote currency
+    and sized by :func:`arbitragepy.arbitrage`, then bid order is calculated
+    back in its own currency, so both orders are ready to be placed.
+
+    Args:
+        ask: info about symbol, order and quote currency balance on ask exchange.
+        bid: info about symbol, order and base currency balance on bid exchange.
+        ask_quote_currency: quote currency of ask symbol.
+        bid_quote_currency: quote currency of bid symbol.
+        rates: conversion rates.
+        settlement_currency: currency of profit. Defaults to `ask_quote_currency`.
+        make_compatible_quantity_increments: same as in :func:`arbitragepy.arbitrage`.
+            Defaults to True.
+
+    Returns:
+        Result of arbitrage.
+
+    Raises:
+        KeyError: if currencies are not connected by known rates.
+    """
+
+    if settlement_currency is None:
+        settlement_currency = ask_quote_currency
+    rate = rates.rate(bid_quote_currency, ask_quote_currency)
+
+    bid_symbol = bid.symbol
+    bid_price = bid.order.price
+    if bid_symbol.price_precision is not None:
+        bid_price = get_quantizer(bid_symbol.price_precision, ROUND_DOWN)(bid_price)
+    converted_bid = ArbitragePayload(
+        symbol=replace(
+            bid_symbol,
+            min_notional=bid_symbol.min_notional * rate,
+            price_precision=None,
+            notional_precision=None,
+        ),
+        order=OrderInfo(price=bid_price * rate, quantity=bid.order.quantity),
+        balance=bid.balance,
+    )
+    result = arbitrage(
+        ask=ask,
+        bid=converted_bid,
+        make_compatible_quantity_increments=make_compatible_quantity_increments,
+    )
+
+    bid_quantity = result.bid_order.quantity
+    bid_notional_value = bid_quantity * bid_price
+    bid_taken_fee = bid_notional_value * bid_symbol.taker_fee / 100
+    if bid_symbol.notional_precision is not None:
+        bid_taken_fee = get_quantizer(bid_symbol.notional_precision, ROUND_UP)(
+            bid_taken_fee
+        )
+        bid_notional_value = get_quantizer(bid_symbol.notional_precision, ROUND_DOWN)(
+            bid_notional_value - bid_taken_fee
+        )
+    else:
+        bid_notional_value -= bid_taken_fee
+
+    ask_notional_value = result.ask_order.notional_value
+    converted_bid_notional_value = bid_notional_value * rate
+    profit = converted_bid_notional_value - ask_notional_value
+
+    return CrossArbitrageResult(
+        ask_order=result.ask_order,
+        bid_order=OrderPayload(
+            price=bid_price,
+            quantity=bid_quantity,
+            notional_value=bid_notional_value,
+            taken_fee=bid_taken_fee,
+        ),
+        spread=get_spread(ask_notional_value, converted_bid_notional_value),
+        profit=rates.convert(profit, ask_quote_currency, settlement_currency),
+        settlement_currency=settlement_currency,
+        rate=rate,
+    )
+
+
+def _edge(a: str, b: str) -> tuple[str, str]:
+    return (a, b) if a < b else (b, a)
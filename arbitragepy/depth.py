@@ -0,0 +1,354 @@
+from collections.abc import Iterable
+from decimal import Decimal
+
+from arbitragepy.enums import OrderSide
+from arbitragepy.models import OrderInfo
+from arbitragepy.quantity_increment import to_compatible_quantity_increment
+
+_ZERO = Decimal(0)
+
+
+class DepthIndex:
+    """Cumulative depth of one order book side on a grid of price ticks.
+
+    Quantities and notional values of levels are kept in Fenwick trees
+    ordered from the best price, so changing a level, the cost of taking
+    a quantity and the quantity which a budget buys take O(log n)
+    for `n` ticks of the grid instead of walking the levels.
+
+    Memory is O(n) too. The grid grows or shifts when a level
+    is out of it, `max_ticks` limits its size: ticks nearest
+    to the best price are kept and farther levels are dropped.
+
+    Args:
+        side: `ASK` if levels are taken from the lowest price,
+            `BID` if from the highest price.
+        tick_size: price step of levels.
+        min_price: lowest price of the initial grid.
+        max_price: highest price of the initial grid.
+        max_ticks: max count of ticks of the grid. Defaults to None, which means no limit.
+
+    Raises:
+        ValueError: if grid bounds are not on the tick grid or are reversed,
+            or if the initial grid has more than `max_ticks` ticks.
+    """
+
+    def __init__(
+        self,
+        side: OrderSide,
+        tick_size: Decimal,
+        min_price: Decimal,
+        max_price: Decimal,
+        max_ticks: int | None = None,
+    ) -> None:
+        if max_price < min_price or (max_price - min_price) % tick_size:
+            raise ValueError(
+                f"price range {min_price}..{max_price} does not fit {tick_size} ticks."
+            )
+        size = int((max_price - min_price) / tick_size) + 1
+        if max_ticks is not None and size > max_ticks:
+            raise ValueError(
+                f"price range {min_price}..{max_price} has more than {max_ticks} ticks."
+            )
+
+        self.side = side
+        self.tick_size = tick_size
+        self.max_ticks = max_ticks
+        # Price of index 0 and price change of the next index,
+        # so index 0 is the best end of the grid.
+        if side is OrderSide.ASK:
+            self._origin = min_price
+            self._step = tick_size
+        else:
+            self._origin = max_price
+            self._step = -tick_size
+        self._resize(size, [_ZERO] * size)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def min_price(self) -> Decimal:
+        """Lowest price of the grid."""
+
+        return min(self._origin, self._price(self._size - 1))
+
+    @property
+    def max_price(self) -> Decimal:
+        """Highest price of the grid."""
+
+        return max(self._origin, self._price(self._size - 1))
+
+    @property
+    def total_quantity(self) -> Decimal:
+        """Quantity of all levels."""
+
+        return self._prefix(self._quantities, self._size)
+
+    @property
+    def total_notional(self) -> Decimal:
+        """Notional value of all levels."""
+
+        return self._prefix(self._notionals, self._size)
+
+    @property
+    def best_price(self) -> Decimal | None:
+        """Price of the best level or None if there are no levels."""
+
+        index, _, _ = self._search(self._quantities, self._notionals, _ZERO)
+        if index == self._size:
+            return None
+        return self._price(index)
+
+    def set_level(self, price: Decimal, quantity: Decimal) -> bool:
+        """Sets quantity of level at `price`, zero quantity removes level.
+
+        A level out of the grid grows or shifts the grid,
+        which takes O(n) but happens O(log n) times while the grid doubles.
+
+        Returns:
+            False if the level is dropped because it is farther
+            than `max_ticks` from the best end of the grid, True otherwise.
+
+        Raises:
+            ValueError: if price is not on the tick grid.
+        """
+
+        index = self._offset(price)
+        if not 0 <= index < self._size:
+            if not quantity:
+                return True
+            index = self._fit(index)
+            if index is None:
+                return False
+
+        delta = quantity - self._levels[index]
+        if not delta:
+            return True
+        self._levels[index] = quantity
+        notional_delta = delta * price
+
+        quantities = self._quantities
+        notionals = self._notionals
+        size = self._size
+        i = index + 1
+        while i <= size:
+            quantities[i] += delta
+            notionals[i] += notional_delta
+            i += i & -i
+        return True
+
+    def set_levels(self, levels: Iterable[OrderInfo]) -> None:
+        """Replaces all levels in O(n).
+
+        The grid is recentered to start at the best of `levels`,
+        keeping its size unless `levels` need more ticks.
+        Levels farther than `max_ticks` from the best are dropped.
+
+        Raises:
+            ValueError: if a price is not on the tick grid.
+        """
+
+        offsets = [
+            (self._offset(level.price), level.quantity)
+            for level in levels
+            if level.quantity
+        ]
+        start = min((index for index, _ in offsets), default=0)
+        end = max((index + 1 for index, _ in offsets), default=0)
+        size = max(end - start, self._size)
+        if self.max_ticks is not None:
+            size = min(size, self.max_ticks)
+
+        self._origin = self._price(start)
+        grid = [_ZERO] * size
+        for index, quantity in offsets:
+            if index - start < size:
+                grid[index - start] += quantity
+        self._resize(size, grid)
+
+    def quantity(self, price: Decimal) -> Decimal:
+        """Returns quantity of level at `price`, zero if it is out of the grid.
+
+        Raises:
+            ValueError: if price is not on the tick grid.
+        """
+
+        index = self._offset(price)
+        if not 0 <= index < self._size:
+            return _ZERO
+        return self._levels[index]
+
+    def levels(self) -> list[OrderInfo]:
+        """Returns levels from the best price."""
+
+        return [
+            OrderInfo(price=self._price(i), quantity=quantity)
+            for i, quantity in enumerate(self._levels)
+            if quantity
+        ]
+
+    def cost(self, quantity: Decimal) -> Decimal | None:
+        """Returns notional value of taking `quantity` from the best price.
+
+        Returns:
+            Notional value or None if depth is less than `quantity`.
+        """
+
+        index, filled, notional = self._search(
+            self._quantities, self._notionals, quantity
+        )
+        remaining = quantity - filled
+        if not remaining:
+            return notional
+        if index == self._size:
+            return None
+        return notional + remaining * self._price(index)
+
+    def vwap(self, quantity: Decimal) -> Decimal | None:
+        """Returns volume weighted average price of taking `quantity`.
+
+        Returns:
+            Price or None if depth is less than `quantity` or it is zero.
+        """
+
+        if not quantity:
+            return None
+        cost = self.cost(quantity)
+        return None if cost is None else cost / quantity
+
+    def max_quantity(self, notional: Decimal, quantity_increment: Decimal) -> Decimal:
+        """Returns max quantity which can be taken for `notional` value.
+
+        Args:
+            notional: budget in quote currency.
+            quantity_increment: step of returned quantity.
+
+        Returns:
+            Quantity rounded down to `quantity_increment`,
+            not more than the total quantity.
+        """
+
+        index, spent, filled = self._search(self._notionals, self._quantities, notional)
+        if index < self._size:
+            filled += (notional - spent) / self._price(index)
+        return to_compatible_quantity_increment(filled, quantity_increment)
+
+    def order(self, quantity: Decimal, quantity_increment: Decimal) -> OrderInfo | None:
+        """Returns order which takes up to `quantity` at its average price.
+
+        The order can be used as order info of :func:`arbitragepy.arbitrage`
+        to size arbitrage against several levels.
+
+        Args:
+            quantity: wanted quantity.
+            quantity_increment: step of order quantity.
+
+        Returns:
+            Order with quantity rounded down to `quantity_increment`
+            and limited by depth, and with volume weighted average price.
+            None if the quantity is zero.
+        """
+
+        quantity = to_compatible_quantity_increment(
+            min(quantity, self.total_quantity), quantity_increment
+        )
+        price = self.vwap(quantity)
+        if price is None:
+            return None
+        return OrderInfo(price=price, quantity=quantity)
+
+    def _offset(self, price: Decimal) -> int:
+        """Returns index of `price`, which can be out of the grid."""
+
+        offset = (price - self._origin) / self._step
+        index = int(offset)
+        if index != offset:
+            raise ValueError(f"price {price} is not on the tick grid.")
+        return index
+
+    def _price(self, index: int) -> Decimal:
+        return self._origin + index * self._step
+
+    def _fit(self, index: int) -> int | None:
+        """Grows or shifts the grid to hold `index` out of it.
+
+        Returns:
+            New index of the level or None if it is dropped.
+        """
+
+        size = self._size
+        max_ticks = self.max_ticks
+        if index < 0:
+            # A better price, farthest ticks are dropped if the grid is full.
+            start = min(index, -size)
+            if max_ticks is not None:
+                start = min(index, max(start, size - max_ticks))
+            end = size if max_ticks is None else min(size, start + max_ticks)
+        else:
+            start = 0
+            end = max(index + 1, 2 * size)
+            if max_ticks is not None:
+                end = min(end, max_ticks)
+                if index >= end:
+                    return None
+
+        levels = [_ZERO] * (end - start)
+        for i in range(max(start, 0), min(end, size)):
+            levels[i - start] = self._levels[i]
+        self._origin = self._price(start)
+        self._resize(end - start, levels)
+        return index - start
+
+    def _resize(self, size: int, levels: list[Decimal]) -> None:
+        """Replaces levels of the grid and builds trees in O(n)."""
+
+        # One-based trees, node i sums levels (i - lowbit(i), i].
+        quantities = [_ZERO] * (size + 1)
+        notionals = [_ZERO] * (size + 1)
+        for i, quantity in enumerate(levels):
+            if quantity:
+                quantities[i + 1] = quantity
+                notionals[i + 1] = quantity * self._price(i)
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                quantities[parent] += quantities[i]
+                notionals[parent] += notionals[i]
+
+        self._size = size
+        self._levels = levels
+        self._quantities = quantities
+        self._notionals = notionals
+        self._top_bit = 1 << (size.bit_length() - 1)
+
+    def _prefix(self, tree: list[Decimal], count: int) -> Decimal:
+        total = _ZERO
+        while count:
+            total += tree[count]
+            count -= count & -count
+        return total
+
+    def _search(
+        self, tree: list[Decimal], other: list[Decimal], target: Decimal
+    ) -> tuple[int, Decimal, Decimal]:
+        """Finds the longest prefix of levels whose `tree` sum is not greater than `target`.
+
+        Returns:
+            Count of levels in prefix, their `tree` sum and `other` sum.
+            The count is also the index of the first level out of prefix.
+        """
+
+        index = 0
+        total = _ZERO
+        other_total = _ZERO
+        size = self._size
+        step = self._top_bit
+        while step:
+            next_index = index + step
+            if next_index <= size and total + tree[next_index] <= target:
+                index = next_index
+                total += tree[next_index]
+                other_total += other[next_index]
+            step >>= 1
+        return index, total, other_total
@@ -6,3 +6,44 @@ class OrderSide(str, enum.Enum):
 
     ASK = "ASK"
     BID = "BID"
+
+
+class RankBy(str, enum.Enum):
+    """Value by which arbitrage results are ranked."""
+
+    PROFIT = "PROFIT"
+    SPREAD = "SPREAD"
+
+
+class FsyncPolicy(str, enum.Enum):
+    """When written data is forced to disk."""
+
+    NEVER = "NEVER"
+    ON_CLOSE = "ON_CLOSE"
+    ON_FLUSH = "ON_FLUSH"
+
+
+class OrderStatus(str, enum.Enum):
+    """Final status of immediate-or-cancel order."""
+
+    FILLED = "FILLED"
+    PARTIALLY_FILLED = "PARTIALLY_FILLED"
+    EXPIRED = "EXPIRED"
+    REJECTED = "REJECTED"
+
+
+class RecordKind(int, enum.Enum):
+    """Kind of wire-encoded arbitrage outcome."""
+
+    RESULT = 1
+    INCOMPATIBLE_QUANTITY_INCREMENTS = 2
+    QUANTITY_LESS_THAN_MIN_QUANTITY = 3
+    NOTIONAL_LESS_THAN_MIN_NOTIONAL = 4
+    ZERO_QUANTITY = 5
+
+
+class Liquidity(str, enum.Enum):
+    """Whether order adds liquidity to order book or takes it."""
+
+    MAKER = "MAKER"
+    TAKER = "TAKER"
@@ -3,7 +3,11 @@ from decimal import Decimal
 from arbitragepy.enums import OrderSide
 
 
-class ImcompabileQuantityIncrementsError(Exception):
+class ArbitrageError(Exception):
+    """Base class for errors which mean that arbitrage is not possible."""
+
+
+class ImcompabileQuantityIncrementsError(ArbitrageError):
     """Will be raised if quantity increments is not divided."""
 
     def __init__(self, ask_qty_inc: Decimal, bid_qty_inc: Decimal) -> None:
@@ -14,7 +18,7 @@ class ImcompabileQuantityIncrementsError(Exception):
         return f"{self.ask_qty_inc} quantity increment is not divided on {self.bid_qty_inc} quantity increment."
 
 
-class QuantityLessThanMinQuantityError(Exception):
+class QuantityLessThanMinQuantityError(ArbitrageError):
     """Will be raised if the symbol base currency quantity in order
     less than allowed the symbol base currency min quantity.
     """
@@ -30,7 +34,36 @@ class QuantityLessThanMinQuantityError(Exception):
         return f"on {self.side.lower()} exchange quantity less than allowed symbol min quantity: {self.quantity} < {self.min_quantity}"
 
 
-class NotionalLessThanMinNotionalError(Exception):
+class ZeroQuantityError(ArbitrageError):
+    """Will be raised if orders, balances and max quantities
+    leave zero quantity of the symbol base currency to trade.
+    """
+
+    def __init__(self, side: OrderSide, quantity_increment: Decimal) -> None:
+        self.side = side
+        self.quantity_increment = quantity_increment
+
+    def __str__(self) -> str:
+        return f"on {self.side.lower()} exchange quantity rounds down to zero with {self.quantity_increment} quantity increment"
+
+
+class QuantityGreaterThanMaxQuantityError(ArbitrageError):
+    """Will be raised if the symbol base currency quantity in order
+    greater than allowed the symbol base currency max quantity.
+    """
+
+    def __init__(
+        self, side: OrderSide, quantity: Decimal, max_quantity: Decimal
+    ) -> None:
+        self.side = side
+        self.quantity = quantity
+        self.max_quantity = max_quantity
+
+    def __str__(self) -> str:
+        return f"on {self.side.lower()} exchange quantity greater than allowed symbol max quantity: {self.quantity} > {self.max_quantity}"
+
+
+class NotionalLessThanMinNotionalError(ArbitrageError):
     """Will be raised if the notional value in order
     less than allowed the symbol min notional value.
     """
@@ -44,3 +77,40 @@ class NotionalLessThanMinNotionalError(Exception):
 
     def __str__(self) -> str:
         return f"on {self.side.lower()} exchange notional less than allowed symbol min notional: {self.notional} < {self.min_notional}"
+
+
+class QuantityNotAlignedError(ValueError):
+    """Will be raised if quantity is not divided on quantity increment."""
+
+    def __init__(self, quantity: Decimal, quantity_increment: Decimal) -> None:
+        self.quantity = quantity
+        self.quantity_increment = quantity_increment
+
+    def __str__(self) -> str:
+        return f"{self.quantity} quantity is not divided on {self.quantity_increment} quantity increment."
+
+
+class PriceNotAlignedError(ValueError):
+    """Will be raised if price is not divided on price precision."""
+
+    def __init__(self, price: Decimal, price_precision: Decimal) -> None:
+        self.price = price
+        self.price_precision = price_precision
+
+    def __str__(self) -> str:
+        return f"{self.price} price is not divided on {self.price_precision} price precision."
+
+
+class InsufficientBalanceError(ArbitrageError):
+    """Will be raised if available balance is less than amount to reserve."""
+
+    def __init__(
+        self, venue: str, currency: str, amount: Decimal, available: Decimal
+    ) -> None:
+        self.venue = venue
+        self.currency = currency
+        self.amount = amount
+        self.available = available
+
+    def __str__(self) -> str:
+        return f"on {self.venue} exchange available {self.currency} balance less than amount to reserve: {self.available} < {self.amount}"
@@ -0,0 +1,281 @@
+import asyncio
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+
+from arbitragepy.enums import OrderSide, OrderStatus
+from arbitragepy.exceptions import (
+    InsufficientBalanceError,
+    NotionalLessThanMinNotionalError,
+    PriceNotAlignedError,
+    QuantityGreaterThanMaxQuantityError,
+    QuantityLessThanMinQuantityError,
+    QuantityNotAlignedError,
+)
+from arbitragepy.models import ArbitrageResult, OrderInfo, OrderPayload, SymbolInfo
+
+
+@dataclass(frozen=True)
+class ExecutionReport:
+    """Result of order placed on :class:`SimulatedExchange`.
+
+    Args:
+        status: order status.
+        side: ASK for buy order, BID for sell order.
+        quantity: filled base currency quantity.
+        notional_value: quote currency spent on buy order including fee
+            in quote currency, or received for sell order excluding fee.
+        taken_fee: fee in base currency if buy order fee is taken in base currency,
+            otherwise in quote currency.
+        error: reason of rejection. None if order was not rejected.
+    """
+
+    status: OrderStatus
+    side: OrderSide
+    quantity: Decimal
+    notional_value: Decimal
+    taken_fee: Decimal
+    error: Exception | None = None
+
+
+@dataclass
+class _Market:
+    info: SymbolInfo
+    base_currency: str
+    quote_currency: str
+    # Levels are stored worst first, so the best level is popped from the end.
+    asks: list[list[Decimal]]
+    bids: list[list[Decimal]]
+
+
+class SimulatedExchange:
+    """In-process exchange which fills immediate-or-cancel orders against own order books.
+
+    Buy orders (ASK side, as in :attr:`ArbitrageResult.ask_order`) take ask levels
+    with price not greater than order price, sell orders (BID side) take bid levels
+    with price not less than order price. Filled liquidity is removed from the book
+    until :meth:`set_book` is called again.
+
+    Orders are checked against :class:`SymbolInfo` rules and balances
+    the same way as :func:`arbitragepy.arbitrage` sizes them,
+    fees are charged as described in :class:`ExecutionReport`.
+
+    Args:
+        venue: exchange name used in errors.
+        latency: returns delay in seconds before async order reaches the book.
+            Defaults to no delay.
+    """
+
+    def __init__(self, venue: str, latency: Callable[[], float] | None = None) -> None:
+        self.venue = venue
+        self._latency = latency
+        self._markets: dict[str, _Market] = {}
+        self._balances: dict[str, Decimal] = {}
+
+    def add_symbol(
+        self, symbol: str, info: SymbolInfo, base_currency: str, quote_currency: str
+    ) -> None:
+        """Lists `symbol` with empty order book."""
+
+        self._markets[symbol] = _Market(
+            info=info,
+            base_currency=base_currency,
+            quote_currency=quote_currency,
+            asks=[],
+            bids=[],
+        )
+
+    def set_book(
+        self, symbol: str, asks: Sequence[OrderInfo], bids: Sequence[OrderInfo]
+    ) -> None:
+        """Replaces order book of `symbol`.
+
+        Args:
+            symbol: symbol name.
+            asks: ask levels, best first.
+            bids: bid levels, best first.
+        """
+
+        market = self._markets[symbol]
+        market.asks = [[level.price, level.quantity] for level in reversed(asks)]
+        market.bids = [[level.price, level.quantity] for level in reversed(bids)]
+
+    def book(self, symbol: str) -> tuple[list[OrderInfo], list[OrderInfo]]:
+        """Returns remaining ask and bid levels of `symbol`, best first."""
+
+        market = self._markets[symbol]
+        return (
+            [OrderInfo(price=p, quantity=q) for p, q in reversed(market.asks)],
+            [OrderInfo(price=p, quantity=q) for p, q in reversed(market.bids)],
+        )
+
+    def deposit(self, currency: str, amount: Decimal) -> None:
+        """Adds `amount` to `currency` balance."""
+
+        self._balances[currency] = self._balances.get(currency, Decimal(0)) + amount
+
+    def balance(self, currency: str) -> Decimal:
+        """Returns `currency` balance."""
+
+        return self._balances.get(currency, Decimal(0))
+
+    def place_order(
+        self, symbol: str, side: OrderSide, order: OrderPayload
+    ) -> ExecutionReport:
+        """Fills `order` immediately as far as the book allows and cancels the rest.
+
+        Args:
+            symbol: symbol name.
+            side: ASK to buy, BID to sell.
+            order: order price and quantity, other fields are ignored.
+
+        Returns:
+            Execution report. Rejected orders change nothing.
+
+        Raises:
+            KeyError: if symbol is not listed.
+        """
+
+        market = self._markets[symbol]
+        info = market.info
+        price = order.price
+        quantity = order.quantity
+
+        error = self._check(market, side, price, quantity)
+        if error is not None:
+            return ExecutionReport(
+                status=OrderStatus.REJECTED,
+                side=side,
+                quantity=Decimal(0),
+                notional_value=Decimal(0),
+                taken_fee=Decimal(0),
+                error=error,
+            )
+
+        if side is OrderSide.ASK:
+            filled, notional = _take(market.asks, quantity, lambda p: p <= price)
+            if info.fee_in_base_currency:
+                taken_fee = filled * info.taker_fee / 100
+                received = filled - taken_fee
+            else:
+                taken_fee = notional * info.taker_fee / 100
+                notional += taken_fee
+                received = filled
+            self._add(market.quote_currency, -notional)
+            self._add(market.base_currency, received)
+        else:
+            filled, notional = _take(market.bids, quantity, lambda p: p >= price)
+            taken_fee = notional * info.taker_fee / 100
+            notional -= taken_fee
+            self._add(market.base_currency, -filled)
+            self._add(market.quote_currency, notional)
+
+        if filled == quantity:
+            status = OrderStatus.FILLED
+        elif filled:
+            status = OrderStatus.PARTIALLY_FILLED
+        else:
+            status = OrderStatus.EXPIRED
+        return ExecutionReport(
+            status=status,
+            side=side,
+            quantity=filled,
+            notional_value=notional,
+            taken_fee=taken_fee,
+        )
+
+    async def place_order_async(
+        self, symbol: str, side: OrderSide, order: OrderPayload
+    ) -> ExecutionReport:
+        """Same as :meth:`place_order` but waits for injected latency first."""
+
+        if self._latency is not None:
+            await asyncio.sleep(self._latency())
+        return self.place_order(symbol, side, order)
+
+    def _check(
+        self, market: _Market, side: OrderSide, price: Decimal, quantity: Decimal
+    ) -> Exception | None:
+        info = market.info
+        if info.price_precision is not None and price % info.price_precision:
+            return PriceNotAlignedError(price, info.price_precision)
+        if quantity % info.quantity_increment:
+            return QuantityNotAlignedError(quantity, info.quantity_increment)
+        if quantity < info.min_quantity:
+            return QuantityLessThanMinQuantityError(
+                side=side, quantity=quantity, min_quantity=info.min_quantity
+            )
+        if quantity > info.max_quantity:
+            return QuantityGreaterThanMaxQuantityError(
+                side=side, quantity=quantity, max_quantity=info.max_quantity
+            )
+        notional = quantity * price
+        if notional < info.min_notional:
+            return NotionalLessThanMinNotionalError(
+                side=side, notional=notional, min_notional=info.min_notional
+            )
+
+        if side is OrderSide.ASK:
+            currency = market.quote_currency
+            amount = notional
+            if not info.fee_in_base_currency:
+                amount += notional * info.taker_fee / 100
+        else:
+            currency = market.base_currency
+            amount = quantity
+        available = self.balance(currency)
+        if available < amount:
+            return InsufficientBalanceError(self.venue, currency, amount, available)
+        return None
+
+    def _add(self, currency: str, amount: Decimal) -> None:
+        self._balances[currency] = self._balances.get(currency, Decimal(0)) + amount
+
+
+async def execute(
+    ask_exchange: SimulatedExchange,
+    bid_exchange: SimulatedExchange,
+    symbol: str,
+    result: ArbitrageResult,
+) -> tuple[ExecutionReport, ExecutionReport]:
+    """Places both orders of `result` concurrently.
+
+    Args:
+        ask_exchange: exchange where base currency is bought.
+        bid_exchange: exchange where base currency is sold.
+        symbol: symbol name on both exchanges.
+        result: arbitrage result.
+
+    Returns:
+        Ask and bid execution reports.
+    """
+
+    ask_report, bid_report = await asyncio.gather(
+        ask_exchange.place_order_async(symbol, OrderSide.ASK, result.ask_order),
+        bid_exchange.place_order_async(symbol, OrderSide.BID, result.bid_order),
+    )
+    return ask_report, bid_report
+
+
+def _take(
+    levels: list[list[Decimal]],
+    quantity: Decimal,
+    is_marketable: Callable[[Decimal], bool],
+) -> tuple[Decimal, Decimal]:
+    """Removes up to `quantity` from the best `levels` and returns filled quantity and notional."""
+
+    filled = Decimal(0)
+    notional = Decimal(0)
+    while levels and filled < quantity:
+        level = levels[-1]
+        level_price, level_quantity = level
+        if not is_marketable(level_price):
+            break
+        taken = min(level_quantity, quantity - filled)
+        filled += taken
+        notional += taken * level_price
+        if taken == level_quantity:
+            levels.pop()
+        else:
+            level[1] = level_quantity - taken
+    return filled, notional
@@ -0,0 +1,265 @@
+from collections.abc import Hashable
+from dataclasses import dataclass
+from decimal import Decimal
+
+from arbitragepy.enums import OrderSide
+from arbitragepy.exceptions import (
+    ArbitrageError,
+    ImcompabileQuantityIncrementsError,
+    NotionalLessThanMinNotionalError,
+    QuantityLessThanMinQuantityError,
+)
+from arbitragepy.fee import minus_fee
+from arbitragepy.models import ArbitragePayload, SymbolInfo
+from arbitragepy.quantity_increment import (
+    is_compatible_quantity_increments,
+    to_compatible_quantity_increment,
+)
+
+
+@dataclass(frozen=True)
+class Infeasibility:
+    """Reason why arbitrage is impossible for any order quantities.
+
+    Args:
+        reason: error which :func:`arbitragepy.arbitrage` would raise.
+        min_ask_price: verdict holds while ask price is not less than it.
+            None if verdict does not depend on ask price.
+        max_bid_price: verdict holds while bid price is not greater than it.
+            None if verdict does not depend on bid price.
+    """
+
+    reason: ArbitrageError
+    min_ask_price: Decimal | None = None
+    max_bid_price: Decimal | None = None
+
+
+def find_infeasibility(
+    ask: ArbitragePayload,
+    bid: ArbitragePayload,
+    make_compatible_quantity_increments: bool = True,
+) -> Infeasibility | None:
+    """Checks symbol limits and balances which make arbitrage impossible
+    whatever quantities are in orders.
+
+    Args:
+        ask: info about symbol, order and quote currency balance on ask exchange.
+        bid: info about symbol, order and base currency balance on bid exchange.
+        make_compatible_quantity_increments: same as in :func:`arbitragepy.arbitrage`.
+            Defaults to True.
+
+    Returns:
+        Infeasibility or None if arbitrage may be possible.
+    """
+
+    ask_symbol = ask.symbol
+    bid_symbol = bid.symbol
+    ask_qty_inc = ask_symbol.quantity_increment
+    bid_qty_inc = bid_symbol.quantity_increment
+
+    if make_compatible_quantity_increments:
+        if not is_compatible_quantity_increments(ask_qty_inc, bid_qty_inc):
+            return Infeasibility(
+                ImcompabileQuantityIncrementsError(ask_qty_inc, bid_qty_inc)
+            )
+        ask_qty_inc = bid_qty_inc = max(ask_qty_inc, bid_qty_inc)
+
+    max_quantity = min(ask_symbol.max_quantity, bid_symbol.max_quantity)
+    reason = _check_min_quantity(
+        OrderSide.ASK,
+        to_compatible_quantity_increment(max_quantity, ask_qty_inc),
+        ask_symbol,
+    ) or _check_min_quantity(
+        OrderSide.BID,
+        to_compatible_quantity_increment(max_quantity, bid_qty_inc),
+        bid_symbol,
+    )
+    if reason is not None:
+        return Infeasibility(reason)
+
+    if ask.balance is None or bid.balance is None:
+        return None
+
+    # Notional value with fee can not exceed quote currency balance.
+    if ask.balance < ask_symbol.min_notional:
+        return Infeasibility(
+            NotionalLessThanMinNotionalError(
+                side=OrderSide.ASK,
+                notional=ask.balance,
+                min_notional=ask_symbol.min_notional,
+            )
+        )
+
+    reason = _check_min_quantity(
+        OrderSide.BID,
+        to_compatible_quantity_increment(bid.balance, bid_qty_inc),
+        bid_symbol,
+    )
+    if reason is not None:
+        return Infeasibility(reason)
+
+    # Higher ask price only decreases quantity which can be bought.
+    ask_balance = ask.balance
+    if not ask_symbol.fee_in_base_currency:
+        ask_balance = minus_fee(ask_balance, ask_symbol.taker_fee)
+    reason = _check_min_quantity(
+        OrderSide.ASK,
+        to_compatible_quantity_increment(ask_balance / ask.order.price, ask_qty_inc),
+        ask_symbol,
+    )
+    if reason is not None:
+        return Infeasibility(reason, min_ask_price=ask.order.price)
+
+    # Lower bid price only decreases notional value which can be sold.
+    max_bid_notional = bid.balance * bid.order.price
+    max_bid_notional -= max_bid_notional * bid_symbol.taker_fee / 100
+    if max_bid_notional < bid_symbol.min_notional:
+        return Infeasibility(
+            NotionalLessThanMinNotionalError(
+                side=OrderSide.BID,
+                notional=max_bid_notional,
+                min_notional=bid_symbol.min_notional,
+            ),
+            max_bid_price=bid.order.price,
+        )
+
+    return None
+
+
+@dataclass(frozen=True)
+class _Verdict:
+    infeasibility: Infeasibility
+    ask_symbol: SymbolInfo
+    bid_symbol: SymbolInfo
+    ask_balance: Decimal | None
+    bid_balance: Decimal | None
+    version: int
+    ask_fee_version: int
+    bid_fee_version: int
+
+
+class NegativeCache:
+    """Cache of pairs where arbitrage is structurally impossible.
+
+    A verdict remembers the inputs it depends on: symbol infos, balances,
+    version of symbol metadata, versions of fee schedules and price band.
+    It is used until one of them changes, so checking a dead pair costs
+    a few comparisons instead of :func:`arbitragepy.arbitrage` call.
+
+    Verdicts are recorded only after :func:`arbitragepy.arbitrage` has failed,
+    so live pairs pay nothing.
+    """
+
+    def __init__(self) -> None:
+        self._verdicts: dict[Hashable, _Verdict] = {}
+
+    def __len__(self) -> int:
+        return len(self._verdicts)
+
+    def get(
+        self,
+        key: Hashable,
+        ask: ArbitragePayload,
+        bid: ArbitragePayload,
+        version: int = 0,
+    ) -> ArbitrageError | None:
+        """Returns cached rejection reason of `key` or None if there is no valid verdict.
+
+        Args:
+            key: pair id.
+            ask: current ask payload.
+            bid: current bid payload.
+            version: current version of symbol metadata. Defaults to 0.
+        """
+
+        verdict = self._verdicts.get(key)
+        if verdict is None:
+            return None
+
+        infeasibility = verdict.infeasibility
+        if (
+            verdict.ask_symbol is ask.symbol
+            and verdict.bid_symbol is bid.symbol
+            and verdict.ask_balance == ask.balance
+            and verdict.bid_balance == bid.balance
+            and verdict.version == version
+            and verdict.ask_fee_version == _fee_version(ask.symbol)
+            and verdict.bid_fee_version == _fee_version(bid.symbol)
+            and (
+                infeasibility.min_ask_price is None
+                or ask.order.price >= infeasibility.min_ask_price
+            )
+            and (
+                infeasibility.max_bid_price is None
+                or bid.order.price <= infeasibility.max_bid_price
+            )
+        ):
+            return infeasibility.reason
+
+        del self._verdicts[key]
+        return None
+
+    def record(
+        self,
+        key: Hashable,
+        ask: ArbitragePayload,
+        bid: ArbitragePayload,
+        version: int = 0,
+        make_compatible_quantity_increments: bool = True,
+    ) -> ArbitrageError | None:
+        """Records verdict of `key` if arbitrage is structurally impossible.
+
+        Args:
+            key: pair id.
+            ask: ask payload.
+            bid: bid payload.
+            version: current version of symbol metadata. Defaults to 0.
+            make_compatible_quantity_increments: same as in :func:`arbitragepy.arbitrage`.
+                Defaults to True.
+
+        Returns:
+            Rejection reason or None if arbitrage may become possible with other order quantities.
+        """
+
+        infeasibility = find_infeasibility(
+            ask, bid, make_compatible_quantity_increments
+        )
+        if infeasibility is None:
+            self._verdicts.pop(key, None)
+            return None
+
+        self._verdicts[key] = _Verdict(
+            infeasibility=infeasibility,
+            ask_symbol=ask.symbol,
+            bid_symbol=bid.symbol,
+            ask_balance=ask.balance,
+            bid_balance=bid.balance,
+            version=version,
+            ask_fee_version=_fee_version(ask.symbol),
+            bid_fee_version=_fee_version(bid.symbol),
+        )
+        return infeasibility.reason
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drops verdict of `key` or all verdicts if `key` is None."""
+
+        if key is None:
+            self._verdicts.clear()
+        else:
+            self._verdicts.pop(key, None)
+
+
+def _fee_version(symbol: SymbolInfo) -> int:
+    if symbol.fee_schedule is None:
+        return 0
+    return symbol.fee_schedule.version
+
+
+def _check_min_quantity(
+    side: OrderSide, max_quantity: Decimal, symbol: SymbolInfo
+) -> QuantityLessThanMinQuantityError | None:
+    if max_quantity < symbol.min_quantity:
+        return QuantityLessThanMinQuantityError(
+            side=side, quantity=max_quantity, min_quantity=symbol.min_quantity
+        )
+    return None
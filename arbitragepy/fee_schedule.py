@@ -0,0 +1,97 @@
+from bisect import bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+
+from arbitragepy.enums import Liquidity
+
+
+@dataclass(frozen=True)
+class FeeTier:
+    """Fees of one trading volume tier.
+
+    Args:
+        min_volume: min trading volume of tier, for example 30-day volume in quote currency.
+        maker_fee: fee in percent of orders which add liquidity.
+        taker_fee: fee in percent of orders which take liquidity.
+    """
+
+    min_volume: Decimal
+    maker_fee: Decimal
+    taker_fee: Decimal
+
+
+class FeeSchedule:
+    """Maker and taker fees which depend on trading volume tier.
+
+    Fees of the current tier are plain attributes, so reading a fee costs O(1).
+    Changing the tier replaces them and increments :attr:`version`,
+    so symbol infos which refer to the schedule stay the same objects
+    and caches can check one number to see that fees have changed.
+
+    Args:
+        tiers: fee tiers in any order.
+        volume: current trading volume. Defaults to 0.
+            Volume less than the min volume of every tier selects the lowest tier.
+
+    Raises:
+        ValueError: if there are no tiers.
+    """
+
+    maker_fee: Decimal
+    """Maker fee of the current tier in percent."""
+    taker_fee: Decimal
+    """Taker fee of the current tier in percent."""
+
+    def __init__(self, tiers: Sequence[FeeTier], volume: Decimal = Decimal(0)) -> None:
+        if not tiers:
+            raise ValueError("fee schedule must have at least one tier.")
+
+        self.tiers = tuple(sorted(tiers, key=lambda tier: tier.min_volume))
+        self._min_volumes = [tier.min_volume for tier in self.tiers]
+        self.version = 0
+        self.volume = volume
+        self.tier = self._tier_of(volume)
+        self._apply()
+
+    def fee(self, liquidity: Liquidity) -> Decimal:
+        """Returns fee of the current tier in percent."""
+
+        return self.maker_fee if liquidity is Liquidity.MAKER else self.taker_fee
+
+    def set_volume(self, volume: Decimal) -> bool:
+        """Updates trading volume and selects its tier.
+
+        Returns:
+            True if tier has changed.
+        """
+
+        self.volume = volume
+        return self.set_tier(self._tier_of(volume))
+
+    def set_tier(self, tier: int) -> bool:
+        """Selects tier by index in :attr:`tiers`.
+
+        Returns:
+            True if tier has changed.
+
+        Raises:
+            IndexError: if there is no such tier.
+        """
+
+        if not 0 <= tier < len(self.tiers):
+            raise IndexError("fee tier index out of range")
+        if tier == self.tier:
+            return False
+        self.tier = tier
+        self._apply()
+        self.version += 1
+        return True
+
+    def _tier_of(self, volume: Decimal) -> int:
+        return max(bisect_right(self._min_volumes, volume) - 1, 0)
+
+    def _apply(self) -> None:
+        tier = self.tiers[self.tier]
+        self.maker_fee = tier.maker_fee
+        self.taker_fee = tier.taker_fee
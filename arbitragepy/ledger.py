@@ -0,0 +1,230 @@
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import ExitStack, contextmanager, suppress
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from arbitragepy.exceptions import InsufficientBalanceError
+from arbitragepy.models import ArbitrageResult
+
+AccountKey = tuple[str, str]
+"""Venue and currency."""
+
+
+@dataclass(frozen=True, eq=False)
+class Reservation:
+    """Balances reserved for one in-flight operation.
+
+    Args:
+        amounts: reserved amount per (venue, currency).
+    """
+
+    amounts: Mapping[AccountKey, Decimal]
+
+
+class _Account:
+    __slots__ = ("lock", "reserved", "total")
+
+    def __init__(self, total: Decimal) -> None:
+        self.lock = threading.Lock()
+        self.total = total
+        self.reserved = Decimal(0)
+
+
+class BalanceLedger:
+    """Available and reserved balances per (venue, currency).
+
+    Every account has its own lock and operations on several accounts
+    take their locks in the same order, so reservations for unrelated
+    accounts never wait for each other. All operations are short
+    and non-blocking, so they can be called from threads and asyncio tasks.
+
+    Args:
+        on_change: called with venue, currency and new available balance
+            after it changes, for example :meth:`arbitragepy.ArbitrageReactor.update_balance`.
+            Called in the thread which changed the balance, outside of account locks.
+            Calls are serialized and pass the balance at call time, so the last call
+            for an account always has its latest balance.
+    """
+
+    def __init__(
+        self, on_change: Callable[[str, str, Decimal], Any] | None = None
+    ) -> None:
+        self._on_change = on_change
+        self._accounts: dict[AccountKey, _Account] = {}
+        self._accounts_lock = threading.Lock()
+        self._open: set[Reservation] = set()
+        self._open_lock = threading.Lock()
+        # Reentrant because on_change may change balances too.
+        self._notify_lock = threading.RLock()
+
+    def set_balance(self, venue: str, currency: str, total: Decimal) -> None:
+        """Sets total `currency` balance on `venue`, for example reported by exchange.
+
+        Reserved amount stays reserved.
+        """
+
+        account = self._accounts.get((venue, currency))
+        if account is None:
+            with self._accounts_lock:
+                account = self._accounts.setdefault((venue, currency), _Account(total))
+        with account.lock:
+            account.total = total
+        self._notify([(venue, currency)])
+
+    def available(self, venue: str, currency: str) -> Decimal:
+        """Returns total minus reserved balance, 0 for unknown account."""
+
+        account = self._accounts.get((venue, currency))
+        if account is None:
+            return Decimal(0)
+        with account.lock:
+            return account.total - account.reserved
+
+    def reserved(self, venue: str, currency: str) -> Decimal:
+        """Returns reserved balance, 0 for unknown account."""
+
+        account = self._accounts.get((venue, currency))
+        if account is None:
+            return Decimal(0)
+        return account.reserved
+
+    def reserve(self, amounts: Mapping[AccountKey, Decimal]) -> Reservation:
+        """Atomically reserves all `amounts` or nothing.
+
+        Args:
+            amounts: amount per (venue, currency).
+
+        Raises:
+            InsufficientBalanceError: if any available balance is less than amount.
+            Exception: raised by `on_change`, the reservation is released then.
+        """
+
+        keys = sorted(amounts)
+        accounts = []
+        for key in keys:
+            account = self._accounts.get(key)
+            if account is None:
+                raise InsufficientBalanceError(*key, amounts[key], Decimal(0))
+            accounts.append(account)
+
+        with _locked(accounts):
+            for key, account in zip(keys, accounts):
+                balance = account.total - account.reserved
+                if balance < amounts[key]:
+                    raise InsufficientBalanceError(*key, amounts[key], balance)
+            for key, account in zip(keys, accounts):
+                account.reserved += amounts[key]
+
+        reservation = Reservation(amounts=dict(amounts))
+        with self._open_lock:
+            self._open.add(reservation)
+        try:
+            self._notify(keys)
+        except BaseException:
+            # Caller never gets the reservation, so it must not hold funds.
+            with suppress(Exception):
+                self.release(reservation)
+            raise
+        return reservation
+
+    def reserve_result(
+        self,
+        result: ArbitrageResult,
+        ask_venue: str,
+        quote_currency: str,
+        bid_venue: str,
+        base_currency: str,
+    ) -> Reservation:
+        """Reserves quote currency for ask order and base currency for bid order of `result`.
+
+        Raises:
+            InsufficientBalanceError: if any available balance is less than amount.
+            Exception: raised by `on_change`, the reservation is released then.
+        """
+
+        amounts = {(ask_venue, quote_currency): result.ask_order.notional_value}
+        bid_key = (bid_venue, base_currency)
+        amounts[bid_key] = amounts.get(bid_key, Decimal(0)) + result.bid_order.quantity
+        return self.reserve(amounts)
+
+    def commit(
+        self,
+        reservation: Reservation,
+        spent: Mapping[AccountKey, Decimal] | None = None,
+    ) -> None:
+        """Deducts spent amounts from total balances and releases the rest of reservation.
+
+        Args:
+            reservation: open reservation.
+            spent: really spent amount per (venue, currency). Defaults to reserved amounts.
+
+        Raises:
+            ValueError: if reservation is already committed or released.
+        """
+
+        self._close(reservation, reservation.amounts if spent is None else spent)
+
+    def release(self, reservation: Reservation) -> None:
+        """Releases reservation without spending.
+
+        Raises:
+            ValueError: if reservation is already committed or released.
+        """
+
+        self._close(reservation, {})
+
+    def _close(
+        self, reservation: Reservation, spent: Mapping[AccountKey, Decimal]
+    ) -> None:
+        with self._open_lock:
+            if reservation not in self._open:
+                raise ValueError("reservation is already committed or released.")
+            self._open.remove(reservation)
+
+        keys = sorted(reservation.amounts)
+        accounts = [self._accounts[key] for key in keys]
+        changed = []
+        with _locked(accounts):
+            for key, account in zip(keys, accounts):
+                amount = spent.get(key, Decimal(0))
+                account.reserved -= reservation.amounts[key]
+                account.total -= amount
+                if amount != reservation.amounts[key]:
+                    changed.append(key)
+        self._notify(changed)
+
+    def _notify(self, keys: Iterable[AccountKey]) -> None:
+        """Calls `on_change` with current available balance of every account of `keys`.
+
+        Every account is notified even if a call raises,
+        the last error is raised after all calls.
+        """
+
+        on_change = self._on_change
+        if on_change is None:
+            return
+        with self._notify_lock, ExitStack() as stack:
+            # The stack calls callbacks in reverse order and all of them
+            # even if one raises, so accounts are pushed in reverse order.
+            for venue, currency in reversed(list(keys)):
+                stack.callback(self._notify_account, on_change, venue, currency)
+
+    def _notify_account(
+        self, on_change: Callable[[str, str, Decimal], Any], venue: str, currency: str
+    ) -> None:
+        on_change(venue, currency, self.available(venue, currency))
+
+
+@contextmanager
+def _locked(accounts: list[_Account]) -> Iterator[None]:
+    """Holds locks of `accounts` which must be sorted by key."""
+
+    for account in accounts:
+        account.lock.acquire()
+    try:
+        yield
+    finally:
+        for account in reversed(accounts):
+            account.lock.release()
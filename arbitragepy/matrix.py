@@ -0,0 +1,136 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+
+from arbitragepy.quantity_increment import (
+    is_compatible_quantity_increments,
+    to_compatible_quantity_increment,
+)
+
+Grid = Sequence[Sequence[Decimal | None]]
+"""Symbol x venue values. None if venue has no such symbol or quote."""
+
+Tensor = list[list[list[Decimal | None]]]
+"""Symbol x ask venue x bid venue values."""
+
+
+@dataclass(frozen=True)
+class SpreadMatrix:
+    """Spreads between every pair of venues for every symbol.
+
+    Cells are indexed as `[symbol][ask venue][bid venue]`
+    and are None for the same venue, missing quotes
+    or incompatible quantity increments.
+
+    Args:
+        spreads: fee-adjusted spread in percent.
+        quantities: max executable base currency quantity.
+    """
+
+    spreads: Tensor
+    quantities: Tensor
+
+
+def spread_matrix(
+    asks: Grid,
+    ask_quantities: Grid,
+    bids: Grid,
+    bid_quantities: Grid,
+    fees: Grid,
+    quantity_increments: Grid,
+) -> SpreadMatrix:
+    """Calculates spreads and max quantities between every pair of venues.
+
+    Fee-adjusted ask and bid prices are calculated once per symbol and venue,
+    so each cell costs one division.
+    Fees are taken in the quote currency as in :func:`arbitragepy.arbitrage`
+    without balances, so the spread equals the spread of its result.
+
+    Args:
+        asks: best ask prices.
+        ask_quantities: best ask quantities.
+        bids: best bid prices.
+        bid_quantities: best bid quantities.
+        fees: fees in percent.
+        quantity_increments: quantity increments.
+
+    Returns:
+        Symbol x ask venue x bid venue spreads and quantities.
+    """
+
+    spreads: Tensor = []
+    quantities: Tensor = []
+    for s, symbol_fees in enumerate(fees):
+        costs = [
+            None if ask is None or fee is None else ask * (1 + fee / 100)
+            for ask, fee in zip(asks[s], symbol_fees)
+        ]
+        proceeds = [
+            None if bid is None or fee is None else bid * (1 - fee / 100)
+            for bid, fee in zip(bids[s], symbol_fees)
+        ]
+        increments = quantity_increments[s]
+        symbol_ask_quantities = ask_quantities[s]
+        symbol_bid_quantities = bid_quantities[s]
+
+        symbol_spreads = []
+        symbol_quantities = []
+        for i, cost in enumerate(costs):
+            row_spreads: list[Decimal | None] = []
+            row_quantities: list[Decimal | None] = []
+            ask_qty_inc = increments[i]
+            ask_quantity = symbol_ask_quantities[i]
+            for j, proceed in enumerate(proceeds):
+                bid_qty_inc = increments[j]
+                bid_quantity = symbol_bid_quantities[j]
+                if (
+                    i == j
+                    or cost is None
+                    or proceed is None
+                    or ask_quantity is None
+                    or bid_quantity is None
+                    or ask_qty_inc is None
+                    or bid_qty_inc is None
+                    or (
+                        ask_qty_inc != bid_qty_inc
+                        and not is_compatible_quantity_increments(
+                            ask_qty_inc, bid_qty_inc
+                        )
+                    )
+                ):
+                    row_spreads.append(None)
+                    row_quantities.append(None)
+                    continue
+
+                row_spreads.append((proceed / cost - 1) * 100)
+                row_quantities.append(
+                    to_compatible_quantity_increment(
+                        min(ask_quantity, bid_quantity),
+                        max(ask_qty_inc, bid_qty_inc),
+                    )
+                )
+            symbol_spreads.append(row_spreads)
+            symbol_quantities.append(row_quantities)
+        spreads.append(symbol_spreads)
+        quantities.append(symbol_quantities)
+
+    return SpreadMatrix(spreads=spreads, quantities=quantities)
+
+
+def best_pairs(matrix: SpreadMatrix) -> list[tuple[int, int, Decimal] | None]:
+    """Returns ask venue, bid venue and spread of the max spread of each symbol.
+
+    None if symbol has no pairs.
+    """
+
+    best: list[tuple[int, int, Decimal] | None] = []
+    for symbol_spreads in matrix.spreads:
+        symbol_best = None
+        for i, row in enumerate(symbol_spreads):
+            for j, spread in enumerate(row):
+                if spread is not None and (
+                    symbol_best is None or spread > symbol_best[2]
+                ):
+                    symbol_best = (i, j, spread)
+        best.append(symbol_best)
+    return best
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from decimal import Decimal
 
+from arbitragepy.fee_schedule import FeeSchedule
+
 
 @dataclass(frozen=True)
 class SymbolInfo:
@@ -13,7 +15,13 @@ class SymbolInfo:
         min_notional: min value of quantity * price. Defaults to 0.
         fee_in_base_currency: True if fee after purchase
             will be taken in the base currency. Defaults to False.
-        fee: fee in percent. Defaults to 0.
+        fee: fee in percent. Defaults to 0. Ignored if `fee_schedule` is not None.
+        price_precision: step of order price like 0.01.
+            Defaults to None which means prices are not rounded.
+        notional_precision: step of notional value and fee in quote currency like 0.01.
+            Defaults to None which means notional values are not rounded.
+        fee_schedule: maker and taker fees by volume tier. Defaults to None
+            which means `fee` is both maker and taker fee.
     """
 
     quantity_increment: Decimal
@@ -22,6 +30,17 @@ class SymbolInfo:
     min_notional: Decimal = Decimal(0)
     fee_in_base_currency: bool = False
     fee: Decimal = Decimal(0)
+    price_precision: Decimal | None = None
+    notional_precision: Decimal | None = None
+    fee_schedule: FeeSchedule | None = None
+
+    @property
+    def taker_fee(self) -> Decimal:
+        """Fee in percent of orders which take liquidity, like arbitrage orders."""
+
+        if self.fee_schedule is None:
+            return self.fee
+        return self.fee_schedule.taker_fee
 
 
 @dataclass(frozen=True)
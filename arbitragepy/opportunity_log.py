@@ -0,0 +1,359 @@
+import mmap
+import os
+import struct
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, BinaryIO
+
+from arbitragepy.enums import FsyncPolicy
+from arbitragepy.models import ArbitrageResult, OrderPayload
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+MAGIC = b"ARBLOG01"
+FIELDS = (
+    "timestamp_ns",
+    "ask_price",
+    "ask_quantity",
+    "ask_notional_value",
+    "ask_taken_fee",
+    "bid_price",
+    "bid_quantity",
+    "bid_notional_value",
+    "bid_taken_fee",
+    "spread",
+    "profit",
+)
+"""Record fields. Every field except `timestamp_ns` is a fixed-point number."""
+
+_HEADER = struct.Struct("<8sII")
+_RECORD = struct.Struct(f"<{len(FIELDS)}q")
+_FIELD_INDEXES = {name: i for i, name in enumerate(FIELDS)}
+_MIN_FIXED = -(2**63)
+_MAX_FIXED = 2**63 - 1
+
+
+@dataclass(frozen=True)
+class LoggedOpportunity:
+    """Arbitrage result read from opportunity log.
+
+    Args:
+        timestamp_ns: time when result was appended in nanoseconds since epoch.
+        result: arbitrage result rounded to log scale.
+    """
+
+    timestamp_ns: int
+    result: ArbitrageResult
+
+
+class OpportunityLogWriter:
+    """Append-only binary log of arbitrage results.
+
+    Every record is a fixed size row of little-endian int64 values,
+    numbers are stored as fixed-point integers with `scale` fractional digits,
+    so their magnitude must be less than `2 ** 63 / 10 ** scale`,
+    about 9.2e10 with the default scale.
+    Records are buffered and written in batches. A new file is started
+    when the current one would exceed `max_file_size`.
+
+    Files are named `{prefix}-{index:06d}.arblog` and are never reopened for writing,
+    so new writer continues numbering after existing files.
+
+    Args:
+        directory: directory for log files.
+        prefix: log file name prefix. Defaults to "opportunities".
+        scale: count of stored fractional digits. Defaults to 8.
+        batch_size: count of buffered records. Defaults to 1024.
+        max_file_size: max size of log file in bytes. Defaults to 64 MiB.
+        fsync: when written data is forced to disk. Defaults to on close.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        prefix: str = "opportunities",
+        scale: int = 8,
+        batch_size: int = 1024,
+        max_file_size: int = 64 * 1024 * 1024,
+        fsync: FsyncPolicy = FsyncPolicy.ON_CLOSE,
+    ) -> None:
+        if max_file_size < _HEADER.size + _RECORD.size:
+            raise ValueError("max file size is less than one record.")
+
+        self._directory = Path(directory)
+        self._prefix = prefix
+        self._scale = scale
+        self._batch_size = batch_size
+        self._max_file_size = max_file_size
+        self._fsync = fsync
+        self._buffer = bytearray(batch_size * _RECORD.size)
+        self._buffered = 0
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        existing = log_files(self._directory, prefix)
+        self._file_index = _file_index(existing[-1]) + 1 if existing else 0
+        self._file = self._open_next_file()
+
+    @property
+    def path(self) -> Path:
+        """Path of the current log file."""
+
+        return Path(self._file.name)
+
+    def append(self, result: ArbitrageResult, timestamp_ns: int | None = None) -> None:
+        """Appends `result` to the buffer and writes buffer if it is full.
+
+        Args:
+            result: arbitrage result.
+            timestamp_ns: time of result in nanoseconds since epoch. Defaults to now.
+
+        Raises:
+            ValueError: if a value does not fit in the record, nothing is appended then.
+        """
+
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+
+        scale = self._scale
+        ask = result.ask_order
+        bid = result.bid_order
+        _RECORD.pack_into(
+            self._buffer,
+            self._buffered * _RECORD.size,
+            timestamp_ns,
+            _to_fixed(ask.price, scale),
+            _to_fixed(ask.quantity, scale),
+            _to_fixed(ask.notional_value, scale),
+            _to_fixed(ask.taken_fee, scale),
+            _to_fixed(bid.price, scale),
+            _to_fixed(bid.quantity, scale),
+            _to_fixed(bid.notional_value, scale),
+            _to_fixed(bid.taken_fee, scale),
+            _to_fixed(result.spread, scale),
+            _to_fixed(result.profit, scale),
+        )
+        self._buffered += 1
+        if self._buffered == self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes buffered records, rotating log file if needed."""
+
+        data = memoryview(self._buffer)[: self._buffered * _RECORD.size]
+        while data:
+            free = self._max_file_size - self._file.tell()
+            fit = free // _RECORD.size * _RECORD.size
+            if not fit:
+                self._close_file()
+                self._file = self._open_next_file()
+                continue
+            self._file.write(data[:fit])
+            data = data[fit:]
+
+        self._buffered = 0
+        self._file.flush()
+        if self._fsync is FsyncPolicy.ON_FLUSH:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Writes buffered records and closes log file."""
+
+        if self._file.closed:
+            return
+        self.flush()
+        self._close_file()
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _open_next_file(self) -> BinaryIO:
+        path = self._directory / f"{self._prefix}-{self._file_index:06d}.arblog"
+        self._file_index += 1
+        with ExitStack() as stack:
+            file = stack.enter_context(open(path, "xb"))
+            file.write(_HEADER.pack(MAGIC, self._scale, len(FIELDS)))
+            # The file is closed only if the header is not written.
+            stack.pop_all()
+        return file
+
+    def _close_file(self) -> None:
+        self._file.flush()
+        if self._fsync is not FsyncPolicy.NEVER:
+            os.fsync(self._file.fileno())
+        self._file.close()
+
+
+class OpportunityLogReader:
+    """Memory-mapped reader of opportunity log file.
+
+    Columns are exposed as int64 views of the mapped file,
+    so records can be scanned and filtered without decoding them.
+    Views returned by :meth:`column` must be released before :meth:`close`.
+
+    Args:
+        path: log file path.
+
+    Raises:
+        ValueError: if file is not an opportunity log or is shorter than its header.
+            An incomplete record at the end, like after a crash of the writer, is ignored.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        if sys.byteorder != "little":
+            raise ValueError(
+                "opportunity log can be mapped only on little-endian hosts."
+            )
+
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(
+                    f"{path} is not an opportunity log: {size} bytes"
+                    f" is less than {_HEADER.size} bytes of header."
+                )
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, scale, field_count = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or field_count != len(FIELDS):
+            self._mmap.close()
+            raise ValueError(f"{path} is not an opportunity log.")
+
+        self.scale: int = scale
+        records_size = (len(self._mmap) - _HEADER.size) // _RECORD.size * _RECORD.size
+        self._values = memoryview(self._mmap)[
+            _HEADER.size : _HEADER.size + records_size
+        ].cast("q")
+
+    def __len__(self) -> int:
+        return len(self._values) // len(FIELDS)
+
+    def __getitem__(self, index: int) -> LoggedOpportunity:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+
+        start = index * len(FIELDS)
+        timestamp_ns, *values = self._values[start : start + len(FIELDS)].tolist()
+        (
+            ask_price,
+            ask_quantity,
+            ask_notional_value,
+            ask_taken_fee,
+            bid_price,
+            bid_quantity,
+            bid_notional_value,
+            bid_taken_fee,
+            spread,
+            profit,
+        ) = (self.to_decimal(v) for v in values)
+
+        return LoggedOpportunity(
+            timestamp_ns=timestamp_ns,
+            result=ArbitrageResult(
+                ask_order=OrderPayload(
+                    price=ask_price,
+                    quantity=ask_quantity,
+                    notional_value=ask_notional_value,
+                    taken_fee=ask_taken_fee,
+                ),
+                bid_order=OrderPayload(
+                    price=bid_price,
+                    quantity=bid_quantity,
+                    notional_value=bid_notional_value,
+                    taken_fee=bid_taken_fee,
+                ),
+                spread=spread,
+                profit=profit,
+            ),
+        )
+
+    def __iter__(self) -> Iterator[LoggedOpportunity]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def column(self, field: str) -> memoryview:
+        """Returns view of raw fixed-point values of `field` in every record."""
+
+        return self._values[_FIELD_INDEXES[field] :: len(FIELDS)]
+
+    def filter(self, field: str, predicate: Callable[[int], bool]) -> Iterator[int]:
+        """Yields indexes of records which raw `field` value satisfies `predicate`.
+
+        Use :meth:`to_fixed` to convert thresholds to raw values.
+        """
+
+        column = self.column(field)
+        try:
+            for i, value in enumerate(column):
+                if predicate(value):
+                    yield i
+        finally:
+            column.release()
+
+    def to_fixed(self, value: Decimal) -> int:
+        """Converts `value` to raw fixed-point value of this log.
+
+        Raises:
+            ValueError: if value does not fit in int64 at log scale.
+        """
+
+        return _to_fixed(value, self.scale)
+
+    def to_decimal(self, value: int) -> Decimal:
+        """Converts raw fixed-point value of this log to Decimal."""
+
+        return Decimal(value).scaleb(-self.scale)
+
+    def close(self) -> None:
+        """Unmaps log file."""
+
+        self._values.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def log_files(
+    directory: str | os.PathLike[str], prefix: str = "opportunities"
+) -> list[Path]:
+    """Returns log files in `directory` ordered by writing order."""
+
+    return sorted(Path(directory).glob(f"{prefix}-*.arblog"), key=_file_index)
+
+
+def _file_index(path: Path) -> int:
+    return int(path.stem.rsplit("-", 1)[1])
+
+
+def _to_fixed(value: Decimal, scale: int) -> int:
+    if not value.is_finite():
+        raise ValueError(f"{value} can not be stored as a fixed-point number.")
+    fixed = int(value.scaleb(scale).to_integral_value())
+    if not _MIN_FIXED <= fixed <= _MAX_FIXED:
+        raise ValueError(f"{value} does not fit in int64 with scale {scale}.")
+    return fixed
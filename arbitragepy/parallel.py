@@ -0,0 +1,123 @@
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from decimal import (
+    ROUND_HALF_EVEN,
+    Context,
+    DivisionByZero,
+    InvalidOperation,
+    Overflow,
+    localcontext,
+)
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.exceptions import ArbitrageError
+from arbitragepy.models import ArbitragePayload, ArbitrageResult
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+ARBITRAGE_CONTEXT = Context(
+    prec=28,
+    rounding=ROUND_HALF_EVEN,
+    traps=[InvalidOperation, DivisionByZero, Overflow],
+)
+"""Decimal context in which arbitrage calculations are expected to run.
+
+Equals to the default context of :mod:`decimal`.
+"""
+
+
+class ConcurrentEvaluator:
+    """Runs :func:`arbitrage` for many pairs in a thread pool.
+
+    Each task runs in its own copy of `context`, so results do not depend
+    on the decimal context of the calling or worker thread.
+    Tasks share no mutable state, which makes the evaluator safe
+    on free-threaded Python builds.
+
+    Args:
+        max_workers: count of threads. Defaults to :class:`ThreadPoolExecutor` default.
+        context: decimal context of calculations. Defaults to :data:`ARBITRAGE_CONTEXT`.
+        chunk_size: count of pairs evaluated by one task. Defaults to 256.
+        make_compatible_quantity_increments: passed to :func:`arbitrage`.
+            Defaults to True.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        context: Context = ARBITRAGE_CONTEXT,
+        chunk_size: int = 256,
+        make_compatible_quantity_increments: bool = True,
+    ) -> None:
+        self._context = context.copy()
+        self._chunk_size = chunk_size
+        self._make_compatible_quantity_increments = make_compatible_quantity_increments
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def evaluate(
+        self,
+        pairs: Sequence[tuple[ArbitragePayload, ArbitragePayload]],
+        make_compatible_quantity_increments: bool | None = None,
+    ) -> list[ArbitrageResult | ArbitrageError]:
+        """Runs arbitrage for every `(ask, bid)` pair.
+
+        Args:
+            pairs: ask and bid payloads.
+            make_compatible_quantity_increments: passed to :func:`arbitrage`.
+                Defaults to None which means the setting of the evaluator.
+
+        Returns:
+            Result or rejection reason of each pair in the same order.
+        """
+
+        if make_compatible_quantity_increments is None:
+            make_compatible_quantity_increments = (
+                self._make_compatible_quantity_increments
+            )
+        chunk_size = self._chunk_size
+        futures = [
+            self._executor.submit(
+                self._evaluate_chunk,
+                pairs[i : i + chunk_size],
+                make_compatible_quantity_increments,
+            )
+            for i in range(0, len(pairs), chunk_size)
+        ]
+
+        results: list[ArbitrageResult | ArbitrageError] = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def close(self) -> None:
+        """Shuts down the thread pool."""
+
+        self._executor.shutdown()
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _evaluate_chunk(
+        self,
+        pairs: Sequence[tuple[ArbitragePayload, ArbitragePayload]],
+        make_compatible: bool,
+    ) -> list[ArbitrageResult | ArbitrageError]:
+        results: list[ArbitrageResult | ArbitrageError] = []
+        with localcontext(self._context):
+            for ask, bid in pairs:
+                try:
+                    results.append(arbitrage(ask, bid, make_compatible))
+                except ArbitrageError as e:
+                    results.append(e)
+        return results
@@ -0,0 +1,136 @@
+from collections.abc import Iterable, Sequence
+from decimal import Decimal
+
+from arbitragepy.exceptions import QuantityNotAlignedError
+from arbitragepy.models import OrderInfo
+
+
+def parse_scaled(s: str, scale: int) -> int:
+    """Parses decimal string to integer number of `10 ** -scale` units.
+
+    Works on the string digits only, without intermediate `float` or `Decimal`.
+
+    Args:
+        s (str): number like "0.00012340"
+        scale (int): count of fractional digits
+
+    Returns:
+        int
+
+    Raises:
+        ValueError: if `s` is not a number or has more significant fractional digits than `scale`.
+    """
+
+    integer, _, fraction = s.partition(".")
+    if len(fraction) > scale:
+        if fraction[scale:].strip("0"):
+            raise ValueError(f"{s} has more than {scale} fractional digits.")
+        fraction = fraction[:scale]
+    if not (integer + fraction).lstrip("+-").isdigit():
+        raise ValueError(f"{s} is not a decimal number.")
+
+    return int(integer + fraction + "0" * (scale - len(fraction)))
+
+
+def to_scaled(n: Decimal, scale: int) -> int:
+    """Converts `n` to integer number of `10 ** -scale` units.
+
+    Raises:
+        ValueError: if `n` has more significant fractional digits than `scale`.
+    """
+
+    scaled = n.scaleb(scale)
+    if scaled != scaled.to_integral_value():
+        raise ValueError(f"{n} has more than {scale} fractional digits.")
+    return int(scaled)
+
+
+def parse_quantity(s: str, quantity_increment: Decimal) -> Decimal:
+    """Parses quantity string and checks that it is divided on `quantity_increment`.
+
+    Args:
+        s (str): quantity like "0.00012340"
+        quantity_increment (Decimal)
+
+    Returns:
+        Decimal
+
+    Raises:
+        QuantityNotAlignedError: if quantity is not divided on `quantity_increment`.
+    """
+
+    quantity = Decimal(s)
+    if quantity % quantity_increment:
+        raise QuantityNotAlignedError(quantity, quantity_increment)
+    return quantity
+
+
+def parse_levels(
+    levels: Iterable[Sequence[str]], quantity_increment: Decimal | None = None
+) -> list[OrderInfo]:
+    """Parses order book levels of `[price, quantity, ...]` strings.
+
+    Args:
+        levels: order book levels as sent by exchange.
+        quantity_increment: if not None checks that quantities are divided on it.
+
+    Returns:
+        Order book levels.
+
+    Raises:
+        QuantityNotAlignedError: if quantity is not divided on `quantity_increment`.
+    """
+
+    if quantity_increment is None:
+        return [
+            OrderInfo(price=Decimal(level[0]), quantity=Decimal(level[1]))
+            for level in levels
+        ]
+    return [
+        OrderInfo(
+            price=Decimal(level[0]),
+            quantity=parse_quantity(level[1], quantity_increment),
+        )
+        for level in levels
+    ]
+
+
+def parse_scaled_levels(
+    levels: Iterable[Sequence[str]],
+    price_scale: int,
+    quantity_scale: int,
+    quantity_increment: Decimal | None = None,
+) -> tuple[list[int], list[int]]:
+    """Parses whole order book snapshot to scaled integers.
+
+    Creates no `Decimal` or `OrderInfo` per level.
+
+    Args:
+        levels: order book levels of `[price, quantity, ...]` strings.
+        price_scale: count of price fractional digits.
+        quantity_scale: count of quantity fractional digits.
+        quantity_increment: if not None checks that quantities are divided on it.
+
+    Returns:
+        Prices and quantities in `10 ** -scale` units.
+
+    Raises:
+        ValueError: if number has more fractional digits than its scale.
+        QuantityNotAlignedError: if quantity is not divided on `quantity_increment`.
+    """
+
+    prices = []
+    quantities = []
+    for level in levels:
+        prices.append(parse_scaled(level[0], price_scale))
+        quantities.append(parse_scaled(level[1], quantity_scale))
+
+    if quantity_increment is not None:
+        increment = to_scaled(quantity_increment, quantity_scale)
+        for quantity in quantities:
+            if quantity % increment:
+                raise QuantityNotAlignedError(
+                    Decimal(quantity).scaleb(-quantity_scale), quantity_increment
+                )
+
+    return prices, quantities
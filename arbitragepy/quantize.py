@@ -0,0 +1,49 @@
+from collections.abc import Callable
+from decimal import ROUND_DOWN, ROUND_UP, Decimal
+from functools import cache
+
+Quantizer = Callable[[Decimal], Decimal]
+
+_ONE = Decimal(1)
+
+
+@cache
+def get_quantizer(step: Decimal, rounding: str) -> Quantizer:
+    """Returns function which rounds number to multiple of `step`.
+
+    Quantizers are cached per step and rounding, so they are built once
+    and evaluation only calls them. Power of ten steps like 0.01
+    use a single :meth:`Decimal.quantize` call.
+
+    Args:
+        step: precision like Decimal("0.01") or Decimal("0.05").
+        rounding: `decimal` rounding mode, for example `decimal.ROUND_UP`.
+
+    Returns:
+        Quantizer.
+    """
+
+    sign, digits, _ = step.as_tuple()
+    if not sign and digits == (1,):
+
+        def quantize_to_exponent(n: Decimal) -> Decimal:
+            return n.quantize(step, rounding)
+
+        return quantize_to_exponent
+
+    def quantize_to_step(n: Decimal) -> Decimal:
+        return (n / step).quantize(_ONE, rounding) * step
+
+    return quantize_to_step
+
+
+def quantize_up(n: Decimal, step: Decimal) -> Decimal:
+    """Rounds `n` up to multiple of `step`, away from zero."""
+
+    return get_quantizer(step, ROUND_UP)(n)
+
+
+def quantize_down(n: Decimal, step: Decimal) -> Decimal:
+    """Rounds `n` down to multiple of `step`, towards zero."""
+
+    return get_quantizer(step, ROUND_DOWN)(n)
@@ -0,0 +1,154 @@
+import heapq
+from collections.abc import Hashable
+from decimal import Decimal
+
+from arbitragepy.enums import RankBy
+from arbitragepy.models import ArbitrageResult
+
+
+class OpportunityHeap:
+    """Indexed max heap of profitable arbitrage results keyed by pair id.
+
+    Update, remove and pop take O(log n), peek takes O(1)
+    and top `k` results take O(k log k).
+
+    Args:
+        rank_by: value by which results are ranked. Defaults to profit.
+        min_profit: results with profit less than or equal to it are evicted.
+            Defaults to 0.
+    """
+
+    def __init__(
+        self, rank_by: RankBy = RankBy.PROFIT, min_profit: Decimal = Decimal(0)
+    ) -> None:
+        self._rank_by = rank_by
+        self._min_profit = min_profit
+        self._heap: list[tuple[Decimal, Hashable, ArbitrageResult]] = []
+        self._positions: dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._positions
+
+    def update(self, key: Hashable, result: ArbitrageResult | None) -> None:
+        """Inserts or replaces result of `key`.
+
+        Evicts `key` if `result` is None or is not profitable.
+
+        Args:
+            key: pair id.
+            result: last arbitrage result of the pair.
+        """
+
+        if result is None or result.profit <= self._min_profit:
+            self.remove(key)
+            return
+
+        rank = result.profit if self._rank_by is RankBy.PROFIT else result.spread
+        entry = (rank, key, result)
+        position = self._positions.get(key)
+        if position is None:
+            self._heap.append(entry)
+            self._positions[key] = len(self._heap) - 1
+            self._sift_up(len(self._heap) - 1)
+            return
+
+        old_rank = self._heap[position][0]
+        self._heap[position] = entry
+        if rank > old_rank:
+            self._sift_up(position)
+        else:
+            self._sift_down(position)
+
+    def remove(self, key: Hashable) -> None:
+        """Removes `key` from the heap. Does nothing if it is absent."""
+
+        position = self._positions.pop(key, None)
+        if position is None:
+            return
+
+        last = self._heap.pop()
+        if position == len(self._heap):
+            return
+
+        self._heap[position] = last
+        self._positions[last[1]] = position
+        self._sift_up(position)
+        self._sift_down(self._positions[last[1]])
+
+    def get(self, key: Hashable) -> ArbitrageResult | None:
+        """Returns result of `key` or None if it is absent."""
+
+        position = self._positions.get(key)
+        if position is None:
+            return None
+        return self._heap[position][2]
+
+    def peek(self) -> tuple[Hashable, ArbitrageResult] | None:
+        """Returns the best pair id and result or None if the heap is empty."""
+
+        if not self._heap:
+            return None
+        _, key, result = self._heap[0]
+        return key, result
+
+    def pop(self) -> tuple[Hashable, ArbitrageResult] | None:
+        """Removes and returns the best pair id and result or None if the heap is empty."""
+
+        best = self.peek()
+        if best is not None:
+            self.remove(best[0])
+        return best
+
+    def top(self, k: int) -> list[tuple[Hashable, ArbitrageResult]]:
+        """Returns `k` best pair ids and results ordered from the best."""
+
+        heap = self._heap
+        if not heap or k <= 0:
+            return []
+
+        # Children are never better than their parent, so only the frontier
+        # of visited nodes has to be ordered.
+        frontier = [(-heap[0][0], 0)]
+        top = []
+        while frontier and len(top) < k:
+            _, position = heapq.heappop(frontier)
+            _, key, result = heap[position]
+            top.append((key, result))
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (-heap[child][0], child))
+        return top
+
+    def _sift_up(self, position: int) -> None:
+        heap = self._heap
+        entry = heap[position]
+        while position > 0:
+            parent = (position - 1) // 2
+            if heap[parent][0] >= entry[0]:
+                break
+            heap[position] = heap[parent]
+            self._positions[heap[position][1]] = position
+            position = parent
+        heap[position] = entry
+        self._positions[entry[1]] = position
+
+    def _sift_down(self, position: int) -> None:
+        heap = self._heap
+        size = len(heap)
+        entry = heap[position]
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1][0] > heap[child][0]:
+                child += 1
+            if heap[child][0] <= entry[0]:
+                break
+            heap[position] = heap[child]
+            self._positions[heap[position][1]] = position
+            position = child
+        heap[position] = entry
+        self._positions[entry[1]] = position
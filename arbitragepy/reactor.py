@@ -0,0 +1,324 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.exceptions import ArbitrageError
+from arbitragepy.feasibility import NegativeCache
+from arbitragepy.models import (
+    ArbitragePayload,
+    ArbitrageResult,
+    OrderInfo,
+    SymbolInfo,
+)
+from arbitragepy.ranking import OpportunityHeap
+
+PairId = tuple[str, str, str]
+"""Directed pair id: symbol, ask exchange, bid exchange."""
+
+
+@dataclass
+class MarketState:
+    """Current state of symbol on exchange.
+
+    Args:
+        venue: exchange name.
+        symbol: symbol name. Pairs are built between markets with the same symbol name.
+        info: info about symbol.
+        base_currency: symbol base currency. Balance is not used if None.
+        quote_currency: symbol quote currency. Balance is not used if None.
+        ask: best ask order. None if unknown.
+        bid: best bid order. None if unknown.
+    """
+
+    venue: str
+    symbol: str
+    info: SymbolInfo
+    base_currency: str | None = None
+    quote_currency: str | None = None
+    ask: OrderInfo | None = None
+    bid: OrderInfo | None = None
+
+
+@dataclass(eq=False)
+class PairContext:
+    """Directed pair of markets: buy on `ask_market`, sell on `bid_market`.
+
+    Args:
+        pair_id: pair id.
+        ask_market: market where base currency will be bought.
+        bid_market: market where base currency will be sold.
+        result: last result of arbitrage. None if not evaluated or rejected.
+        error: reason of rejection of last evaluation.
+    """
+
+    pair_id: PairId
+    ask_market: MarketState
+    bid_market: MarketState
+    result: ArbitrageResult | None = field(default=None)
+    error: ArbitrageError | None = field(default=None)
+
+    @property
+    def is_profitable(self) -> bool:
+        """True if last result has positive profit."""
+
+        return self.result is not None and self.result.profit > 0
+
+
+class ArbitrageReactor:
+    """Event driven arbitrage evaluator.
+
+    Keeps index from (venue, symbol) and (venue, currency) to the pairs
+    which depend on them. Every update re-evaluates only affected pairs
+    and incrementally maintains the most profitable pair for each symbol.
+
+    Args:
+        make_compatible_quantity_increments: passed to :func:`arbitragepy.arbitrage`.
+            Defaults to True.
+        rankings: heaps which receive every re-evaluated pair.
+        negative_cache: if not None pairs which are structurally impossible
+            are skipped until their inputs change.
+    """
+
+    def __init__(
+        self,
+        make_compatible_quantity_increments: bool = True,
+        rankings: Iterable[OpportunityHeap] = (),
+        negative_cache: NegativeCache | None = None,
+    ) -> None:
+        self._make_compatible_quantity_increments = make_compatible_quantity_increments
+        self._rankings = list(rankings)
+        self._negative_cache = negative_cache
+        self._markets: dict[tuple[str, str], MarketState] = {}
+        self._balances: dict[tuple[str, str], Decimal] = {}
+        self._pairs: dict[PairId, PairContext] = {}
+        self._pairs_by_market: dict[tuple[str, str], list[PairContext]] = defaultdict(
+            list
+        )
+        self._pairs_by_balance: dict[tuple[str, str], list[PairContext]] = defaultdict(
+            list
+        )
+        self._pairs_by_symbol: dict[str, list[PairContext]] = defaultdict(list)
+        self._best: dict[str, PairContext] = {}
+
+    def add_market(
+        self,
+        venue: str,
+        symbol: str,
+        info: SymbolInfo,
+        base_currency: str | None = None,
+        quote_currency: str | None = None,
+    ) -> None:
+        """Registers `symbol` on `venue` and builds pairs with the other exchanges.
+
+        Args:
+            venue: exchange name.
+            symbol: symbol name.
+            info: info about symbol.
+            base_currency: symbol base currency. Balance is not used if None.
+            quote_currency: symbol quote currency. Balance is not used if None.
+
+        Raises:
+            ValueError: if market is already registered.
+        """
+
+        key = (venue, symbol)
+        if key in self._markets:
+            raise ValueError(f"{symbol} on {venue} is already registered.")
+
+        market = MarketState(
+            venue=venue,
+            symbol=symbol,
+            info=info,
+            base_currency=base_currency,
+            quote_currency=quote_currency,
+        )
+        others = [m for m in self._markets.values() if m.symbol == symbol]
+        self._markets[key] = market
+
+        for other in others:
+            self._add_pair(market, other)
+            self._add_pair(other, market)
+
+    def update_quote(
+        self,
+        venue: str,
+        symbol: str,
+        ask: OrderInfo | None,
+        bid: OrderInfo | None,
+    ) -> list[PairContext]:
+        """Updates best orders of `symbol` on `venue` and re-evaluates affected pairs.
+
+        Args:
+            venue: exchange name.
+            symbol: symbol name.
+            ask: best ask order. None if there are no asks.
+            bid: best bid order. None if there are no bids.
+
+        Returns:
+            Re-evaluated pairs.
+        """
+
+        market = self._markets[(venue, symbol)]
+        market.ask = ask
+        market.bid = bid
+        return self._reevaluate(self._pairs_by_market[(venue, symbol)])
+
+    def update_balance(
+        self, venue: str, currency: str, balance: Decimal
+    ) -> list[PairContext]:
+        """Updates `currency` balance on `venue` and re-evaluates affected pairs.
+
+        Args:
+            venue: exchange name.
+            currency: currency name.
+            balance: available balance.
+
+        Returns:
+            Re-evaluated pairs.
+        """
+
+        self._balances[(venue, currency)] = balance
+        return self._reevaluate(self._pairs_by_balance[(venue, currency)])
+
+    def balance(self, venue: str, currency: str) -> Decimal | None:
+        """Returns known `currency` balance on `venue`."""
+
+        return self._balances.get((venue, currency))
+
+    def pair(self, pair_id: PairId) -> PairContext:
+        """Returns pair by id."""
+
+        return self._pairs[pair_id]
+
+    def pairs(self, symbol: str | None = None) -> list[PairContext]:
+        """Returns all pairs or pairs of `symbol`."""
+
+        if symbol is None:
+            return list(self._pairs.values())
+        return list(self._pairs_by_symbol.get(symbol, ()))
+
+    def best(self, symbol: str) -> PairContext | None:
+        """Returns the most profitable pair of `symbol` or None if there is no profitable pairs."""
+
+        return self._best.get(symbol)
+
+    def evaluate(self, ctx: PairContext) -> None:
+        """Runs arbitrage for `ctx` with current quotes and balances."""
+
+        ask_market = ctx.ask_market
+        bid_market = ctx.bid_market
+        ctx.result = ctx.error = None
+        if ask_market.ask is None or bid_market.bid is None:
+            return
+
+        ask_balance = bid_balance = None
+        if ask_market.quote_currency is not None:
+            ask_balance = self._balances.get(
+                (ask_market.venue, ask_market.quote_currency)
+            )
+        if bid_market.base_currency is not None:
+            bid_balance = self._balances.get(
+                (bid_market.venue, bid_market.base_currency)
+            )
+
+        ask = ArbitragePayload(
+            symbol=ask_market.info, order=ask_market.ask, balance=ask_balance
+        )
+        bid = ArbitragePayload(
+            symbol=bid_market.info, order=bid_market.bid, balance=bid_balance
+        )
+        negative_cache = self._negative_cache
+        if negative_cache is not None:
+            ctx.error = negative_cache.get(ctx.pair_id, ask, bid)
+            if ctx.error is not None:
+                return
+
+        try:
+            ctx.result = arbitrage(
+                ask=ask,
+                bid=bid,
+                make_compatible_quantity_increments=self._make_compatible_quantity_increments,
+            )
+        except ArbitrageError as e:
+            ctx.error = e
+            if negative_cache is not None:
+                negative_cache.record(
+                    ctx.pair_id,
+                    ask,
+                    bid,
+                    make_compatible_quantity_increments=self._make_compatible_quantity_increments,
+                )
+
+    def _add_pair(self, ask_market: MarketState, bid_market: MarketState) -> None:
+        pair_id = (ask_market.symbol, ask_market.venue, bid_market.venue)
+        ctx = PairContext(pair_id=pair_id, ask_market=ask_market, bid_market=bid_market)
+        self._pairs[pair_id] = ctx
+        self._pairs_by_symbol[ask_market.symbol].append(ctx)
+        self._pairs_by_market[(ask_market.venue, ask_market.symbol)].append(ctx)
+        self._pairs_by_market[(bid_market.venue, bid_market.symbol)].append(ctx)
+        if ask_market.quote_currency is not None:
+            self._pairs_by_balance[
+                (ask_market.venue, ask_market.quote_currency)
+            ].append(ctx)
+        if bid_market.base_currency is not None:
+            self._pairs_by_balance[(bid_market.venue, bid_market.base_currency)].append(
+                ctx
+            )
+
+    def _reevaluate(self, pairs: Iterable[PairContext]) -> list[PairContext]:
+        pairs = list(pairs)
+        previous_best_profits = {
+            symbol: best.result.profit
+            for symbol, best in self._best.items()
+            if best.result is not None
+        }
+
+        changed_by_symbol: dict[str, list[PairContext]] = defaultdict(list)
+        for ctx in pairs:
+            self.evaluate(ctx)
+            for ranking in self._rankings:
+                ranking.update(ctx.pair_id, ctx.result)
+            changed_by_symbol[ctx.pair_id[0]].append(ctx)
+
+        for symbol, changed in changed_by_symbol.items():
+            self._update_best(symbol, changed, previous_best_profits.get(symbol))
+
+        return pairs
+
+    def _update_best(
+        self,
+        symbol: str,
+        changed: list[PairContext],
+        previous_best_profit: Decimal | None,
+    ) -> None:
+        best = self._best.get(symbol)
+        if (
+            best is not None
+            and best in changed
+            and (
+                best.result is None
+                or previous_best_profit is None
+                or best.result.profit < previous_best_profit
+                or not best.is_profitable
+            )
+        ):
+            # The best pair got worse, so any other pair may be the best now.
+            changed = self._pairs_by_symbol[symbol]
+            best = None
+
+        for ctx in changed:
+            if not ctx.is_profitable or ctx.result is None:
+                continue
+            if (
+                best is None
+                or best.result is None
+                or ctx.result.profit > best.result.profit
+            ):
+                best = ctx
+
+        if best is None:
+            self._best.pop(symbol, None)
+        else:
+            self._best[symbol] = best
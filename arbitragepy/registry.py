@@ -0,0 +1,203 @@
+import json
+import os
+from collections.abc import Iterator, Mapping
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any
+
+from arbitragepy.fee_schedule import FeeSchedule, FeeTier
+from arbitragepy.models import SymbolInfo
+
+_DECIMAL_FIELDS = (
+    "quantity_increment",
+    "min_quantity",
+    "max_quantity",
+    "min_notional",
+    "fee",
+    "price_precision",
+    "notional_precision",
+)
+_TIER_FIELDS = ("min_volume", "maker_fee", "taker_fee")
+_BOOLEANS = {"true": True, "false": False, "1": True, "0": False}
+
+
+def symbol_info_from_dict(data: Mapping[str, Any]) -> SymbolInfo:
+    """Creates :class:`SymbolInfo` from exchange filters.
+
+    Numbers may be strings or ints, floats are not accepted
+    because they can not be converted to `Decimal` exactly.
+    Flags may be booleans or strings "true", "false", "1" and "0".
+    `fee_schedule` is an object with `tiers` list of :class:`FeeTier` fields
+    and optional `volume`, every symbol gets its own :class:`FeeSchedule`.
+
+    Args:
+        data: mapping with :class:`SymbolInfo` field names as keys.
+
+    Raises:
+        TypeError: if data is not a mapping or number is a float or not a string or int.
+        ValueError: if number is invalid, flag is not a boolean,
+            field is unknown or fee schedule is invalid.
+    """
+
+    if not isinstance(data, Mapping):
+        raise TypeError(f"symbol info must be an object, got {data!r}.")
+
+    kwargs: dict[str, Any] = {}
+    for key, value in data.items():
+        if key == "fee_in_base_currency":
+            kwargs[key] = _to_bool(key, value)
+        elif key in _DECIMAL_FIELDS:
+            kwargs[key] = _to_decimal(key, value)
+        elif key == "fee_schedule":
+            kwargs[key] = _to_fee_schedule(key, value)
+        else:
+            raise ValueError(f"unknown symbol info field {key}.")
+    return SymbolInfo(**kwargs)
+
+
+def _to_bool(key: str, value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.lower() in _BOOLEANS:
+        return _BOOLEANS[value.lower()]
+    raise ValueError(f"{key} must be a boolean, got {value!r}.")
+
+
+def _to_fee_schedule(key: str, value: Any) -> FeeSchedule:
+    if (
+        not isinstance(value, Mapping)
+        or not set(value) <= {"tiers", "volume"}
+        or not isinstance(value.get("tiers"), list)
+        or not value["tiers"]
+    ):
+        raise ValueError(
+            f"{key} must be an object with non-empty tiers list, got {value!r}."
+        )
+
+    tiers = []
+    for tier in value["tiers"]:
+        if not isinstance(tier, Mapping) or set(tier) != set(_TIER_FIELDS):
+            raise ValueError(
+                f"{key} tier must have {', '.join(_TIER_FIELDS)} fields, got {tier!r}."
+            )
+        tiers.append(
+            FeeTier(
+                **{
+                    name: _to_decimal(f"{key} {name}", tier[name])
+                    for name in _TIER_FIELDS
+                }
+            )
+        )
+    return FeeSchedule(tiers, _to_decimal(f"{key} volume", value.get("volume", 0)))
+
+
+def _to_decimal(key: str, value: Any) -> Decimal:
+    if isinstance(value, float):
+        raise TypeError(f"{key} must be a string, got float {value}.")
+    if isinstance(value, bool) or not isinstance(value, str | int):
+        raise TypeError(f"{key} must be a number, got {value!r}.")
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        raise ValueError(f"{key} must be a number, got {value!r}.") from None
+
+
+class SymbolRegistry:
+    """Registry of :class:`SymbolInfo` per (venue, symbol) loaded from JSON files.
+
+    Every `{venue}.json` file in `directory` maps symbol names to exchange filters,
+    see :func:`symbol_info_from_dict`. Equal :class:`SymbolInfo` are interned,
+    so the same instance is returned for the same filters even after reload.
+
+    :meth:`reload` re-reads changed files and replaces all symbols at once,
+    then increments :attr:`version`, so derived data can be invalidated
+    by comparing a single number.
+
+    Args:
+        directory: directory with JSON files.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self._directory = Path(directory)
+        self._interned: dict[SymbolInfo, SymbolInfo] = {}
+        self._stats: dict[Path, tuple[int, int]] = {}
+        self._venues: dict[str, dict[str, SymbolInfo]] = {}
+        self.version = 0
+        self.reload()
+
+    def get(self, venue: str, symbol: str) -> SymbolInfo:
+        """Returns info about `symbol` on `venue`.
+
+        Raises:
+            KeyError: if symbol is unknown.
+        """
+
+        return self._venues[venue][symbol]
+
+    def venues(self) -> list[str]:
+        """Returns names of loaded venues."""
+
+        return list(self._venues)
+
+    def symbols(self, venue: str) -> dict[str, SymbolInfo]:
+        """Returns infos of all symbols on `venue`."""
+
+        return dict(self._venues[venue])
+
+    def __iter__(self) -> Iterator[tuple[str, str, SymbolInfo]]:
+        venues = self._venues
+        for venue, symbols in venues.items():
+            for symbol, info in symbols.items():
+                yield venue, symbol, info
+
+    def reload(self) -> bool:
+        """Reloads changed, added and removed files.
+
+        Symbols are replaced only if every changed file is loaded successfully.
+
+        Returns:
+            True if symbols were changed.
+
+        Raises:
+            TypeError: if file is not a JSON object or filters have invalid types.
+            ValueError: if file contains invalid filters.
+        """
+
+        stats = {}
+        for path in self._directory.glob("*.json"):
+            stat = path.stat()
+            stats[path] = (stat.st_mtime_ns, stat.st_size)
+        if stats == self._stats:
+            return False
+
+        venues = {
+            path.stem: self._venues.get(path.stem, {})
+            for path in stats
+            if self._stats.get(path) == stats[path]
+        }
+        for path in stats:
+            if path.stem not in venues:
+                venues[path.stem] = self._load_venue(path)
+
+        self._venues = venues
+        self._stats = stats
+        # Forget infos which are not used anymore, so reloads do not grow memory.
+        self._interned = {
+            info: info for symbols in venues.values() for info in symbols.values()
+        }
+        self.version += 1
+        return True
+
+    def _load_venue(self, path: Path) -> dict[str, SymbolInfo]:
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        if not isinstance(data, Mapping):
+            raise TypeError(
+                f"{path} must map symbol names to filters, got {type(data).__name__}."
+            )
+
+        symbols = {}
+        for symbol, filters in data.items():
+            info = symbol_info_from_dict(filters)
+            symbols[symbol] = self._interned.setdefault(info, info)
+        return symbols
@@ -0,0 +1,255 @@
+import os
+import sys
+import time
+from collections.abc import Sequence
+from decimal import Decimal
+from multiprocessing import resource_tracker, shared_memory
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from arbitragepy.models import OrderInfo
+from arbitragepy.parsing import to_scaled
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+_MAGIC = 0x41524251  # "ARBQ"
+_HEADER_SIZE = 3  # magic, scale, count of slots
+_SLOT_SIZE = 5  # sequence, ask price, ask quantity, bid price, bid quantity
+_EMPTY = -1
+_MIN_INT64 = -(2**63)
+_MAX_INT64 = 2**63 - 1
+_SPINS_PER_CLOCK_CHECK = 1000
+
+_created_blocks: set[str] = set()
+"""Names of blocks created by this process."""
+
+
+class SharedQuoteTable:
+    """Table of best orders per (venue, symbol) in shared memory.
+
+    Prices and quantities are stored as fixed-point int64 values.
+    Every slot is guarded by a sequence number (seqlock): the single writer
+    makes it odd while the slot is being changed and readers retry
+    until they read the same even number before and after the values.
+    Values are checked before the slot is changed, so a failed write
+    leaves it unchanged, and readers give up after a timeout if the writer
+    died in the middle of a write. So one process can update quotes while many processes read them
+    without locks and without copying data through pipes.
+
+    Use :meth:`create` in the writer process and :meth:`attach` in readers,
+    all processes must pass the same `keys`.
+
+    Args:
+        shm: shared memory block.
+        keys: (venue, symbol) of every slot.
+        scale: count of stored fractional digits.
+    """
+
+    def __init__(
+        self,
+        shm: shared_memory.SharedMemory,
+        keys: Sequence[tuple[str, str]],
+        scale: int,
+    ) -> None:
+        self._shm = shm
+        self._values = shm.buf.cast("q")
+        self._scale = scale
+        self._slots = {key: _HEADER_SIZE + i * _SLOT_SIZE for i, key in enumerate(keys)}
+
+    @classmethod
+    def create(
+        cls, keys: Sequence[tuple[str, str]], scale: int = 8, name: str | None = None
+    ) -> "SharedQuoteTable":
+        """Creates shared memory block for `keys`, all quotes are empty.
+
+        Args:
+            keys: (venue, symbol) of every slot.
+            scale: count of stored fractional digits. Defaults to 8.
+            name: shared memory block name. Defaults to random name.
+        """
+
+        size = (_HEADER_SIZE + len(keys) * _SLOT_SIZE) * 8
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _created_blocks.add(shm.name)
+        table = cls(shm, keys, scale)
+        values = table._values
+        values[0] = _MAGIC
+        values[1] = scale
+        values[2] = len(keys)
+        for slot in table._slots.values():
+            values[slot] = 0
+            for i in range(1, _SLOT_SIZE):
+                values[slot + i] = _EMPTY
+        return table
+
+    @classmethod
+    def attach(cls, name: str, keys: Sequence[tuple[str, str]]) -> "SharedQuoteTable":
+        """Attaches to shared memory block created by :meth:`create`.
+
+        Raises:
+            ValueError: if block is not a quote table for `keys`.
+        """
+
+        # Readers do not own the block, so it must not be unlinked on their exit.
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            if os.name == "posix" and shm.name not in _created_blocks:
+                resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        values = shm.buf.cast("q")
+        magic, scale, count = values[0], values[1], values[2]
+        values.release()
+        if magic != _MAGIC or count != len(keys):
+            shm.close()
+            raise ValueError(f"{name} is not a quote table for given keys.")
+        return cls(shm, keys, scale)
+
+    @property
+    def name(self) -> str:
+        """Shared memory block name."""
+
+        return self._shm.name
+
+    def write(
+        self, venue: str, symbol: str, ask: OrderInfo | None, bid: OrderInfo | None
+    ) -> None:
+        """Updates best orders of `symbol` on `venue`. Must be called by one process only.
+
+        Raises:
+            ValueError: if a value does not fit in int64 with the table scale.
+        """
+
+        scale = self._scale
+        ask_price = ask_quantity = bid_price = bid_quantity = _EMPTY
+        if ask is not None:
+            ask_price = to_scaled(ask.price, scale)
+            ask_quantity = to_scaled(ask.quantity, scale)
+        if bid is not None:
+            bid_price = to_scaled(bid.price, scale)
+            bid_quantity = to_scaled(bid.quantity, scale)
+
+        self.write_scaled(
+            venue, symbol, ask_price, ask_quantity, bid_price, bid_quantity
+        )
+
+    def write_scaled(
+        self,
+        venue: str,
+        symbol: str,
+        ask_price: int,
+        ask_quantity: int,
+        bid_price: int,
+        bid_quantity: int,
+    ) -> None:
+        """Updates best orders with fixed-point values. -1 quantity means no order.
+
+        Raises:
+            ValueError: if a value does not fit in int64.
+        """
+
+        quote = (ask_price, ask_quantity, bid_price, bid_quantity)
+        for value in quote:
+            if not _MIN_INT64 <= value <= _MAX_INT64:
+                raise ValueError(f"{value} does not fit in int64.")
+
+        values = self._values
+        slot = self._slots[(venue, symbol)]
+        values[slot] += 1
+        values[slot + 1] = ask_price
+        values[slot + 2] = ask_quantity
+        values[slot + 3] = bid_price
+        values[slot + 4] = bid_quantity
+        values[slot] += 1
+
+    def read_scaled(
+        self, venue: str, symbol: str, timeout: float = 1.0
+    ) -> tuple[int, int, int, int]:
+        """Returns consistent fixed-point ask price, ask quantity, bid price and bid quantity.
+
+        Args:
+            venue: exchange name.
+            symbol: symbol name.
+            timeout: seconds to wait for the writer to finish a write. Defaults to 1.
+
+        Raises:
+            TimeoutError: if the slot is being written longer than `timeout`,
+                like after the writer died in the middle of a write.
+        """
+
+        values = self._values
+        slot = self._slots[(venue, symbol)]
+        spins = 0
+        deadline = None
+        while True:
+            sequence = values[slot]
+            if not sequence & 1:
+                quote = (
+                    values[slot + 1],
+                    values[slot + 2],
+                    values[slot + 3],
+                    values[slot + 4],
+                )
+                if values[slot] == sequence:
+                    return quote
+
+            spins += 1
+            if spins % _SPINS_PER_CLOCK_CHECK == 0:
+                now = time.monotonic()
+                if deadline is None:
+                    deadline = now + timeout
+                elif now > deadline:
+                    raise TimeoutError(
+                        f"quote of {symbol} on {venue} is being written"
+                        f" longer than {timeout}s."
+                    )
+
+    def read(
+        self, venue: str, symbol: str, timeout: float = 1.0
+    ) -> tuple[OrderInfo | None, OrderInfo | None]:
+        """Returns consistent best ask and bid orders of `symbol` on `venue`.
+
+        Raises:
+            TimeoutError: see :meth:`read_scaled`.
+        """
+
+        ask_price, ask_quantity, bid_price, bid_quantity = self.read_scaled(
+            venue, symbol, timeout
+        )
+        scale = -self._scale
+        ask = bid = None
+        if ask_quantity != _EMPTY:
+            ask = OrderInfo(
+                price=Decimal(ask_price).scaleb(scale),
+                quantity=Decimal(ask_quantity).scaleb(scale),
+            )
+        if bid_quantity != _EMPTY:
+            bid = OrderInfo(
+                price=Decimal(bid_price).scaleb(scale),
+                quantity=Decimal(bid_quantity).scaleb(scale),
+            )
+        return ask, bid
+
+    def close(self) -> None:
+        """Detaches from shared memory block."""
+
+        self._values.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroys shared memory block. Must be called by the creator once."""
+
+        self._shm.unlink()
+        _created_blocks.discard(self._shm.name)
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,221 @@
+import itertools
+import random
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Protocol
+
+from arbitragepy.models import ArbitrageResult, OrderInfo, SymbolInfo
+from arbitragepy.quantity_increment import to_compatible_quantity_increment
+
+
+class FillModel(Protocol):
+    """Decides which part of every order book level is still available
+    when our order reaches the exchange.
+    """
+
+    def __call__(self, rng: random.Random, levels: int) -> Sequence[Decimal]:
+        """Returns available fraction (from 0 to 1) for each of `levels` levels."""
+
+
+@dataclass(frozen=True)
+class RandomFillModel:
+    """Stochastic fill model.
+
+    Every level vanishes with `vanish_probability`,
+    otherwise a uniformly distributed fraction between
+    `min_fill_ratio` and 1 of its quantity is available.
+
+    Args:
+        vanish_probability: probability that level is fully taken by somebody else.
+        min_fill_ratio: min available fraction of not vanished level. Defaults to 1.
+    """
+
+    vanish_probability: float
+    min_fill_ratio: Decimal = Decimal(1)
+
+    def __call__(self, rng: random.Random, levels: int) -> list[Decimal]:
+        fractions = []
+        for _ in range(levels):
+            if rng.random() < self.vanish_probability:
+                fractions.append(Decimal(0))
+            else:
+                ratio = Decimal(rng.randrange(10001)) / 10000
+                fractions.append(
+                    self.min_fill_ratio + (1 - self.min_fill_ratio) * ratio
+                )
+        return fractions
+
+
+class ScriptedFillModel:
+    """Fill model which replays `scenarios` in a loop.
+
+    Args:
+        scenarios: available fractions for each level. Missing levels are fully available.
+    """
+
+    def __init__(self, scenarios: Iterable[Sequence[Decimal]]) -> None:
+        self._scenarios = itertools.cycle(list(scenarios))
+
+    def __call__(self, rng: random.Random, levels: int) -> list[Decimal]:
+        fractions = list(next(self._scenarios))[:levels]
+        fractions.extend([Decimal(1)] * (levels - len(fractions)))
+        return fractions
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """Distribution of realized profit.
+
+    Args:
+        profits: realized profit of every scenario.
+        mean_profit: mean realized profit.
+        value_at_risk: loss which is not exceeded with the requested confidence.
+            Zero if the quantile is not a loss.
+        loss_probability: share of scenarios with negative profit.
+        mean_unhedged_quantity: mean base currency quantity
+            which was bought but could not be sold.
+    """
+
+    profits: tuple[Decimal, ...]
+    mean_profit: Decimal
+    value_at_risk: Decimal
+    loss_probability: Decimal
+    mean_unhedged_quantity: Decimal
+
+
+def simulate_execution(
+    ask_symbol: SymbolInfo,
+    ask_levels: Sequence[OrderInfo],
+    bid_symbol: SymbolInfo,
+    bid_levels: Sequence[OrderInfo],
+    planned: ArbitrageResult,
+    fill_model: FillModel,
+    bid_fill_model: FillModel | None = None,
+    scenarios: int = 1000,
+    confidence: Decimal = Decimal("0.95"),
+    seed: int | None = None,
+) -> SimulationResult:
+    """Estimates realized profit of `planned` arbitrage when order book changes
+    during order delivery.
+
+    In every scenario the fill model decides which part of each level survived.
+    Ask order walks the ask ladder up to planned ask quantity,
+    then bid order sells what was received up to planned bid quantity.
+    Quantities are aligned to quantity increments and fees
+    are taken the same way as in :func:`arbitragepy.arbitrage`.
+    Base currency which could not be sold is carried at cost.
+
+    Args:
+        ask_symbol: info about symbol on ask exchange.
+        ask_levels: ask exchange levels from the best price.
+        bid_symbol: info about symbol on bid exchange.
+        bid_levels: bid exchange levels from the best price.
+        planned: result of :func:`arbitragepy.arbitrage` to execute.
+        fill_model: fill model of ask exchange levels.
+        bid_fill_model: fill model of bid exchange levels.
+            Defaults to `fill_model`.
+        scenarios: count of Monte Carlo scenarios. Defaults to 1000.
+        confidence: value at risk confidence level. Defaults to 0.95.
+        seed: random generator seed.
+
+    Returns:
+        Realized profit distribution.
+    """
+
+    if bid_fill_model is None:
+        bid_fill_model = fill_model
+
+    rng = random.Random(seed)
+    ask_qty_inc = ask_symbol.quantity_increment
+    bid_qty_inc = bid_symbol.quantity_increment
+    ask_fee_rate = ask_symbol.taker_fee / 100
+    bid_fee_rate = bid_symbol.taker_fee / 100
+    ask_fee_in_base_currency = ask_symbol.fee_in_base_currency
+    planned_ask_quantity = planned.ask_order.quantity
+    planned_bid_quantity = planned.bid_order.quantity
+
+    ask_prices = [level.price for level in ask_levels]
+    ask_quantities = [level.quantity for level in ask_levels]
+    bid_prices = [level.price for level in bid_levels]
+    bid_quantities = [level.quantity for level in bid_levels]
+
+    profits = []
+    unhedged_quantity = Decimal(0)
+    for _ in range(scenarios):
+        ask_quantity, ask_notional = _take_liquidity(
+            ask_prices,
+            ask_quantities,
+            fill_model(rng, len(ask_prices)),
+            planned_ask_quantity,
+            ask_qty_inc,
+        )
+        if ask_fee_in_base_currency:
+            received_quantity = ask_quantity - ask_quantity * ask_fee_rate
+            ask_cost = ask_notional
+        else:
+            received_quantity = ask_quantity
+            ask_cost = ask_notional + ask_notional * ask_fee_rate
+
+        bid_quantity, bid_notional = _take_liquidity(
+            bid_prices,
+            bid_quantities,
+            bid_fill_model(rng, len(bid_prices)),
+            min(received_quantity, planned_bid_quantity),
+            bid_qty_inc,
+        )
+        bid_proceeds = bid_notional - bid_notional * bid_fee_rate
+
+        if received_quantity:
+            ask_cost = ask_cost * bid_quantity / received_quantity
+        profits.append(bid_proceeds - ask_cost)
+        unhedged_quantity += received_quantity - bid_quantity
+
+    return _summarize(profits, unhedged_quantity, confidence)
+
+
+def _take_liquidity(
+    prices: Sequence[Decimal],
+    quantities: Sequence[Decimal],
+    fractions: Sequence[Decimal],
+    quantity: Decimal,
+    qty_inc: Decimal,
+) -> tuple[Decimal, Decimal]:
+    """Returns filled quantity and notional value of order for `quantity`."""
+
+    available = [q * f for q, f in zip(quantities, fractions)]
+    quantity = to_compatible_quantity_increment(
+        min(quantity, sum(available, Decimal(0))), qty_inc
+    )
+
+    remaining = quantity
+    notional = Decimal(0)
+    for price, level_quantity in zip(prices, available):
+        if not remaining:
+            break
+        taken = min(remaining, level_quantity)
+        notional += taken * price
+        remaining -= taken
+
+    return quantity, notional
+
+
+def _summarize(
+    profits: list[Decimal], unhedged_quantity: Decimal, confidence: Decimal
+) -> SimulationResult:
+    count = len(profits)
+    if not count:
+        zero = Decimal(0)
+        return SimulationResult((), zero, zero, zero, zero)
+
+    ordered = sorted(profits)
+    quantile = ordered[min(int((1 - confidence) * count), count - 1)]
+    losses = sum(1 for profit in profits if profit < 0)
+
+    return SimulationResult(
+        profits=tuple(profits),
+        mean_profit=sum(profits, Decimal(0)) / count,
+        value_at_risk=max(-quantile, Decimal(0)),
+        loss_probability=Decimal(losses) / count,
+        mean_unhedged_quantity=unhedged_quantity / count,
+    )
@@ -0,0 +1,284 @@
+import time
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass
+
+from arbitragepy.models import OrderInfo
+from arbitragepy.reactor import ArbitrageReactor, PairContext
+
+
+class TimerWheel:
+    """Hierarchical timer wheel of keys with integer tick deadlines.
+
+    Level `i` has `2 ** slot_bits` slots of `2 ** (slot_bits * i)` ticks.
+    A key is stored in the lowest level whose slot holds its deadline,
+    and is moved one level down when time reaches its slot, so scheduling,
+    rescheduling, cancelling and expiring a key take O(1) amortized time
+    whatever the number of keys. Deadlines beyond the top level wait in
+    an overflow bucket which is rechecked once per top level turn.
+
+    Args:
+        slot_bits: log2 of slots per level. Defaults to 6.
+        levels: count of levels. Defaults to 4.
+        now: current tick. Defaults to 0.
+    """
+
+    def __init__(self, slot_bits: int = 6, levels: int = 4, now: int = 0) -> None:
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._levels = levels
+        self._wheels: list[list[dict[Hashable, int]]] = [
+            [{} for _ in range(1 << slot_bits)] for _ in range(levels)
+        ]
+        self._overflow: dict[Hashable, int] = {}
+        self._due: dict[Hashable, int] = {}
+        self._slots: dict[Hashable, dict[Hashable, int]] = {}
+        self.now = now
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._slots
+
+    def schedule(self, key: Hashable, deadline: int) -> None:
+        """Schedules or reschedules `key` to expire at `deadline` tick."""
+
+        self.cancel(key)
+        self._insert(key, deadline)
+
+    def cancel(self, key: Hashable) -> None:
+        """Removes `key` from the wheel if it is scheduled."""
+
+        slot = self._slots.pop(key, None)
+        if slot is not None:
+            del slot[key]
+
+    def advance(self, now: int) -> list[Hashable]:
+        """Moves time to `now` tick and returns keys with deadline not after it."""
+
+        expired: list[Hashable] = []
+        bits = self._bits
+        mask = self._mask
+        wheels = self._wheels
+        while self.now < now:
+            if not self._slots:
+                self.now = now
+                break
+            self.now = current = self.now + 1
+
+            level = 0
+            while level + 1 < self._levels and (current >> (bits * level)) & mask == 0:
+                level += 1
+                self._cascade(wheels[level][(current >> (bits * level)) & mask])
+            if level + 1 == self._levels and current >> (bits * level) & mask == 0:
+                self._cascade(self._overflow)
+
+            slot = wheels[0][current & mask]
+            if slot:
+                for key in slot:
+                    del self._slots[key]
+                expired.extend(slot)
+                slot.clear()
+
+        # Keys scheduled in the past and keys cascaded exactly at their deadline.
+        if self._due:
+            for key in self._due:
+                del self._slots[key]
+            expired.extend(self._due)
+            self._due.clear()
+        return expired
+
+    def _cascade(self, slot: dict[Hashable, int]) -> None:
+        entries = list(slot.items())
+        slot.clear()
+        for key, deadline in entries:
+            del self._slots[key]
+            self._insert(key, deadline)
+
+    def _insert(self, key: Hashable, deadline: int) -> None:
+        now = self.now
+        if deadline <= now:
+            slot = self._due
+        else:
+            bits = self._bits
+            for level in range(self._levels):
+                shift = bits * (level + 1)
+                if deadline >> shift == now >> shift:
+                    slot = self._wheels[level][
+                        (deadline >> (bits * level)) & self._mask
+                    ]
+                    break
+            else:
+                slot = self._overflow
+        slot[key] = deadline
+        self._slots[key] = slot
+
+
+@dataclass(frozen=True)
+class VenueStaleness:
+    """Staleness statistics of one venue.
+
+    Args:
+        updates: count of received quotes.
+        expirations: count of quotes withdrawn because of age.
+        live: count of symbols with not expired quote.
+        mean_update_interval_ns: mean time between updates of the same symbol.
+        max_update_interval_ns: max time between updates of the same symbol.
+    """
+
+    updates: int
+    expirations: int
+    live: int
+    mean_update_interval_ns: float
+    max_update_interval_ns: int
+
+
+class _VenueCounters:
+    __slots__ = (
+        "expirations",
+        "interval_sum",
+        "intervals",
+        "live",
+        "max_interval",
+        "updates",
+    )
+
+    def __init__(self) -> None:
+        self.updates = 0
+        self.expirations = 0
+        self.live = 0
+        self.intervals = 0
+        self.interval_sum = 0
+        self.max_interval = 0
+
+
+class QuoteStalenessIndex:
+    """Timestamped quote store which withdraws old quotes from :class:`ArbitrageReactor`.
+
+    Every quote expires `max_age_ns` after its timestamp. Expiry deadlines are kept
+    in a :class:`TimerWheel`, so :meth:`expire` costs O(1) amortized per quote
+    instead of scanning all quotes. Expired quotes are cleared in the reactor,
+    so their pairs get no result and are removed from reactor rankings
+    and best pairs until a fresh quote arrives.
+
+    Args:
+        reactor: reactor which receives quotes.
+        max_age_ns: max quote age in nanoseconds, for all venues or per venue.
+        tick_ns: timer resolution in nanoseconds. Quotes expire
+            up to one tick late. Defaults to 1 ms.
+        clock: returns current time in nanoseconds. Defaults to `time.monotonic_ns`.
+
+    Raises:
+        KeyError: by :meth:`update_quote` if `max_age_ns` mapping has no venue.
+    """
+
+    def __init__(
+        self,
+        reactor: ArbitrageReactor,
+        max_age_ns: int | Mapping[str, int],
+        tick_ns: int = 1_000_000,
+        clock: Callable[[], int] = time.monotonic_ns,
+    ) -> None:
+        self._reactor = reactor
+        self._max_age_ns = max_age_ns
+        self._tick_ns = tick_ns
+        self._clock = clock
+        self._wheel = TimerWheel(now=clock() // tick_ns)
+        self._timestamps: dict[tuple[str, str], int] = {}
+        self._counters: dict[str, _VenueCounters] = {}
+
+    def update_quote(
+        self,
+        venue: str,
+        symbol: str,
+        ask: OrderInfo | None,
+        bid: OrderInfo | None,
+        timestamp_ns: int | None = None,
+    ) -> list[PairContext]:
+        """Stores quote, schedules its expiry and passes it to the reactor.
+
+        Args:
+            venue: exchange name.
+            symbol: symbol name.
+            ask: best ask order. None if there are no asks.
+            bid: best bid order. None if there are no bids.
+            timestamp_ns: quote time on `clock` scale. Defaults to current time.
+
+        Returns:
+            Re-evaluated pairs.
+        """
+
+        if timestamp_ns is None:
+            timestamp_ns = self._clock()
+        max_age_ns = self._max_age_ns
+        if not isinstance(max_age_ns, int):
+            max_age_ns = max_age_ns[venue]
+
+        key = (venue, symbol)
+        counters = self._counters.get(venue)
+        if counters is None:
+            counters = self._counters[venue] = _VenueCounters()
+        counters.updates += 1
+        previous = self._timestamps.get(key)
+        if previous is not None:
+            interval = timestamp_ns - previous
+            counters.intervals += 1
+            counters.interval_sum += interval
+            counters.max_interval = max(counters.max_interval, interval)
+        if key not in self._wheel:
+            counters.live += 1
+        self._timestamps[key] = timestamp_ns
+
+        tick_ns = self._tick_ns
+        self._wheel.schedule(key, -(-(timestamp_ns + max_age_ns) // tick_ns))
+        return self._reactor.update_quote(venue, symbol, ask, bid)
+
+    def expire(self, now_ns: int | None = None) -> list[PairContext]:
+        """Withdraws quotes older than max age.
+
+        Args:
+            now_ns: current time. Defaults to `clock` time.
+
+        Returns:
+            Re-evaluated pairs of withdrawn quotes.
+        """
+
+        if now_ns is None:
+            now_ns = self._clock()
+
+        evaluated = []
+        for key in self._wheel.advance(now_ns // self._tick_ns):
+            venue, symbol = key
+            counters = self._counters[venue]
+            counters.expirations += 1
+            counters.live -= 1
+            evaluated.extend(self._reactor.update_quote(venue, symbol, None, None))
+        return evaluated
+
+    def is_live(self, venue: str, symbol: str) -> bool:
+        """Returns True if quote of `symbol` on `venue` has not expired."""
+
+        return (venue, symbol) in self._wheel
+
+    def timestamp(self, venue: str, symbol: str) -> int | None:
+        """Returns timestamp of the last quote of `symbol` on `venue`."""
+
+        return self._timestamps.get((venue, symbol))
+
+    def stats(self) -> dict[str, VenueStaleness]:
+        """Returns staleness statistics per venue."""
+
+        return {
+            venue: VenueStaleness(
+                updates=counters.updates,
+                expirations=counters.expirations,
+                live=counters.live,
+                mean_update_interval_ns=(
+                    counters.interval_sum / counters.intervals
+                    if counters.intervals
+                    else 0.0
+                ),
+                max_update_interval_ns=counters.max_interval,
+            )
+            for venue, counters in self._counters.items()
+        }
@@ -0,0 +1,206 @@
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, replace
+from decimal import Decimal
+from itertools import accumulate, product
+from typing import TYPE_CHECKING, Any
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.exceptions import ArbitrageError
+from arbitragepy.models import ArbitragePayload, SymbolInfo
+from arbitragepy.quantity_increment import is_compatible_quantity_increments
+
+if TYPE_CHECKING:
+    from arbitragepy.parallel import ConcurrentEvaluator
+
+SWEEP_AXES = ("ask_fee", "bid_fee", "ask_balance", "bid_balance", "min_spread")
+"""Names of parameters which can be swept, in grid order."""
+
+
+@dataclass(frozen=True)
+class SweepCell:
+    """Outcome of all opportunities for one combination of parameters.
+
+    Args:
+        params: parameter values by axis name.
+        opportunities: count of opportunities with positive profit
+            and spread not less than `min_spread`.
+        profit: total profit of these opportunities.
+        rejected: count of pairs rejected by arbitrage,
+            like pairs which size to zero quantity.
+    """
+
+    params: dict[str, Any]
+    opportunities: int
+    profit: Decimal
+    rejected: int
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """Labeled grid of sweep outcomes.
+
+    Cells are stored in row-major order of `axes`,
+    the last axis changes fastest.
+
+    Args:
+        axes: swept axis names and their values.
+        cells: outcome of every combination of axis values.
+    """
+
+    axes: dict[str, tuple[Any, ...]]
+    cells: list[SweepCell]
+
+    def __iter__(self) -> Iterator[SweepCell]:
+        return iter(self.cells)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def cell(self, **params: Any) -> SweepCell:
+        """Returns outcome of combination given as axis name to value.
+
+        Raises:
+            KeyError: if a swept axis is missing.
+            ValueError: if a value is not on its axis.
+        """
+
+        index = 0
+        for name, values in self.axes.items():
+            index = index * len(values) + values.index(params[name])
+        return self.cells[index]
+
+
+def sweep(
+    pairs: Sequence[tuple[ArbitragePayload, ArbitragePayload]],
+    ask_fees: Sequence[Decimal] | None = None,
+    bid_fees: Sequence[Decimal] | None = None,
+    ask_balances: Sequence[Decimal | None] | None = None,
+    bid_balances: Sequence[Decimal | None] | None = None,
+    min_spreads: Sequence[Decimal] | None = None,
+    make_compatible_quantity_increments: bool = True,
+    evaluator: "ConcurrentEvaluator | None" = None,
+) -> SweepResult:
+    """Evaluates opportunities for every combination of parameter values.
+
+    A parameter given as None is not swept and keeps the value of each pair.
+    Parts of the calculation which do not depend on a parameter are shared:
+
+    - symbols with replaced fee are built once per symbol and fee value,
+      and reused for all balances;
+    - pairs with incompatible quantity increments are rejected once;
+    - arbitrage runs once per fee and balance combination,
+      spread thresholds only filter its results sorted by spread,
+      so each threshold costs one binary search.
+
+    Args:
+        pairs: recorded ask and bid payloads.
+        ask_fees: fees in percent of ask symbols.
+        bid_fees: fees in percent of bid symbols.
+        ask_balances: quote currency balances on ask exchange.
+        bid_balances: base currency balances on bid exchange.
+        min_spreads: min spreads in percent of counted opportunities.
+        make_compatible_quantity_increments: passed to :func:`arbitragepy.arbitrage`.
+            Defaults to True.
+        evaluator: evaluates each combination as one batch in a thread pool
+            with `make_compatible_quantity_increments` of this call.
+            Defaults to None which means evaluation in the calling thread.
+
+    Returns:
+        Labeled grid of outcomes.
+    """
+
+    grids = dict(
+        zip(SWEEP_AXES, (ask_fees, bid_fees, ask_balances, bid_balances, min_spreads))
+    )
+    axes = {name: tuple(values) for name, values in grids.items() if values is not None}
+
+    incompatible = 0
+    if make_compatible_quantity_increments:
+        count = len(pairs)
+        pairs = [
+            (ask, bid)
+            for ask, bid in pairs
+            if is_compatible_quantity_increments(
+                ask.symbol.quantity_increment, bid.symbol.quantity_increment
+            )
+        ]
+        incompatible = count - len(pairs)
+
+    symbols: dict[tuple[SymbolInfo, Decimal], SymbolInfo] = {}
+
+    def with_fee(symbol: SymbolInfo, fee: Decimal | None) -> SymbolInfo:
+        if fee is None:
+            return symbol
+        key = (symbol, fee)
+        replaced = symbols.get(key)
+        if replaced is None:
+            replaced = symbols[key] = replace(symbol, fee=fee, fee_schedule=None)
+        return replaced
+
+    thresholds = axes.get("min_spread", (None,))
+    evaluated_names = [name for name in axes if name != "min_spread"]
+    cells = []
+    for combination in product(*(axes[name] for name in evaluated_names)):
+        params = dict(zip(evaluated_names, combination))
+        ask_fee = params.get("ask_fee")
+        bid_fee = params.get("bid_fee")
+        batch = [
+            (
+                ArbitragePayload(
+                    symbol=with_fee(ask.symbol, ask_fee),
+                    order=ask.order,
+                    balance=params.get("ask_balance", ask.balance),
+                ),
+                ArbitragePayload(
+                    symbol=with_fee(bid.symbol, bid_fee),
+                    order=bid.order,
+                    balance=params.get("bid_balance", bid.balance),
+                ),
+            )
+            for ask, bid in pairs
+        ]
+
+        if evaluator is not None:
+            results = evaluator.evaluate(batch, make_compatible_quantity_increments)
+        else:
+            results = []
+            for ask, bid in batch:
+                try:
+                    results.append(
+                        arbitrage(ask, bid, make_compatible_quantity_increments)
+                    )
+                except ArbitrageError as e:
+                    results.append(e)
+
+        rejected = incompatible + sum(
+            isinstance(result, ArbitrageError) for result in results
+        )
+        profitable = sorted(
+            (result.spread, result.profit)
+            for result in results
+            if not isinstance(result, ArbitrageError) and result.profit > 0
+        )
+        spreads = [spread for spread, _ in profitable]
+        # Profit of opportunities from i-th to the last one.
+        suffix_profits = list(
+            accumulate(
+                (profit for _, profit in reversed(profitable)), initial=Decimal(0)
+            )
+        )[::-1]
+
+        for min_spread in thresholds:
+            start = 0 if min_spread is None else bisect_left(spreads, min_spread)
+            cell_params = dict(params)
+            if min_spread is not None:
+                cell_params["min_spread"] = min_spread
+            cells.append(
+                SweepCell(
+                    params=cell_params,
+                    opportunities=len(spreads) - start,
+                    profit=suffix_profits[start],
+                    rejected=rejected,
+                )
+            )
+
+    return SweepResult(axes=axes, cells=cells)
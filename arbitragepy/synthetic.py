@@ -0,0 +1,383 @@
+import json
+import random
+import struct
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, BinaryIO, TextIO
+
+from arbitragepy.models import OrderInfo, SymbolInfo
+from arbitragepy.parsing import to_scaled
+
+MAGIC = b"ARBQTS01"
+_HEADER = struct.Struct("<8sII")
+_COLUMNS = 5  # market, ask price, ask quantity, bid price, bid quantity
+_TABLE_BITS = 8
+_TABLE_SIZE = 1 << _TABLE_BITS
+_REVERSION_SHIFT = 10
+
+
+@dataclass(frozen=True)
+class SyntheticSymbol:
+    """Parameters of one generated symbol, shared by all venues.
+
+    Args:
+        name: symbol name.
+        info: symbol limits, quantities are divided on its quantity increment
+            and are between its min and max quantity.
+        price: initial mid price.
+        tick_size: price step.
+        volatility: standard deviation of mid price change per event
+            relative to `price`. Defaults to 0.00001.
+        spread_ticks: min and max spread in ticks in calm regime. Defaults to (1, 5).
+        wide_spread_ticks: min and max spread in ticks in wide regime.
+            Defaults to (10, 50).
+        max_quantity_steps: max order quantity in quantity increments
+            above min quantity. Defaults to 1000.
+    """
+
+    name: str
+    info: SymbolInfo
+    price: Decimal
+    tick_size: Decimal
+    volatility: Decimal = Decimal("0.00001")
+    spread_ticks: tuple[int, int] = (1, 5)
+    wide_spread_ticks: tuple[int, int] = (10, 50)
+    max_quantity_steps: int = 1000
+
+
+@dataclass(frozen=True)
+class QuoteBatch:
+    """Columns of generated best orders, prices and quantities are fixed-point numbers.
+
+    Args:
+        market: index of (venue, symbol) in :attr:`MarketGenerator.markets`.
+        ask_price: best ask price.
+        ask_quantity: best ask quantity.
+        bid_price: best bid price.
+        bid_quantity: best bid quantity.
+    """
+
+    market: array
+    ask_price: array
+    ask_quantity: array
+    bid_price: array
+    bid_quantity: array
+
+    def __len__(self) -> int:
+        return len(self.market)
+
+
+class MarketGenerator:
+    """Deterministic generator of best orders on several venues.
+
+    Every symbol has a reference mid price doing a random walk in ticks
+    which slowly reverts to the initial price, so long streams keep
+    realistic prices. Every venue quotes around it with own noise. Spread switches between
+    calm and wide regime, and with `crossed_probability` a quote is shifted
+    beyond the spread, so its bid is higher than asks of other venues
+    (or its ask is lower than their bids).
+
+    Random numbers are drawn from lookup tables filled once from `seed`,
+    so the same `seed` always produces the same stream and an event costs
+    a few integer operations.
+
+    Args:
+        venues: venue names.
+        symbols: symbol parameters.
+        seed: random seed. Defaults to 0.
+        scale: count of fractional digits of fixed-point numbers. Defaults to 8.
+        crossed_probability: probability of crossed quote. Defaults to 0.01.
+        regime_switch_probability: probability that symbol spread regime
+            switches on event. Defaults to 0.001.
+
+    Raises:
+        ValueError: if tick size, quantity increment or min quantity
+            has more fractional digits than `scale`.
+    """
+
+    def __init__(
+        self,
+        venues: Sequence[str],
+        symbols: Sequence[SyntheticSymbol],
+        seed: int = 0,
+        scale: int = 8,
+        crossed_probability: float = 0.01,
+        regime_switch_probability: float = 0.001,
+    ) -> None:
+        self.venues = list(venues)
+        self.symbols = list(symbols)
+        self.scale = scale
+        self.markets = [
+            (venue, symbol.name) for symbol in self.symbols for venue in self.venues
+        ]
+        self._rng = rng = random.Random(seed)
+        self._crossed_probability = crossed_probability
+        self._regime_switch_probability = regime_switch_probability
+
+        self._ticks = [to_scaled(symbol.tick_size, scale) for symbol in symbols]
+        self._mids = [int(symbol.price / symbol.tick_size) for symbol in self.symbols]
+        self._initial_mids = list(self._mids)
+        self._regimes = [0] * len(self.symbols)
+        self._steps = []
+        self._spreads = []
+        self._crossed_shifts = []
+        self._min_mids = []
+        self._quantities = []
+        for symbol in self.symbols:
+            sigma = float(symbol.volatility * symbol.price / symbol.tick_size)
+            self._steps.append([round(rng.gauss(0, sigma)) for _ in range(_TABLE_SIZE)])
+            self._spreads.append(
+                (
+                    [rng.randint(*symbol.spread_ticks) for _ in range(_TABLE_SIZE)],
+                    [
+                        rng.randint(*symbol.wide_spread_ticks)
+                        for _ in range(_TABLE_SIZE)
+                    ],
+                )
+            )
+            # Noise is at most one tick, so shifted bid is above every ask of the regime.
+            self._crossed_shifts.append(
+                (max(symbol.spread_ticks) + 3, max(symbol.wide_spread_ticks) + 3)
+            )
+            self._min_mids.append(4 * max(symbol.wide_spread_ticks) + 4)
+            self._quantities.append(self._quantity_table(symbol))
+        self._noise = [rng.randint(-1, 1) for _ in range(_TABLE_SIZE)]
+
+    def _quantity_table(self, symbol: SyntheticSymbol) -> list[int]:
+        info = symbol.info
+        increment = info.quantity_increment
+        min_steps = max(1, -(-info.min_quantity // increment))
+        max_steps = min_steps + symbol.max_quantity_steps
+        if info.max_quantity.is_finite():
+            max_steps = min(max_steps, int(info.max_quantity // increment))
+        scaled_increment = to_scaled(increment, self.scale)
+        return [
+            self._rng.randint(int(min_steps), max(int(min_steps), max_steps))
+            * scaled_increment
+            for _ in range(_TABLE_SIZE)
+        ]
+
+    def batch(self, size: int) -> QuoteBatch:
+        """Generates `size` quote updates of random markets."""
+
+        rng = self._rng
+        random_ = rng.random
+        bits = rng.getrandbits
+        venue_count = len(self.venues)
+        market_count = len(self.markets)
+        mids = self._mids
+        initial_mids = self._initial_mids
+        regimes = self._regimes
+        ticks = self._ticks
+        steps = self._steps
+        spreads = self._spreads
+        crossed_shifts = self._crossed_shifts
+        min_mids = self._min_mids
+        quantities = self._quantities
+        noise = self._noise
+        crossed_probability = self._crossed_probability
+        switch_probability = self._regime_switch_probability
+
+        market_column = array("q")
+        ask_prices = array("q")
+        ask_quantities = array("q")
+        bid_prices = array("q")
+        bid_quantities = array("q")
+
+        for _ in range(size):
+            market = int(random_() * market_count)
+            s = market // venue_count
+
+            mid = mids[s]
+            mid += steps[s][bits(_TABLE_BITS)] - (
+                (mid - initial_mids[s]) >> _REVERSION_SHIFT
+            )
+            mid = max(mid, min_mids[s])
+            mids[s] = mid
+            if random_() < switch_probability:
+                regimes[s] ^= 1
+
+            regime = regimes[s]
+            spread = spreads[s][regime][bits(_TABLE_BITS)]
+            bid = mid + noise[bits(_TABLE_BITS)] - spread // 2
+            if random_() < crossed_probability:
+                shift = crossed_shifts[s][regime]
+                bid += shift if bits(1) else -shift
+            tick = ticks[s]
+            symbol_quantities = quantities[s]
+
+            market_column.append(market)
+            ask_prices.append((bid + spread) * tick)
+            ask_quantities.append(symbol_quantities[bits(_TABLE_BITS)])
+            bid_prices.append(bid * tick)
+            bid_quantities.append(symbol_quantities[bits(_TABLE_BITS)])
+
+        return QuoteBatch(
+            market=market_column,
+            ask_price=ask_prices,
+            ask_quantity=ask_quantities,
+            bid_price=bid_prices,
+            bid_quantity=bid_quantities,
+        )
+
+    def batches(self, size: int, count: int) -> Iterator[QuoteBatch]:
+        """Yields `count` batches of `size` quote updates."""
+
+        for _ in range(count):
+            yield self.batch(size)
+
+    def ladder(
+        self, symbol: int, depth: int, quantity_steps: int = 1
+    ) -> tuple[list[OrderInfo], list[OrderInfo]]:
+        """Generates L2 order book around current mid price of `symbol`.
+
+        Levels are one tick apart, quantities grow by `quantity_steps`
+        quantity increments per level.
+
+        Args:
+            symbol: index of symbol in :attr:`symbols`.
+            depth: count of levels on every side.
+            quantity_steps: quantity growth per level. Defaults to 1.
+
+        Returns:
+            Ask levels ascending and bid levels descending by price.
+        """
+
+        spec = self.symbols[symbol]
+        tick_size = spec.tick_size
+        spread = self._spreads[symbol][self._regimes[symbol]][
+            self._rng.getrandbits(_TABLE_BITS)
+        ]
+        best_bid = self._mids[symbol] - spread // 2
+        best_ask = best_bid + spread
+        base = Decimal(self._quantities[symbol][0]).scaleb(-self.scale)
+        step = spec.info.quantity_increment * quantity_steps
+
+        asks = [
+            OrderInfo(price=(best_ask + i) * tick_size, quantity=base + i * step)
+            for i in range(depth)
+        ]
+        bids = [
+            OrderInfo(price=(best_bid - i) * tick_size, quantity=base + i * step)
+            for i in range(depth)
+        ]
+        return asks, bids
+
+    def write_symbols(self, directory: str | Path) -> None:
+        """Writes `{venue}.json` files loadable by :class:`arbitragepy.SymbolRegistry`."""
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        symbols = {
+            symbol.name: _symbol_info_to_dict(symbol.info) for symbol in self.symbols
+        }
+        for venue in self.venues:
+            with open(directory / f"{venue}.json", "w", encoding="utf-8") as file:
+                json.dump(symbols, file, indent=2)
+
+    def write_jsonl(self, file: TextIO, batch: QuoteBatch) -> None:
+        """Writes `batch` as quote snapshots accepted by `arbitragepy scan`."""
+
+        scale = -self.scale
+        markets = self.markets
+        for i in range(len(batch)):
+            venue, symbol = markets[batch.market[i]]
+            snapshot = {
+                "venue": venue,
+                "symbol": symbol,
+                "ask": [
+                    str(Decimal(batch.ask_price[i]).scaleb(scale)),
+                    str(Decimal(batch.ask_quantity[i]).scaleb(scale)),
+                ],
+                "bid": [
+                    str(Decimal(batch.bid_price[i]).scaleb(scale)),
+                    str(Decimal(batch.bid_quantity[i]).scaleb(scale)),
+                ],
+            }
+            file.write(json.dumps(snapshot) + "\n")
+
+
+def write_quotes(file: BinaryIO, batches: Iterator[QuoteBatch], scale: int) -> int:
+    """Writes batches as little-endian int64 rows of
+    market, ask price, ask quantity, bid price and bid quantity.
+
+    Returns:
+        Count of written rows.
+    """
+
+    file.write(_HEADER.pack(MAGIC, scale, _COLUMNS))
+    count = 0
+    for batch in batches:
+        rows = array("q", bytes(8 * _COLUMNS * len(batch)))
+        for column, values in enumerate(
+            (
+                batch.market,
+                batch.ask_price,
+                batch.ask_quantity,
+                batch.bid_price,
+                batch.bid_quantity,
+            )
+        ):
+            rows[column::_COLUMNS] = values
+        if sys.byteorder != "little":
+            rows.byteswap()
+        file.write(rows.tobytes())
+        count += len(batch)
+    return count
+
+
+def read_quotes(file: BinaryIO, batch_size: int = 65536) -> Iterator[QuoteBatch]:
+    """Reads batches written by :func:`write_quotes`.
+
+    Raises:
+        ValueError: if file is not a quote file.
+    """
+
+    magic, _, columns = _HEADER.unpack(file.read(_HEADER.size))
+    if magic != MAGIC or columns != _COLUMNS:
+        raise ValueError("not a quote file.")
+
+    while data := file.read(8 * _COLUMNS * batch_size):
+        rows = array("q", data)
+        if sys.byteorder != "little":
+            rows.byteswap()
+        yield QuoteBatch(
+            market=rows[0::_COLUMNS],
+            ask_price=rows[1::_COLUMNS],
+            ask_quantity=rows[2::_COLUMNS],
+            bid_price=rows[3::_COLUMNS],
+            bid_quantity=rows[4::_COLUMNS],
+        )
+
+
+def _symbol_info_to_dict(info: SymbolInfo) -> dict[str, Any]:
+    data: dict[str, Any] = {
+        "quantity_increment": str(info.quantity_increment),
+        "min_quantity": str(info.min_quantity),
+        "min_notional": str(info.min_notional),
+        "fee_in_base_currency": info.fee_in_base_currency,
+        "fee": str(info.fee),
+    }
+    if info.max_quantity.is_finite():
+        data["max_quantity"] = str(info.max_quantity)
+    if info.price_precision is not None:
+        data["price_precision"] = str(info.price_precision)
+    if info.notional_precision is not None:
+        data["notional_precision"] = str(info.notional_precision)
+    if info.fee_schedule is not None:
+        data["fee_schedule"] = {
+            "tiers": [
+                {
+                    "min_volume": str(tier.min_volume),
+                    "maker_fee": str(tier.maker_fee),
+                    "taker_fee": str(tier.taker_fee),
+                }
+                for tier in info.fee_schedule.tiers
+            ],
+            "volume": str(info.fee_schedule.volume),
+        }
+    return data
@@ -0,0 +1,342 @@
+import random
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field, fields
+from decimal import Decimal
+from typing import Any
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.backends import (
+    DECIMAL_BACKEND,
+    NumericBackend,
+    convert_payload,
+    make_arbitrage,
+    result_to_decimal,
+    scaled_backend,
+)
+from arbitragepy.conversion import ConversionRates, cross_arbitrage
+from arbitragepy.exceptions import ArbitrageError
+from arbitragepy.models import (
+    ArbitragePayload,
+    ArbitrageResult,
+    OrderInfo,
+    OrderPayload,
+    SymbolInfo,
+)
+
+Case = tuple[ArbitragePayload, ArbitragePayload]
+
+Outcome = ArbitrageResult | str
+"""Result of arbitrage or name of rejection, see :func:`outcome_of`."""
+
+_INCREMENTS = [
+    Decimal(n) for n in ("0.00001", "0.001", "0.01", "0.05", "0.25", "0.03", "1", "5")
+]
+_PRECISIONS = [Decimal(n) for n in ("0.01", "0.05", "0.0001", "1")]
+
+
+@dataclass(frozen=True)
+class Engine:
+    """Arbitrage implementation verified against :func:`arbitragepy.arbitrage`.
+
+    Args:
+        name: engine name.
+        function: called with converted ask and bid payloads.
+        prepare: converts payload before timing starts. Defaults to None.
+        finish: converts result of `function` to `Decimal` result. Defaults to None.
+        tolerance: max difference of every result value relative
+            to the greater of its magnitude and 1. Defaults to 0.
+    """
+
+    name: str
+    function: Callable[[Any, Any], Any]
+    prepare: Callable[[ArbitragePayload], Any] | None = None
+    finish: Callable[[Any], ArbitrageResult] | None = None
+    tolerance: Decimal = Decimal(0)
+
+
+@dataclass(frozen=True)
+class Mismatch:
+    """Case on which engine outcome differs from the reference.
+
+    Args:
+        index: index of case.
+        ask: ask payload of case.
+        bid: bid payload of case.
+        expected: outcome of reference.
+        actual: outcome of engine.
+    """
+
+    index: int
+    ask: ArbitragePayload
+    bid: ArbitragePayload
+    expected: Outcome
+    actual: Outcome
+
+
+@dataclass(frozen=True)
+class EngineReport:
+    """Verification and throughput of one engine.
+
+    Args:
+        name: engine name.
+        cases: count of evaluated cases.
+        seconds: time spent in engine calls.
+        mismatches: cases with outcome different from the reference.
+    """
+
+    name: str
+    cases: int
+    seconds: float
+    mismatches: list[Mismatch] = field(default_factory=list)
+
+    @property
+    def cases_per_second(self) -> float:
+        return self.cases / self.seconds if self.seconds else float("inf")
+
+
+@dataclass(frozen=True)
+class VerificationReport:
+    """Reports of the reference and every engine.
+
+    Args:
+        reference: report of :func:`arbitragepy.arbitrage`, has no mismatches.
+        engines: reports of engines in registration order.
+    """
+
+    reference: EngineReport
+    engines: list[EngineReport]
+
+    @property
+    def ok(self) -> bool:
+        """True if no engine has mismatches."""
+
+        return not any(report.mismatches for report in self.engines)
+
+    def format(self) -> str:
+        """Returns text table with mismatches and throughput of every engine."""
+
+        lines = [
+            f"{'engine':<16} {'cases':>8} {'mismatches':>10} {'cases/s':>12} {'speedup':>8}"
+        ]
+        for report in [self.reference, *self.engines]:
+            speedup = report.cases_per_second / self.reference.cases_per_second
+            lines.append(
+                f"{report.name:<16} {report.cases:>8} {len(report.mismatches):>10}"
+                f" {report.cases_per_second:>12.0f} {speedup:>7.2f}x"
+            )
+        return "\n".join(lines)
+
+
+def outcome_of(function: Callable[[Any, Any], Any], ask: Any, bid: Any) -> Any:
+    """Calls `function` and returns its result or name of its rejection.
+
+    Rejections of :exc:`ArbitrageError` are named by exception type,
+    arithmetic errors like division of zero notional are all named
+    `"ArithmeticError"` because backends raise different types for them.
+    """
+
+    try:
+        return function(ask, bid)
+    except ArbitrageError as e:
+        return type(e).__name__
+    except ArithmeticError:
+        return "ArithmeticError"
+
+
+def generate_cases(count: int, seed: int = 0, precision: bool = False) -> list[Case]:
+    """Returns random ask and bid payloads for differential verification.
+
+    Cases cover decimal and non-decimal quantity increments, incompatible
+    increments, infinite and finite max quantity, fee in base currency,
+    min limits near order size and missing balances. Prices of most cases
+    are crossed, so both results and rejections are frequent.
+
+    Args:
+        count: count of cases.
+        seed: random seed, same seed gives same cases.
+        precision: if True symbols get price and notional precision.
+            Defaults to False.
+    """
+
+    rng = random.Random(seed)
+
+    def scaled(low: int, high: int, exponent: int = -8) -> Decimal:
+        return Decimal(rng.randint(low, high)).scaleb(exponent)
+
+    def symbol(increment: Decimal) -> SymbolInfo:
+        max_quantity = Decimal("inf")
+        if rng.random() < 0.3:
+            max_quantity = increment * rng.randint(1, 2000)
+        return SymbolInfo(
+            quantity_increment=increment,
+            min_quantity=increment * rng.choice([0, 0, 1, 10, 500]),
+            max_quantity=max_quantity,
+            min_notional=rng.choice([Decimal(0), Decimal(0), scaled(1, 2000, -1)]),
+            fee_in_base_currency=rng.random() < 0.2,
+            fee=scaled(0, 500, -3),
+            price_precision=rng.choice(_PRECISIONS) if precision else None,
+            notional_precision=rng.choice(_PRECISIONS) if precision else None,
+        )
+
+    cases = []
+    for _ in range(count):
+        price = scaled(1, 5 * 10**12)
+        ask_increment = rng.choice(_INCREMENTS)
+        bid_increment = ask_increment
+        if rng.random() < 0.3:
+            bid_increment = rng.choice(_INCREMENTS)
+        bid_price = price + price * scaled(-100, 200, -4) / 100
+        bid_price = bid_price.quantize(Decimal("1e-8"))
+        if bid_price <= 0:
+            bid_price = price
+
+        balances: tuple[Decimal | None, Decimal | None] = (None, None)
+        if rng.random() < 0.7:
+            balances = (scaled(1, 10**14), scaled(1, 10**12))
+        elif rng.random() < 0.5:
+            balances = (scaled(1, 10**14), None)
+
+        cases.append(
+            (
+                ArbitragePayload(
+                    symbol=symbol(ask_increment),
+                    order=OrderInfo(price=price, quantity=scaled(1, 10**12)),
+                    balance=balances[0],
+                ),
+                ArbitragePayload(
+                    symbol=symbol(bid_increment),
+                    order=OrderInfo(price=bid_price, quantity=scaled(1, 10**12)),
+                    balance=balances[1],
+                ),
+            )
+        )
+    return cases
+
+
+def backend_engine(backend: NumericBackend, tolerance: Decimal = Decimal(0)) -> Engine:
+    """Returns engine of :func:`arbitragepy.make_arbitrage` with `backend`."""
+
+    return Engine(
+        name=backend.name,
+        function=make_arbitrage(backend),
+        prepare=lambda payload: convert_payload(payload, backend),
+        finish=lambda result: result_to_decimal(result, backend),
+        tolerance=tolerance,
+    )
+
+
+def cross_arbitrage_engine() -> Engine:
+    """Returns engine of :func:`arbitragepy.cross_arbitrage` with rate 1."""
+
+    rates = ConversionRates()
+
+    def function(ask: ArbitragePayload, bid: ArbitragePayload) -> Any:
+        return cross_arbitrage(ask, bid, "QUOTE", "QUOTE", rates)
+
+    return Engine(
+        name="cross",
+        function=function,
+        finish=lambda result: ArbitrageResult(
+            ask_order=result.ask_order,
+            bid_order=result.bid_order,
+            spread=result.spread,
+            profit=result.profit,
+        ),
+    )
+
+
+def default_engines() -> list[Engine]:
+    """Returns engines of the package which must match the reference."""
+
+    return [
+        backend_engine(DECIMAL_BACKEND),
+        # Rounding down to 8 digits shifts spreads of tiny notional values most.
+        backend_engine(scaled_backend(8), tolerance=Decimal("1e-4")),
+        cross_arbitrage_engine(),
+    ]
+
+
+def verify(
+    cases: Sequence[Case],
+    engines: Sequence[Engine] | None = None,
+    reference: Callable[[ArbitragePayload, ArbitragePayload], ArbitrageResult] = (
+        arbitrage
+    ),
+) -> VerificationReport:
+    """Runs every engine on every case and compares outcomes with the reference.
+
+    Outcomes match if both are the same rejection or both are results
+    whose values differ by at most engine tolerance.
+    Engine calls are timed separately from payload and result conversions.
+
+    Args:
+        cases: ask and bid payloads, see :func:`generate_cases`.
+        engines: verified engines. Defaults to :func:`default_engines`.
+        reference: reference implementation. Defaults to :func:`arbitragepy.arbitrage`.
+
+    Returns:
+        Mismatches and throughput of every engine.
+    """
+
+    if engines is None:
+        engines = default_engines()
+
+    start = time.perf_counter()
+    expected = [outcome_of(reference, ask, bid) for ask, bid in cases]
+    reference_report = EngineReport(
+        name="reference", cases=len(cases), seconds=time.perf_counter() - start
+    )
+
+    reports = []
+    for engine in engines:
+        prepare = engine.prepare
+        prepared = cases
+        if prepare is not None:
+            prepared = [(prepare(ask), prepare(bid)) for ask, bid in cases]
+
+        function = engine.function
+        start = time.perf_counter()
+        outcomes = [outcome_of(function, ask, bid) for ask, bid in prepared]
+        seconds = time.perf_counter() - start
+
+        mismatches = []
+        for index, (outcome, reference_outcome) in enumerate(zip(outcomes, expected)):
+            if engine.finish is not None and not isinstance(outcome, str):
+                outcome = engine.finish(outcome)
+            if not _is_match(reference_outcome, outcome, engine.tolerance):
+                ask, bid = cases[index]
+                mismatches.append(
+                    Mismatch(
+                        index=index,
+                        ask=ask,
+                        bid=bid,
+                        expected=reference_outcome,
+                        actual=outcome,
+                    )
+                )
+        reports.append(
+            EngineReport(
+                name=engine.name,
+                cases=len(cases),
+                seconds=seconds,
+                mismatches=mismatches,
+            )
+        )
+    return VerificationReport(reference=reference_report, engines=reports)
+
+
+def _is_match(expected: Outcome, actual: Outcome, tolerance: Decimal) -> bool:
+    if isinstance(expected, str) or isinstance(actual, str):
+        return expected == actual
+    return all(
+        abs(a - b) <= tolerance * max(abs(a), abs(b), 1)
+        for a, b in zip(_values(expected), _values(actual), strict=True)
+    )
+
+
+def _values(result: ArbitrageResult) -> list[Decimal]:
+    values = [result.spread, result.profit]
+    for order in (result.ask_order, result.bid_order):
+        values.extend(getattr(order, f.name) for f in fields(OrderPayload))
+    return values
@@ -0,0 +1,325 @@
+import struct
+from collections.abc import Iterator, Sequence
+from decimal import MAX_EMAX, MAX_PREC, MIN_EMIN, Context, Decimal
+
+from arbitragepy.enums import OrderSide, RecordKind
+from arbitragepy.exceptions import (
+    ArbitrageError,
+    ImcompabileQuantityIncrementsError,
+    NotionalLessThanMinNotionalError,
+    QuantityLessThanMinQuantityError,
+    ZeroQuantityError,
+)
+from arbitragepy.models import ArbitrageResult, OrderPayload
+
+Outcome = ArbitrageResult | ArbitrageError
+"""Arbitrage result or rejection which can be encoded."""
+
+FIELDS = (
+    "ask_price",
+    "ask_quantity",
+    "ask_notional_value",
+    "ask_taken_fee",
+    "bid_price",
+    "bid_quantity",
+    "bid_notional_value",
+    "bid_taken_fee",
+    "spread",
+    "profit",
+)
+"""Decimal fields of result records.
+
+Rejection records store exception values in the first fields in order
+of exception arguments, other fields are zero.
+"""
+
+_FIELD_INDEXES = {name: i for i, name in enumerate(FIELDS)}
+
+# Kind, side, sign bits, then coefficient low and high 64 bits and exponent per field.
+_HEADER = struct.Struct("<BBH")
+_VALUE = struct.Struct("<QQi")
+_RECORD = struct.Struct("<BBH" + "QQi" * len(FIELDS))
+
+RECORD_SIZE = _RECORD.size
+"""Size of one encoded record in bytes."""
+
+_MASK64 = (1 << 64) - 1
+_MAX_COEFFICIENT = 1 << 128
+_INFINITY = -(1 << 31)
+_NAN = _INFINITY + 1
+_SIGNALING_NAN = _INFINITY + 2
+_SPECIAL_EXPONENTS = {"F": _INFINITY, "n": _NAN, "N": _SIGNALING_NAN}
+_SPECIALS = {_INFINITY: "Infinity", _NAN: "NaN", _SIGNALING_NAN: "sNaN"}
+_MIN_EXPONENT = _SIGNALING_NAN + 1
+_MAX_EXPONENT = (1 << 31) - 1
+
+_SIDES = {None: 0, OrderSide.ASK: 1, OrderSide.BID: 2}
+_SIDE_CODES = {code: side for side, code in _SIDES.items()}
+
+# Exact integer arithmetic for any coefficient and exponent.
+_EXACT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+_ZERO = (0,) * (3 * len(FIELDS))
+
+
+def encode_outcome(outcome: Outcome) -> bytes:
+    """Returns record of arbitrage result or rejection.
+
+    Raises:
+        ValueError: if a value does not fit in the record.
+        TypeError: if outcome is not a result or a known rejection.
+    """
+
+    buffer = bytearray(RECORD_SIZE)
+    _pack_into(buffer, 0, outcome)
+    return bytes(buffer)
+
+
+def decode_outcome(data: bytes | bytearray | memoryview) -> Outcome:
+    """Returns arbitrage result or rejection of record.
+
+    Decoded values equal encoded ones including exponents,
+    so `decode_outcome(encode_outcome(result)) == result`.
+
+    Raises:
+        ValueError: if record kind is unknown.
+    """
+
+    return _unpack_from(data, 0)
+
+
+def pack_outcomes(
+    buffer: bytearray | memoryview, outcomes: Sequence[Outcome], offset: int = 0
+) -> int:
+    """Writes records of `outcomes` one after another into preallocated `buffer`.
+
+    Args:
+        buffer: writable buffer like `bytearray` or shared memory.
+        outcomes: arbitrage results or rejections.
+        offset: position of the first record in bytes. Defaults to 0.
+
+    Returns:
+        Count of written bytes.
+
+    Raises:
+        ValueError: if buffer is too small or a value does not fit in the record.
+        TypeError: if an outcome is not a result or a known rejection.
+    """
+
+    size = len(outcomes) * RECORD_SIZE
+    if offset + size > len(buffer):
+        raise ValueError(
+            f"buffer of {len(buffer)} bytes is too small for {len(outcomes)} records"
+            f" at offset {offset}."
+        )
+
+    for outcome in outcomes:
+        _pack_into(buffer, offset, outcome)
+        offset += RECORD_SIZE
+    return size
+
+
+def unpack_outcomes(
+    buffer: bytes | bytearray | memoryview, offset: int = 0, count: int | None = None
+) -> list[Outcome]:
+    """Returns outcomes of `count` records starting at `offset` of `buffer`.
+
+    Args:
+        buffer: buffer with records.
+        offset: position of the first record in bytes. Defaults to 0.
+        count: count of records. Defaults to all records until the buffer end.
+    """
+
+    if count is None:
+        count = (len(buffer) - offset) // RECORD_SIZE
+    return [_unpack_from(buffer, offset + i * RECORD_SIZE) for i in range(count)]
+
+
+class RecordView:
+    """Sequence of records in a buffer, decoded on access.
+
+    The view keeps a `memoryview` of the buffer and copies nothing,
+    so records can be filtered by :meth:`kind` or a single :meth:`value`
+    without decoding whole results. Call :meth:`release` before resizing
+    or closing the underlying buffer.
+
+    Args:
+        buffer: buffer with records.
+        offset: position of the first record in bytes. Defaults to 0.
+        count: count of records. Defaults to all records until the buffer end.
+    """
+
+    def __init__(
+        self,
+        buffer: bytes | bytearray | memoryview,
+        offset: int = 0,
+        count: int | None = None,
+    ) -> None:
+        if count is None:
+            count = (len(buffer) - offset) // RECORD_SIZE
+        self._view = memoryview(buffer)[offset : offset + count * RECORD_SIZE]
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Outcome:
+        return _unpack_from(self._view, self._offset(index))
+
+    def __iter__(self) -> Iterator[Outcome]:
+        for i in range(self._count):
+            yield _unpack_from(self._view, i * RECORD_SIZE)
+
+    def kind(self, index: int) -> RecordKind:
+        """Returns kind of record without decoding it."""
+
+        return RecordKind(self._view[self._offset(index)])
+
+    def value(self, index: int, field: str) -> Decimal:
+        """Returns one decimal field of record, see :data:`FIELDS`."""
+
+        offset = self._offset(index)
+        field_index = _FIELD_INDEXES[field]
+        signs = _HEADER.unpack_from(self._view, offset)[2]
+        low, high, exponent = _VALUE.unpack_from(
+            self._view, offset + _HEADER.size + field_index * _VALUE.size
+        )
+        return _to_decimal(signs >> field_index & 1, low, high, exponent)
+
+    def release(self) -> None:
+        """Releases view of the buffer."""
+
+        self._view.release()
+
+    def _offset(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("record index out of range")
+        return index * RECORD_SIZE
+
+
+def _pack_into(buffer: bytearray | memoryview, offset: int, outcome: Outcome) -> None:
+    side = None
+    if isinstance(outcome, ArbitrageResult):
+        kind = RecordKind.RESULT
+        ask = outcome.ask_order
+        bid = outcome.bid_order
+        values = (
+            ask.price,
+            ask.quantity,
+            ask.notional_value,
+            ask.taken_fee,
+            bid.price,
+            bid.quantity,
+            bid.notional_value,
+            bid.taken_fee,
+            outcome.spread,
+            outcome.profit,
+        )
+    elif isinstance(outcome, ImcompabileQuantityIncrementsError):
+        kind = RecordKind.INCOMPATIBLE_QUANTITY_INCREMENTS
+        values = (outcome.ask_qty_inc, outcome.bid_qty_inc)
+    elif isinstance(outcome, QuantityLessThanMinQuantityError):
+        kind = RecordKind.QUANTITY_LESS_THAN_MIN_QUANTITY
+        side = outcome.side
+        values = (outcome.quantity, outcome.min_quantity)
+    elif isinstance(outcome, NotionalLessThanMinNotionalError):
+        kind = RecordKind.NOTIONAL_LESS_THAN_MIN_NOTIONAL
+        side = outcome.side
+        values = (outcome.notional, outcome.min_notional)
+    elif isinstance(outcome, ZeroQuantityError):
+        kind = RecordKind.ZERO_QUANTITY
+        side = outcome.side
+        values = (outcome.quantity_increment,)
+    else:
+        raise TypeError(f"{type(outcome).__name__} can not be encoded.")
+
+    signs = 0
+    fields: list[int] = []
+    for i, value in enumerate(values):
+        # Plain notation of str() gives coefficient and exponent faster than as_tuple().
+        text = str(value)
+        if text[0] == "-":
+            signs |= 1 << i
+            text = text[1:]
+        whole, _, fraction = text.partition(".")
+        try:
+            coefficient = int(whole + fraction)
+            exponent = -len(fraction)
+        except ValueError:
+            coefficient, exponent = _split(value)
+        if coefficient >= _MAX_COEFFICIENT:
+            raise ValueError(f"{value} coefficient does not fit in 128 bits.")
+        fields += (coefficient & _MASK64, coefficient >> 64, exponent)
+
+    fields += _ZERO[: 3 * (len(FIELDS) - len(values))]
+    _RECORD.pack_into(buffer, offset, kind, _SIDES[side], signs, *fields)
+
+
+def _unpack_from(buffer: bytes | bytearray | memoryview, offset: int) -> Outcome:
+    kind, side, signs, *fields = _RECORD.unpack_from(buffer, offset)
+    if kind != RecordKind.RESULT:
+        del fields[6:]
+    scaleb = _EXACT.scaleb
+    triples = iter(fields)
+    values = [
+        scaleb(Decimal(low), exponent)
+        if not high and exponent not in _SPECIALS
+        else _to_decimal(0, low, high, exponent)
+        for low, high, exponent in zip(triples, triples, triples)
+    ]
+    if signs:
+        for i in range(len(values)):
+            if signs >> i & 1:
+                values[i] = values[i].copy_negate()
+
+    if kind == RecordKind.RESULT:
+        return ArbitrageResult(
+            ask_order=OrderPayload(
+                price=values[0],
+                quantity=values[1],
+                notional_value=values[2],
+                taken_fee=values[3],
+            ),
+            bid_order=OrderPayload(
+                price=values[4],
+                quantity=values[5],
+                notional_value=values[6],
+                taken_fee=values[7],
+            ),
+            spread=values[8],
+            profit=values[9],
+        )
+    if kind == RecordKind.INCOMPATIBLE_QUANTITY_INCREMENTS:
+        return ImcompabileQuantityIncrementsError(
+            ask_qty_inc=values[0], bid_qty_inc=values[1]
+        )
+    if kind == RecordKind.QUANTITY_LESS_THAN_MIN_QUANTITY:
+        return QuantityLessThanMinQuantityError(
+            side=_SIDE_CODES[side], quantity=values[0], min_quantity=values[1]
+        )
+    if kind == RecordKind.NOTIONAL_LESS_THAN_MIN_NOTIONAL:
+        return NotionalLessThanMinNotionalError(
+            side=_SIDE_CODES[side], notional=values[0], min_notional=values[1]
+        )
+    if kind == RecordKind.ZERO_QUANTITY:
+        return ZeroQuantityError(side=_SIDE_CODES[side], quantity_increment=values[0])
+    raise ValueError(f"unknown record kind {kind} at offset {offset}.")
+
+
+def _split(value: Decimal) -> tuple[int, int]:
+    _, digits, exponent = value.as_tuple()
+    if isinstance(exponent, str):
+        return int("".join(map(str, digits)) or 0), _SPECIAL_EXPONENTS[exponent]
+    if not _MIN_EXPONENT <= exponent <= _MAX_EXPONENT:
+        raise ValueError(f"{value} exponent does not fit in 32 bits.")
+    return int(value.copy_abs().scaleb(-exponent, _EXACT)), exponent
+
+
+def _to_decimal(sign: int, low: int, high: int, exponent: int) -> Decimal:
+    coefficient = high << 64 | low
+    if exponent in _SPECIALS:
+        value = Decimal(_SPECIALS[exponent] + (str(coefficient) if coefficient else ""))
+    else:
+        value = Decimal(coefficient).scaleb(exponent, _EXACT)
+    return value.copy_negate() if sign else value
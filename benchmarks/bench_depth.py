@@ -0,0 +1,98 @@
+"""Depth queries of :class:`arbitragepy.depth.DepthIndex` against walking levels.
+
+Every tick one level changes, then the cost of a random quantity
+and the quantity bought by a random budget are queried.
+
+    PYTHONPATH=. python benchmarks/bench_depth.py
+"""
+
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from arbitragepy.depth import DepthIndex
+from arbitragepy.enums import OrderSide
+from arbitragepy.models import OrderInfo
+from arbitragepy.quantity_increment import to_compatible_quantity_increment
+
+TICK = Decimal("0.01")
+INCREMENT = Decimal("0.001")
+
+
+def walk_cost(levels: list[list[Decimal]], quantity: Decimal) -> Decimal | None:
+    cost = Decimal(0)
+    for price, level_quantity in levels:
+        taken = min(level_quantity, quantity)
+        cost += taken * price
+        quantity -= taken
+        if not quantity:
+            return cost
+    return None
+
+
+def walk_max_quantity(levels: list[list[Decimal]], notional: Decimal) -> Decimal:
+    quantity = Decimal(0)
+    for price, level_quantity in levels:
+        level_notional = level_quantity * price
+        if level_notional > notional:
+            quantity += notional / price
+            break
+        quantity += level_quantity
+        notional -= level_notional
+    return to_compatible_quantity_increment(quantity, INCREMENT)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--levels", type=int, default=1000)
+    parser.add_argument("--ticks", type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    min_price = Decimal(26000)
+    max_price = min_price + args.levels * TICK
+    book = {
+        min_price + i * TICK: Decimal(rng.randint(1, 2000)) * INCREMENT
+        for i in range(args.levels)
+    }
+    updates = [
+        (
+            min_price + rng.randrange(args.levels) * TICK,
+            rng.randint(0, 2000) * INCREMENT,
+        )
+        for _ in range(args.ticks)
+    ]
+    total = sum(book.values())
+    quantities = [
+        Decimal(rng.randint(1, int(total / INCREMENT))) * INCREMENT
+        for _ in range(args.ticks)
+    ]
+    budgets = [q * min_price for q in quantities]
+
+    # Sorted ladder of every grid price, levels are updated in place.
+    ladder = [[price, quantity] for price, quantity in sorted(book.items())]
+    positions = {level[0]: level for level in ladder}
+    start = time.perf_counter()
+    for (price, quantity), wanted, budget in zip(updates, quantities, budgets):
+        positions[price][1] = quantity
+        walk_cost(ladder, wanted)
+        walk_max_quantity(ladder, budget)
+    walk_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = DepthIndex(OrderSide.ASK, TICK, min_price, max_price)
+    index.set_levels(OrderInfo(price=p, quantity=q) for p, q in book.items())
+    for (price, quantity), wanted, budget in zip(updates, quantities, budgets):
+        index.set_level(price, quantity)
+        index.cost(wanted)
+        index.max_quantity(budget, INCREMENT)
+    index_seconds = time.perf_counter() - start
+
+    print(f"levels {args.levels}, ticks {args.ticks}")
+    print(f"walk   {walk_seconds / args.ticks * 1e6:>10.1f} us/tick")
+    print(f"index  {index_seconds / args.ticks * 1e6:>10.1f} us/tick")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""End-to-end detect -> size -> execute throughput against simulated exchanges.
+
+Quotes come from :class:`arbitragepy.synthetic.MarketGenerator`, opportunities
+are detected by :class:`arbitragepy.reactor.ArbitrageReactor` and executed
+on :class:`arbitragepy.exchange.SimulatedExchange` books built from the same quotes.
+
+    PYTHONPATH=. python benchmarks/bench_exchange.py
+"""
+
+import argparse
+import time
+from decimal import Decimal
+
+from arbitragepy.enums import OrderSide
+from arbitragepy.exchange import SimulatedExchange
+from arbitragepy.models import OrderInfo, SymbolInfo
+from arbitragepy.reactor import ArbitrageReactor
+from arbitragepy.synthetic import MarketGenerator, SyntheticSymbol
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--venues", type=int, default=3)
+    parser.add_argument("--crossed-probability", type=float, default=0.05)
+    args = parser.parse_args()
+
+    info = SymbolInfo(
+        quantity_increment=Decimal("0.001"),
+        min_quantity=Decimal("0.01"),
+    )
+    venues = [f"venue{i}" for i in range(args.venues)]
+    generator = MarketGenerator(
+        venues,
+        [SyntheticSymbol("BTC/USDT", info, Decimal(26000), Decimal("0.01"))],
+        crossed_probability=args.crossed_probability,
+    )
+    reactor = ArbitrageReactor()
+    exchanges = {}
+    for venue in venues:
+        reactor.add_market(venue, "BTC/USDT", info)
+        exchange = exchanges[venue] = SimulatedExchange(venue)
+        exchange.add_symbol("BTC/USDT", info, "BTC", "USDT")
+        exchange.deposit("USDT", Decimal(10) ** 12)
+        exchange.deposit("BTC", Decimal(10) ** 6)
+
+    batch = generator.batch(args.events)
+    scale = -generator.scale
+    executed = 0
+    start = time.perf_counter()
+    for i in range(len(batch)):
+        venue, symbol = generator.markets[batch.market[i]]
+        ask = OrderInfo(
+            price=Decimal(batch.ask_price[i]).scaleb(scale),
+            quantity=Decimal(batch.ask_quantity[i]).scaleb(scale),
+        )
+        bid = OrderInfo(
+            price=Decimal(batch.bid_price[i]).scaleb(scale),
+            quantity=Decimal(batch.bid_quantity[i]).scaleb(scale),
+        )
+        exchanges[venue].set_book(symbol, [ask], [bid])
+        for ctx in reactor.update_quote(venue, symbol, ask, bid):
+            if ctx.is_profitable:
+                _, ask_venue, bid_venue = ctx.pair_id
+                exchanges[ask_venue].place_order(
+                    symbol, OrderSide.ASK, ctx.result.ask_order
+                )
+                exchanges[bid_venue].place_order(
+                    symbol, OrderSide.BID, ctx.result.bid_order
+                )
+                executed += 1
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{len(batch):,} events, {executed:,} opportunities executed in {elapsed:.2f}s: "
+        f"{len(batch) / elapsed:,.0f} events/s, {executed / elapsed:,.0f} executions/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
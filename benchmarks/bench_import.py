@@ -0,0 +1,48 @@
+"""Import time of the package in fresh interpreters.
+
+Compares `import arbitragepy` with importing only :func:`arbitragepy.arbitrage`
+and with resolving every public name, which imports all submodules.
+
+    PYTHONPATH=. python benchmarks/bench_import.py
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+CASES = {
+    "import arbitragepy": "import arbitragepy",
+    "from arbitragepy import arbitrage": "from arbitragepy import arbitrage",
+    "all public names": (
+        "import arbitragepy\nfor name in arbitragepy.__all__: getattr(arbitragepy, name)"
+    ),
+}
+
+
+def measure(code: str) -> float:
+    script = (
+        "import time\nstart = time.perf_counter()\n"
+        f"{code}\nprint(time.perf_counter() - start)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True
+    ).stdout
+    return float(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    for name, code in CASES.items():
+        times = [measure(code) for _ in range(args.runs)]
+        print(
+            f"{name:<36} median {statistics.median(times) * 1e3:>7.1f} ms"
+            f"  min {min(times) * 1e3:>7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Scaling of :class:`arbitragepy.parallel.ConcurrentEvaluator` with thread count.
+
+Run on regular and free-threaded builds and compare:
+
+    python benchmarks/bench_parallel.py
+    python3.13t -X gil=0 benchmarks/bench_parallel.py
+"""
+
+import argparse
+import sys
+import time
+from decimal import Decimal
+
+from arbitragepy.models import ArbitragePayload, OrderInfo, SymbolInfo
+from arbitragepy.parallel import ConcurrentEvaluator
+
+
+def make_pairs(count: int) -> list[tuple[ArbitragePayload, ArbitragePayload]]:
+    symbol = SymbolInfo(quantity_increment=Decimal("0.01"), fee=Decimal("0.1"))
+    return [
+        (
+            ArbitragePayload(
+                symbol=symbol,
+                order=OrderInfo(price=Decimal("10.5"), quantity=Decimal(100 + i % 7)),
+                balance=Decimal(200 + i % 13),
+            ),
+            ArbitragePayload(
+                symbol=symbol,
+                order=OrderInfo(price=Decimal("11.5"), quantity=Decimal(50 + i % 11)),
+                balance=Decimal(65),
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pairs", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL {'on' if is_gil_enabled else 'off'}")
+
+    pairs = make_pairs(args.pairs)
+    baseline = None
+    for threads in args.threads:
+        with ConcurrentEvaluator(max_workers=threads, chunk_size=1024) as evaluator:
+            start = time.perf_counter()
+            evaluator.evaluate(pairs)
+            elapsed = time.perf_counter() - start
+
+        rate = len(pairs) / elapsed
+        baseline = baseline or rate
+        print(f"{threads:>3} threads: {rate:>12,.0f} pairs/s  x{rate / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Throughput of :class:`arbitragepy.synthetic.MarketGenerator`.
+
+PYTHONPATH=. python benchmarks/bench_synthetic.py --events 5000000 --output quotes.bin
+"""
+
+import argparse
+import time
+from decimal import Decimal
+
+from arbitragepy.models import SymbolInfo
+from arbitragepy.synthetic import MarketGenerator, SyntheticSymbol, write_quotes
+
+
+def make_generator(venues: int, symbols: int, seed: int) -> MarketGenerator:
+    return MarketGenerator(
+        venues=[f"venue{i}" for i in range(venues)],
+        symbols=[
+            SyntheticSymbol(
+                name=f"COIN{i}/USDT",
+                info=SymbolInfo(
+                    quantity_increment=Decimal("0.001"),
+                    min_quantity=Decimal("0.01"),
+                    fee=Decimal("0.1"),
+                ),
+                price=Decimal(10 + i),
+                tick_size=Decimal("0.0001"),
+            )
+            for i in range(symbols)
+        ],
+        seed=seed,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=2_000_000)
+    parser.add_argument("--batch-size", type=int, default=100_000)
+    parser.add_argument("--venues", type=int, default=5)
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write quotes to binary file")
+    args = parser.parse_args()
+
+    generator = make_generator(args.venues, args.symbols, args.seed)
+    batches = generator.batches(args.batch_size, args.events // args.batch_size)
+
+    start = time.perf_counter()
+    if args.output:
+        with open(args.output, "wb") as file:
+            count = write_quotes(file, batches, generator.scale)
+    else:
+        count = sum(len(batch) for batch in batches)
+    elapsed = time.perf_counter() - start
+
+    print(f"{count:,} events in {elapsed:.2f}s: {count / elapsed * 60:,.0f} events/min")
+
+
+if __name__ == "__main__":
+    main()
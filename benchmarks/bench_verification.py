@@ -0,0 +1,49 @@
+"""Differential verification and throughput of arbitrage engines.
+
+Runs every engine of :func:`arbitragepy.verification.default_engines`
+(and the NumPy backend with ``--numpy``) against :func:`arbitragepy.arbitrage`
+on random cases and prints mismatches and cases per second.
+
+    PYTHONPATH=. python benchmarks/bench_verification.py
+"""
+
+import argparse
+import sys
+from decimal import Decimal
+
+from arbitragepy.backends import numpy_backend
+from arbitragepy.verification import (
+    backend_engine,
+    default_engines,
+    generate_cases,
+    verify,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cases", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--numpy", action="store_true")
+    parser.add_argument("--show", type=int, default=3, help="mismatches per engine")
+    args = parser.parse_args()
+
+    engines = default_engines()
+    if args.numpy:
+        engines.append(backend_engine(numpy_backend(), tolerance=Decimal("1e-9")))
+
+    report = verify(generate_cases(args.cases, seed=args.seed), engines)
+    print(report.format())
+    for engine in report.engines:
+        for mismatch in engine.mismatches[: args.show]:
+            print(f"\n{engine.name} case {mismatch.index}:")
+            print(f"  ask: {mismatch.ask}")
+            print(f"  bid: {mismatch.bid}")
+            print(f"  expected: {mismatch.expected}")
+            print(f"  actual: {mismatch.actual}")
+    if not report.ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Wire encoding of arbitrage results against pickle.
+
+Results of random cases from :func:`arbitragepy.verification.generate_cases`
+are encoded into one preallocated buffer and pickled as a list,
+then decoded back. Reading one field through :class:`arbitragepy.wire.RecordView`
+shows the cost of filtering records without decoding them.
+
+    PYTHONPATH=. python benchmarks/bench_wire.py
+"""
+
+import argparse
+import pickle
+import time
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.exceptions import ArbitrageError
+from arbitragepy.models import ArbitrageResult
+from arbitragepy.verification import generate_cases
+from arbitragepy.wire import RECORD_SIZE, RecordView, pack_outcomes, unpack_outcomes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cases", type=int, default=50_000)
+    args = parser.parse_args()
+
+    results: list[ArbitrageResult] = []
+    for ask, bid in generate_cases(args.cases):
+        try:
+            results.append(arbitrage(ask, bid))
+        except (ArbitrageError, ArithmeticError):
+            pass
+    count = len(results)
+    buffer = bytearray(count * RECORD_SIZE)
+
+    def report(name: str, seconds: float, size: int | None = None) -> None:
+        line = f"{name:<16} {seconds / count * 1e6:>8.2f} us/record"
+        if size is not None:
+            line += f" {size / count:>8.1f} bytes/record"
+        print(line)
+
+    start = time.perf_counter()
+    data = pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)
+    report("pickle dumps", time.perf_counter() - start, len(data))
+    start = time.perf_counter()
+    pickle.loads(data)
+    report("pickle loads", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    pack_outcomes(buffer, results)
+    report("wire pack", time.perf_counter() - start, len(buffer))
+    start = time.perf_counter()
+    unpack_outcomes(buffer)
+    report("wire unpack", time.perf_counter() - start)
+
+    view = RecordView(buffer)
+    start = time.perf_counter()
+    for i in range(count):
+        view.value(i, "profit")
+    report("wire view profit", time.perf_counter() - start)
+    view.release()
+
+
+if __name__ == "__main__":
+    main()
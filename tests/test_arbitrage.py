@@ -693,3 +693,42 @@ def test_arbitrage_with_ask_and_bid_max_quantity() -> None:
     )
 
     assert result == expected
+
+
+def test_arbitrage_with_price_and_notional_precision() -> None:
+    """Should round prices and notional values against the arbitrageur."""
+
+    symbol = SymbolInfo(
+        quantity_increment=Decimal("0.01"),
+        fee=Decimal("0.1"),
+        price_precision=Decimal("0.01"),
+        notional_precision=Decimal("0.01"),
+    )
+    ask = ArbitragePayload(
+        symbol=symbol,
+        order=OrderInfo(price=Decimal("10.537"), quantity=Decimal("100.15")),
+    )
+    bid = ArbitragePayload(
+        symbol=symbol,
+        order=OrderInfo(price=Decimal("11.509"), quantity=Decimal("50.3")),
+    )
+
+    result = arbitrage(ask=ask, bid=bid, spread_precision=Decimal("0.0001"))
+    expected = ArbitrageResult(
+        ask_order=OrderPayload(
+            price=Decimal("10.54"),
+            quantity=Decimal("50.30"),
+            notional_value=Decimal("530.71"),
+            taken_fee=Decimal("0.54"),
+        ),
+        bid_order=OrderPayload(
+            price=Decimal("11.50"),
+            quantity=Decimal("50.30"),
+            notional_value=Decimal("577.87"),
+            taken_fee=Decimal("0.58"),
+        ),
+        spread=Decimal("8.8862"),
+        profit=Decimal("47.16"),
+    )
+
+    assert result == expected
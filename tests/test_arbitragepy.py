@@ -1,5 +1,73 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
 import arbitragepy
+from arbitragepy.exchange import SimulatedExchange
 
 
 def test_version() -> None:
     assert arbitragepy.__version__ == "3.0.0"
+
+
+EAGER_MODULES = {
+    "arbitragepy",
+    "arbitragepy.arbitrage",
+    "arbitragepy.backends",
+    "arbitragepy.enums",
+    "arbitragepy.exceptions",
+    "arbitragepy.fee",
+    "arbitragepy.fee_schedule",
+    "arbitragepy.models",
+    "arbitragepy.parsing",
+    "arbitragepy.quantity_increment",
+    "arbitragepy.quantize",
+    "arbitragepy.spread",
+    "arbitragepy.sweep",
+}
+"""Modules of the package which `import arbitragepy` may load."""
+
+HEAVY_MODULES = [
+    "asyncio",
+    "concurrent.futures",
+    "mmap",
+    "multiprocessing",
+    "numpy",
+    "arbitragepy.cli",
+    "arbitragepy.exchange",
+    "arbitragepy.opportunity_log",
+    "arbitragepy.shared_quotes",
+    "arbitragepy.verification",
+]
+
+
+def run_python(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+
+
+def test_import_is_lazy() -> None:
+    loaded = json.loads(
+        run_python(
+            "import json, sys; import arbitragepy; print(json.dumps(list(sys.modules)))"
+        )
+    )
+
+    assert [module for module in HEAVY_MODULES if module in loaded] == []
+    package_modules = {module for module in loaded if module.startswith("arbitragepy")}
+    assert package_modules <= EAGER_MODULES
+
+
+def test_lazy_names() -> None:
+    for name in arbitragepy.__all__:
+        assert getattr(arbitragepy, name) is not None
+    assert set(arbitragepy.__all__) <= set(dir(arbitragepy))
+    assert arbitragepy.SimulatedExchange is SimulatedExchange
+    assert callable(arbitragepy.arbitrage)
+    assert callable(arbitragepy.sweep)
+
+    with pytest.raises(AttributeError):
+        _ = arbitragepy.unknown_name
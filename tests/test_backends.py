@@ -0,0 +1,256 @@
+import random
+from dataclasses import replace
+from decimal import ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_UP, ROUND_UP, Decimal
+
+import pytest
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.backends import (
+    DECIMAL_BACKEND,
+    BackendOrder,
+    BackendPayload,
+    BackendResult,
+    BackendSymbol,
+    convert_payload,
+    get_backend,
+    make_arbitrage,
+    numpy_backend,
+    result_to_decimal,
+    scaled_backend,
+    use_backend,
+)
+from arbitragepy.exceptions import ArbitrageError, QuantityLessThanMinQuantityError
+from arbitragepy.fee_schedule import FeeSchedule, FeeTier
+from arbitragepy.models import ArbitragePayload, OrderInfo, SymbolInfo
+
+
+def random_payloads(seed: int, count: int) -> list[tuple[ArbitragePayload, ...]]:
+    rng = random.Random(seed)
+    increments = [Decimal("0.001"), Decimal("0.01"), Decimal("0.1"), Decimal("0.015")]
+
+    def payload(price: Decimal) -> ArbitragePayload:
+        return ArbitragePayload(
+            symbol=SymbolInfo(
+                quantity_increment=rng.choice(increments),
+                min_quantity=Decimal(rng.randint(0, 3)) / 10,
+                min_notional=Decimal(rng.randint(0, 20)),
+                fee_in_base_currency=rng.random() < 0.3,
+                fee=Decimal(rng.randint(0, 20)) / 100,
+            ),
+            order=OrderInfo(price=price, quantity=Decimal(rng.randint(1, 5000)) / 100),
+            balance=Decimal(rng.randint(1, 100000)) / 100,
+        )
+
+    return [
+        (
+            payload(Decimal(rng.randint(900, 1100)) / 100),
+            payload(Decimal(rng.randint(900, 1100)) / 100),
+        )
+        for _ in range(count)
+    ]
+
+
+def evaluate(function, ask, bid):
+    try:
+        return function(ask, bid)
+    except ArbitrageError as e:
+        return type(e)
+
+
+def test_decimal_backend_matches_reference() -> None:
+    backend_arbitrage = make_arbitrage(DECIMAL_BACKEND)
+    for ask, bid in random_payloads(1, 500):
+        assert evaluate(backend_arbitrage, ask, bid) == evaluate(arbitrage, ask, bid)
+
+
+def test_scaled_backend_matches_reference_quantities() -> None:
+    backend = scaled_backend(8)
+    backend_arbitrage = make_arbitrage(backend)
+    for ask, bid in random_payloads(2, 500):
+        expected = evaluate(arbitrage, ask, bid)
+        actual = evaluate(
+            backend_arbitrage,
+            convert_payload(ask, backend),
+            convert_payload(bid, backend),
+        )
+        if isinstance(expected, type) or isinstance(actual, type):
+            continue
+        actual = result_to_decimal(actual, backend)
+        assert actual.ask_order.quantity == expected.ask_order.quantity
+        assert actual.bid_order.quantity == expected.bid_order.quantity
+        assert abs(actual.profit - expected.profit) < Decimal("0.000001")
+
+
+def test_backend_rejections_have_decimal_values() -> None:
+    symbol = SymbolInfo(
+        quantity_increment=Decimal("0.01"),
+        min_quantity=Decimal(1),
+        min_notional=Decimal(5),
+    )
+    ask = ArbitragePayload(
+        symbol=symbol, order=OrderInfo(price=Decimal(10), quantity=Decimal("0.5"))
+    )
+    bid = ArbitragePayload(
+        symbol=symbol, order=OrderInfo(price=Decimal(11), quantity=Decimal(2))
+    )
+    incompatible = replace(symbol, quantity_increment=Decimal("0.03"))
+    unlimited = replace(symbol, min_quantity=Decimal(0), min_notional=Decimal(0))
+    cases = [
+        (ask, bid),
+        (replace(ask, symbol=incompatible), bid),
+        (
+            ArbitragePayload(
+                symbol=unlimited,
+                order=OrderInfo(price=Decimal(10), quantity=Decimal("0.001")),
+            ),
+            replace(bid, symbol=unlimited),
+        ),
+    ]
+    backends = [scaled_backend(8)]
+    try:
+        backends.append(numpy_backend())
+    except ImportError:
+        pass
+
+    for backend in backends:
+        for ask_payload, bid_payload in cases:
+            with pytest.raises(ArbitrageError) as expected:
+                arbitrage(ask_payload, bid_payload)
+            with pytest.raises(ArbitrageError) as e:
+                make_arbitrage(backend)(
+                    convert_payload(ask_payload, backend),
+                    convert_payload(bid_payload, backend),
+                )
+            assert type(e.value) is type(expected.value)
+            assert vars(e.value) == vars(expected.value)
+
+
+def test_numpy_backend_rejection_reports_lowest_value() -> None:
+    np = pytest.importorskip("numpy")
+    backend = numpy_backend()
+    symbol = SymbolInfo(quantity_increment=Decimal("0.01"), min_quantity=Decimal(1))
+    symbol_values = convert_payload(
+        ArbitragePayload(symbol=symbol, order=OrderInfo(Decimal(1), Decimal(1))),
+        backend,
+    ).symbol
+
+    def payload(prices: list[float], quantities: list[float]) -> BackendPayload:
+        return BackendPayload(
+            symbol=symbol_values,
+            order=BackendOrder(price=np.array(prices), quantity=np.array(quantities)),
+        )
+
+    with pytest.raises(QuantityLessThanMinQuantityError) as e:
+        make_arbitrage(backend)(
+            payload([10.0, 10.0, 10.0], [2.0, 0.25, 0.5]),
+            payload([11.0, 11.0, 11.0], [3.0, 3.0, 3.0]),
+        )
+    assert e.value.quantity == Decimal("0.25")
+    assert e.value.min_quantity == 1
+
+
+def test_backend_of_context() -> None:
+    assert get_backend() is DECIMAL_BACKEND
+    assert make_arbitrage() is make_arbitrage(DECIMAL_BACKEND)
+
+    with use_backend(scaled_backend(4)) as backend:
+        assert get_backend() is backend
+        assert make_arbitrage() is make_arbitrage(scaled_backend(4))
+    assert get_backend() is DECIMAL_BACKEND
+
+
+def test_numpy_backend_evaluates_arrays() -> None:
+    np = pytest.importorskip("numpy")
+    backend = numpy_backend()
+    symbol = SymbolInfo(quantity_increment=Decimal("0.01"), fee=Decimal("0.1"))
+    asks = [(Decimal("10.5"), Decimal("100.15")), (Decimal(10), Decimal("3.33"))]
+    bids = [(Decimal("11.5"), Decimal(50)), (Decimal("10.2"), Decimal(7))]
+
+    symbol_values = convert_payload(
+        ArbitragePayload(symbol=symbol, order=OrderInfo(Decimal(1), Decimal(1))),
+        backend,
+    ).symbol
+
+    def payload(levels: list[tuple[Decimal, Decimal]]) -> BackendPayload:
+        return BackendPayload(
+            symbol=symbol_values,
+            order=BackendOrder(
+                price=np.array([float(p) for p, _ in levels]),
+                quantity=np.array([float(q) for _, q in levels]),
+            ),
+        )
+
+    result = make_arbitrage(backend)(payload(asks), payload(bids))
+
+    for i, ((ask_price, ask_qty), (bid_price, bid_qty)) in enumerate(zip(asks, bids)):
+        expected = arbitrage(
+            ArbitragePayload(symbol=symbol, order=OrderInfo(ask_price, ask_qty)),
+            ArbitragePayload(symbol=symbol, order=OrderInfo(bid_price, bid_qty)),
+        )
+        assert result.ask_order.quantity[i] == pytest.approx(
+            float(expected.ask_order.quantity)
+        )
+        assert result.profit[i] == pytest.approx(float(expected.profit))
+
+
+def test_backends_apply_precision() -> None:
+    symbol = SymbolInfo(
+        quantity_increment=Decimal("0.01"),
+        fee=Decimal("0.1"),
+        price_precision=Decimal("0.05"),
+        notional_precision=Decimal("0.01"),
+    )
+    ask = ArbitragePayload(
+        symbol=symbol, order=OrderInfo(Decimal("10.512"), Decimal("3.337"))
+    )
+    bid = ArbitragePayload(
+        symbol=symbol, order=OrderInfo(Decimal("11.538"), Decimal(5)), balance=None
+    )
+    expected = arbitrage(ask, bid, spread_precision=Decimal("0.01"))
+    assert expected.ask_order.price == Decimal("10.55")
+    assert expected.bid_order.price == Decimal("11.50")
+
+    backend = scaled_backend(8)
+    converted = convert_payload(ask, backend)
+    assert isinstance(converted, BackendPayload)
+    assert isinstance(converted.symbol, BackendSymbol)
+    actual = make_arbitrage(backend)(
+        converted,
+        convert_payload(bid, backend),
+        spread_precision=backend.convert(Decimal("0.01")),
+    )
+    assert isinstance(actual, BackendResult)
+    assert result_to_decimal(actual, backend) == expected
+
+
+def test_scaled_backend_quantize() -> None:
+    quantize = scaled_backend(2).quantize
+
+    assert quantize(150, 100, ROUND_DOWN) == 100
+    assert quantize(150, 100, ROUND_UP) == 200
+    assert quantize(-150, 100, ROUND_DOWN) == -100
+    assert quantize(-150, 100, ROUND_UP) == -200
+    assert quantize(-150, 100, ROUND_FLOOR) == -200
+    with pytest.raises(ValueError):
+        quantize(150, 100, ROUND_HALF_UP)
+
+
+def test_backends_use_taker_fee_of_schedule() -> None:
+    schedule = FeeSchedule(
+        [FeeTier(min_volume=Decimal(0), maker_fee=Decimal(0), taker_fee=Decimal("0.5"))]
+    )
+    symbol = SymbolInfo(quantity_increment=Decimal("0.01"), fee_schedule=schedule)
+    ask = ArbitragePayload(symbol=symbol, order=OrderInfo(Decimal(100), Decimal(1)))
+    bid = ArbitragePayload(symbol=symbol, order=OrderInfo(Decimal(102), Decimal(1)))
+    expected = arbitrage(ask, bid)
+    assert expected.profit == Decimal("0.99")
+
+    assert make_arbitrage(DECIMAL_BACKEND)(ask, bid) == expected
+
+    backend = scaled_backend(8)
+    actual = make_arbitrage(backend)(
+        convert_payload(ask, backend), convert_payload(bid, backend)
+    )
+    actual = result_to_decimal(actual, backend)
+    assert actual.profit == expected.profit
+    assert actual.ask_order == expected.ask_order
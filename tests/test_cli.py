@@ -0,0 +1,191 @@
+import io
+import json
+import os
+import random
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from arbitragepy.cli import (
+    Scanner,
+    ScanStats,
+    WorkerError,
+    _scan_parallel,
+    load_symbols,
+    main,
+    scan,
+)
+from arbitragepy.models import SymbolInfo
+
+BTC = {"quantity_increment": "0.0001", "fee": "0.1"}
+ETH = {"quantity_increment": "0.001", "fee": "0.1"}
+SYMBOLS = {
+    "a": {"BTC/USDT": BTC, "ETH/USDT": ETH},
+    "b": {"BTC/USDT": BTC, "ETH/USDT": ETH},
+}
+QUOTES = [
+    {"venue": "a", "symbol": "BTC/USDT", "ask": ["100", "2"], "bid": ["99", "2"]},
+    {"venue": "b", "symbol": "BTC/USDT", "ask": ["111", "1"], "bid": ["110", "1"]},
+    {"venue": "a", "symbol": "ETH/USDT", "ask": ["10", "5"], "bid": None},
+    {"venue": "b", "symbol": "ETH/USDT", "ask": None, "bid": ["10.001", "5"]},
+    {"venue": "c", "symbol": "BTC/USDT", "ask": ["1", "1"], "bid": ["1", "1"]},
+]
+
+
+@pytest.fixture
+def symbols_file(tmp_path: Path) -> Path:
+    path = tmp_path / "symbols.json"
+    path.write_text(json.dumps(SYMBOLS))
+    return path
+
+
+def lines() -> list[str]:
+    return [json.dumps(quote) + "\n" for quote in QUOTES]
+
+
+def test_load_symbols_from_file_and_directory(
+    symbols_file: Path, tmp_path: Path
+) -> None:
+    directory = tmp_path / "venues"
+    directory.mkdir()
+    for venue, symbols in SYMBOLS.items():
+        (directory / f"{venue}.json").write_text(json.dumps(symbols))
+
+    assert load_symbols(symbols_file) == load_symbols(directory)
+    assert load_symbols(symbols_file)[("a", "BTC/USDT")].fee == Decimal("0.1")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_scan(symbols_file: Path, workers: int) -> None:
+    output = io.StringIO()
+    stats = scan(lines(), load_symbols(symbols_file), output, workers=workers)
+
+    opportunities = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert opportunities == [
+        {
+            "symbol": "BTC/USDT",
+            "ask_venue": "a",
+            "bid_venue": "b",
+            "ask_price": "100",
+            "ask_quantity": "1.0000",
+            "bid_price": "110",
+            "bid_quantity": "1.0000",
+            "spread": "9.780219780219780219780219800",
+            "profit": "9.79000",
+        }
+    ]
+    assert stats.events == 4
+    assert stats.skipped == 1
+    assert stats.opportunities == 1
+    assert len(stats.latencies) == 4
+
+
+def test_main_prints_summary(
+    symbols_file: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    quotes = tmp_path / "quotes.jsonl"
+    quotes.write_text("".join(lines()))
+
+    assert (
+        main(
+            [
+                "scan",
+                "--symbols",
+                str(symbols_file),
+                "--min-profit",
+                "10",
+                str(quotes),
+            ]
+        )
+        == 0
+    )
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "events: 4, skipped: 1, opportunities: 0, rejected: 0" in captured.err
+    assert "throughput" in captured.err
+
+
+def test_scanner_rejects_invalid_numbers_and_zero_quantity() -> None:
+    symbol = SymbolInfo(quantity_increment=Decimal("0.01"))
+    scanner = Scanner({("a", "BTC/USDT"): symbol, ("b", "BTC/USDT"): symbol})
+    snapshots = [
+        {"venue": "b", "symbol": "BTC/USDT", "ask": ["111", "1"], "bid": ["110", "1"]},
+        {"venue": "a", "symbol": "BTC/USDT", "ask": ["100", "0.005"], "bid": None},
+        {"venue": "a", "symbol": "BTC/USDT", "ask": ["abc", "1"], "bid": None},
+    ]
+
+    output = [scanner.process(json.dumps(snapshot)) for snapshot in snapshots]
+
+    assert output == [[], [], []]
+    assert scanner.stats.events == 2
+    assert scanner.stats.rejected == 1
+
+
+MALFORMED = [
+    '{"venue": "a", "symbol": "BTC/USDT", "ask": ["100"',
+    '{"venue": "a", "symbol": "BTC/USDT", "ask": [], "bid": null}',
+    '{"venue": "a", "symbol": "BTC/USDT", "ask": "100", "bid": null}',
+    '{"venue": "a", "symbol": ["BTC/USDT"], "ask": null, "bid": null}',
+    '{"symbol": "BTC/USDT", "ask": null, "bid": null}',
+    "[1, 2]",
+]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_scan_rejects_malformed_snapshots(symbols_file: Path, workers: int) -> None:
+    output = io.StringIO()
+    stats = scan(
+        [line + "\n" for line in MALFORMED] + lines(),
+        load_symbols(symbols_file),
+        output,
+        workers=workers,
+    )
+
+    assert stats.rejected == len(MALFORMED)
+    assert stats.events == 4
+    assert stats.skipped == 1
+    assert stats.opportunities == 1
+
+
+def test_main_rejects_invalid_min_profit(
+    symbols_file: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    for value in ["abc", "NaN"]:
+        with pytest.raises(SystemExit) as e:
+            main(["scan", "--symbols", str(symbols_file), "--min-profit", value])
+        assert e.value.code == 2
+        assert "invalid decimal value" in capsys.readouterr().err
+
+
+def test_scan_stats_merge_weights_reservoirs_by_seen_latencies() -> None:
+    busy = ScanStats(latencies=[1.0] * 10000, seen_latencies=90000)
+    idle = ScanStats(latencies=[2.0] * 10000, seen_latencies=10000)
+
+    busy.merge(idle, random.Random(0))
+
+    assert busy.seen_latencies == 100000
+    assert len(busy.latencies) == 10000
+    assert 0.85 < busy.latencies.count(1.0) / 10000 < 0.95
+
+    small = ScanStats(latencies=[1.0, 3.0], seen_latencies=2)
+    small.merge(ScanStats(latencies=[2.0], seen_latencies=1), random.Random(0))
+    assert sorted(small.latencies) == [1.0, 2.0, 3.0]
+
+
+def _exit_worker(*args: object) -> None:
+    os._exit(3)
+
+
+def test_scan_fails_if_worker_dies(symbols_file: Path) -> None:
+    with pytest.raises(WorkerError) as e:
+        _scan_parallel(
+            lines() * 100,
+            load_symbols(symbols_file),
+            io.StringIO(),
+            Decimal(0),
+            workers=2,
+            target=_exit_worker,
+        )
+    assert e.value.exitcode == 3
@@ -0,0 +1,108 @@
+from dataclasses import replace
+from decimal import Decimal
+
+import pytest
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.conversion import ConversionRates, cross_arbitrage
+from arbitragepy.models import ArbitragePayload, OrderInfo, SymbolInfo
+
+SYMBOL = SymbolInfo(quantity_increment=Decimal("0.01"), fee=Decimal("0.1"))
+
+
+def make_rates() -> ConversionRates:
+    rates = ConversionRates()
+    rates.set_rate("USDC", "USDT", Decimal("0.999"))
+    rates.set_rate("EUR", "USDT", Decimal("1.08"))
+    rates.set_rate("GBP", "EUR", Decimal("1.15"))
+    return rates
+
+
+def test_conversion_rates_derive_and_cache_cross_rates() -> None:
+    rates = make_rates()
+
+    assert rates.rate("USDT", "USDT") == Decimal(1)
+    assert rates.rate("USDT", "EUR") == 1 / Decimal("1.08")
+    assert rates.rate("GBP", "USDC") == Decimal("1.15") * Decimal("1.08") * (
+        1 / Decimal("0.999")
+    )
+    assert rates.convert(Decimal(2), "GBP", "EUR") == Decimal("2.30")
+    with pytest.raises(KeyError):
+        rates.rate("USDT", "JPY")
+    with pytest.raises(ValueError):
+        rates.set_rate("USDT", "JPY", Decimal(0))
+
+    gbp_usdt = rates.rate("GBP", "USDT")
+    usdc_usdt = rates.rate("USDC", "USDT")
+    version = rates.version
+
+    rates.set_rate("GBP", "EUR", Decimal("1.2"))
+
+    assert rates.version == version + 1
+    assert rates.rate("GBP", "USDT") == Decimal("1.2") * Decimal("1.08")
+    assert rates.rate("GBP", "USDT") != gbp_usdt
+    # Cross rates which do not depend on the changed rate are kept.
+    assert rates.rate("USDC", "USDT") is usdc_usdt
+
+
+def test_conversion_rates_use_new_shorter_chain() -> None:
+    rates = make_rates()
+    assert rates.rate("GBP", "USDT") == Decimal("1.15") * Decimal("1.08")
+
+    rates.set_rate("GBP", "USDT", Decimal("1.25"))
+
+    assert rates.rate("GBP", "USDT") == Decimal("1.25")
+
+
+def test_conversion_rates_matrix() -> None:
+    rates = make_rates()
+
+    matrix = rates.matrix(["USDT", "EUR", "JPY"])
+
+    assert matrix[0][0] == Decimal(1)
+    assert matrix[1][0] == Decimal("1.08")
+    assert matrix[0][2] is None
+    assert matrix[2][2] == Decimal(1)
+
+
+def test_cross_arbitrage_with_same_currency_matches_arbitrage() -> None:
+    ask = ArbitragePayload(
+        symbol=SYMBOL, order=OrderInfo(price=Decimal("10.5"), quantity=Decimal(100))
+    )
+    bid = ArbitragePayload(
+        symbol=SYMBOL, order=OrderInfo(price=Decimal("11.5"), quantity=Decimal("50.3"))
+    )
+
+    expected = arbitrage(ask, bid)
+    result = cross_arbitrage(ask, bid, "USDT", "USDT", ConversionRates())
+
+    assert result.ask_order == expected.ask_order
+    assert result.bid_order == expected.bid_order
+    assert result.spread == expected.spread
+    assert result.profit == expected.profit
+    assert result.settlement_currency == "USDT"
+
+
+def test_cross_arbitrage_between_quote_currencies() -> None:
+    rates = make_rates()
+    ask = ArbitragePayload(
+        symbol=SYMBOL,
+        order=OrderInfo(price=Decimal(26000), quantity=Decimal(1)),
+        balance=Decimal(100000),
+    )
+    bid = ArbitragePayload(
+        symbol=replace(SYMBOL, min_notional=Decimal(10)),
+        order=OrderInfo(price=Decimal(24500), quantity=Decimal("0.5")),
+        balance=Decimal(2),
+    )
+
+    result = cross_arbitrage(ask, bid, "USDT", "EUR", rates, settlement_currency="EUR")
+
+    assert result.rate == Decimal("1.08")
+    assert result.bid_order.price == Decimal(24500)
+    assert result.bid_order.quantity == Decimal("0.50")
+    assert result.bid_order.notional_value == Decimal("12237.75")
+    assert result.ask_order.notional_value == Decimal("13013.00")
+    profit_usdt = Decimal("12237.75") * Decimal("1.08") - Decimal("13013.00")
+    assert result.profit == profit_usdt / Decimal("1.08")
+    assert result.spread > 0
@@ -0,0 +1,182 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from arbitragepy.depth import DepthIndex
+from arbitragepy.enums import OrderSide
+from arbitragepy.models import OrderInfo
+
+TICK = Decimal("0.5")
+
+
+def walk_cost(levels: list[OrderInfo], quantity: Decimal) -> Decimal | None:
+    cost = Decimal(0)
+    for level in levels:
+        taken = min(level.quantity, quantity)
+        cost += taken * level.price
+        quantity -= taken
+    return None if quantity else cost
+
+
+def walk_max_quantity(levels: list[OrderInfo], notional: Decimal) -> Decimal:
+    quantity = Decimal(0)
+    for level in levels:
+        if level.quantity * level.price > notional:
+            return quantity + notional / level.price
+        quantity += level.quantity
+        notional -= level.quantity * level.price
+    return quantity
+
+
+def random_levels(rng: random.Random, side: OrderSide) -> list[OrderInfo]:
+    ticks = rng.sample(range(201), 30)
+    ticks.sort(reverse=side is OrderSide.BID)
+    return [
+        OrderInfo(
+            price=Decimal(100) + tick * TICK,
+            quantity=Decimal(rng.randint(1, 5000)).scaleb(-3),
+        )
+        for tick in ticks
+    ]
+
+
+@pytest.mark.parametrize("side", [OrderSide.ASK, OrderSide.BID])
+def test_depth_index_agrees_with_walking_levels(side: OrderSide) -> None:
+    rng = random.Random(side.value)
+    index = DepthIndex(side, TICK, Decimal(100), Decimal(200))
+
+    for _ in range(20):
+        levels = random_levels(rng, side)
+        if rng.random() < 0.5:
+            index.set_levels(levels)
+        else:
+            for level in index.levels():
+                index.set_level(level.price, Decimal(0))
+            for level in levels:
+                index.set_level(level.price, level.quantity)
+
+        assert index.levels() == levels
+        assert index.best_price == levels[0].price
+        total = sum(level.quantity for level in levels)
+        assert index.total_quantity == total
+        assert index.total_notional == walk_cost(levels, total)
+
+        for _ in range(20):
+            quantity = Decimal(rng.randint(0, int(total * 1000) + 10)).scaleb(-3)
+            assert index.cost(quantity) == walk_cost(levels, quantity)
+
+            notional = Decimal(rng.randint(0, int(index.total_notional) + 100))
+            expected = walk_max_quantity(levels, notional)
+            assert index.max_quantity(notional, Decimal("0.001")) == (
+                expected.quantize(Decimal("0.001"), rounding="ROUND_DOWN")
+            )
+
+
+def test_depth_index_set_level() -> None:
+    index = DepthIndex(OrderSide.BID, TICK, Decimal(100), Decimal(110))
+
+    assert len(index) == 21
+    assert index.best_price is None
+    assert index.cost(Decimal(0)) == 0
+    assert index.cost(Decimal(1)) is None
+
+    index.set_level(Decimal("109.5"), Decimal(2))
+    index.set_level(Decimal(105), Decimal(3))
+    assert index.best_price == Decimal("109.5")
+    assert index.quantity(Decimal(105)) == 3
+    assert index.cost(Decimal(4)) == Decimal(219) + Decimal(210)
+    assert index.vwap(Decimal(4)) == Decimal("107.25")
+    assert index.vwap(Decimal(0)) is None
+    assert index.vwap(Decimal(6)) is None
+
+    index.set_level(Decimal("109.5"), Decimal(0))
+    assert index.best_price == Decimal(105)
+    assert index.levels() == [OrderInfo(price=Decimal(105), quantity=Decimal(3))]
+
+
+def test_depth_index_order() -> None:
+    index = DepthIndex(OrderSide.ASK, TICK, Decimal(100), Decimal(110))
+    index.set_levels(
+        [
+            OrderInfo(price=Decimal(100), quantity=Decimal(1)),
+            OrderInfo(price=Decimal(101), quantity=Decimal(1)),
+        ]
+    )
+
+    assert index.order(Decimal("1.55"), Decimal("0.1")) == OrderInfo(
+        price=Decimal("150.5") / Decimal("1.5"), quantity=Decimal("1.5")
+    )
+    assert index.order(Decimal(10), Decimal("0.1")) == OrderInfo(
+        price=Decimal("100.5"), quantity=Decimal(2)
+    )
+    assert index.order(Decimal("0.05"), Decimal("0.1")) is None
+    assert index.max_quantity(Decimal(1000), Decimal("0.1")) == 2
+
+
+def test_depth_index_errors() -> None:
+    with pytest.raises(ValueError):
+        DepthIndex(OrderSide.ASK, TICK, Decimal(100), Decimal("100.2"))
+    with pytest.raises(ValueError):
+        DepthIndex(OrderSide.ASK, TICK, Decimal(100), Decimal(99))
+    with pytest.raises(ValueError):
+        DepthIndex(OrderSide.ASK, TICK, Decimal(100), Decimal(110), max_ticks=20)
+
+    index = DepthIndex(OrderSide.ASK, TICK, Decimal(100), Decimal(110))
+    with pytest.raises(ValueError):
+        index.set_level(Decimal("100.2"), Decimal(1))
+    with pytest.raises(ValueError):
+        index.set_levels([OrderInfo(price=Decimal("99.7"), quantity=Decimal(1))])
+
+
+@pytest.mark.parametrize("side", [OrderSide.ASK, OrderSide.BID])
+def test_depth_index_grows_grid(side: OrderSide) -> None:
+    index = DepthIndex(side, TICK, Decimal(100), Decimal(110))
+    index.set_level(Decimal(105), Decimal(1))
+
+    assert index.quantity(Decimal(90)) == 0
+    assert index.set_level(Decimal(90), Decimal(2))
+    assert index.set_level(Decimal(130), Decimal(3))
+    assert index.set_level(Decimal(200), Decimal(0))
+
+    assert index.min_price <= 90 and index.max_price >= 130
+    levels = [
+        OrderInfo(price=Decimal(90), quantity=Decimal(2)),
+        OrderInfo(price=Decimal(105), quantity=Decimal(1)),
+        OrderInfo(price=Decimal(130), quantity=Decimal(3)),
+    ]
+    if side is OrderSide.BID:
+        levels.reverse()
+    assert index.levels() == levels
+    assert index.total_quantity == 6
+    assert index.total_notional == Decimal(675)
+    assert index.cost(Decimal(6)) == Decimal(675)
+
+
+def test_depth_index_max_ticks_keeps_ticks_near_best_price() -> None:
+    index = DepthIndex(OrderSide.ASK, TICK, Decimal(100), Decimal(105), max_ticks=21)
+    index.set_level(Decimal(100), Decimal(1))
+    index.set_level(Decimal(105), Decimal(2))
+
+    assert not index.set_level(Decimal("110.5"), Decimal(3))
+    assert index.set_level(Decimal(110), Decimal(3))
+    assert len(index) == 21
+
+    assert index.set_level(Decimal(96), Decimal(4))
+    assert len(index) == 21
+    assert (index.min_price, index.max_price) == (Decimal(96), Decimal(106))
+    assert index.levels() == [
+        OrderInfo(price=Decimal(96), quantity=Decimal(4)),
+        OrderInfo(price=Decimal(100), quantity=Decimal(1)),
+        OrderInfo(price=Decimal(105), quantity=Decimal(2)),
+    ]
+    assert index.total_quantity == 7
+
+    index.set_levels(
+        [
+            OrderInfo(price=Decimal(200), quantity=Decimal(1)),
+            OrderInfo(price=Decimal(220), quantity=Decimal(1)),
+        ]
+    )
+    assert (index.min_price, index.max_price) == (Decimal(200), Decimal(210))
+    assert index.levels() == [OrderInfo(price=Decimal(200), quantity=Decimal(1))]
@@ -0,0 +1,151 @@
+import asyncio
+from decimal import Decimal
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.enums import OrderSide, OrderStatus
+from arbitragepy.exceptions import (
+    InsufficientBalanceError,
+    NotionalLessThanMinNotionalError,
+    PriceNotAlignedError,
+    QuantityGreaterThanMaxQuantityError,
+    QuantityNotAlignedError,
+)
+from arbitragepy.exchange import SimulatedExchange, execute
+from arbitragepy.models import ArbitragePayload, OrderInfo, OrderPayload, SymbolInfo
+
+SYMBOL = SymbolInfo(
+    quantity_increment=Decimal("0.01"),
+    max_quantity=Decimal(10),
+    min_notional=Decimal(5),
+    fee=Decimal("0.1"),
+    price_precision=Decimal("0.5"),
+)
+
+
+def order(price: str, quantity: str) -> OrderPayload:
+    return OrderPayload(
+        price=Decimal(price),
+        quantity=Decimal(quantity),
+        notional_value=Decimal(0),
+        taken_fee=Decimal(0),
+    )
+
+
+def make_exchange(info: SymbolInfo = SYMBOL, **kwargs) -> SimulatedExchange:
+    exchange = SimulatedExchange("a", **kwargs)
+    exchange.add_symbol("BTC/USDT", info, "BTC", "USDT")
+    exchange.set_book(
+        "BTC/USDT",
+        asks=[
+            OrderInfo(price=Decimal(10), quantity=Decimal(1)),
+            OrderInfo(price=Decimal(11), quantity=Decimal(2)),
+        ],
+        bids=[
+            OrderInfo(price=Decimal(9), quantity=Decimal(1)),
+            OrderInfo(price=Decimal(8), quantity=Decimal(2)),
+        ],
+    )
+    exchange.deposit("USDT", Decimal(100))
+    exchange.deposit("BTC", Decimal(5))
+    return exchange
+
+
+def test_buy_walks_the_book_and_charges_quote_fee() -> None:
+    exchange = make_exchange()
+
+    report = exchange.place_order("BTC/USDT", OrderSide.ASK, order("11", "2"))
+
+    assert report.status == OrderStatus.FILLED
+    assert report.quantity == Decimal(2)
+    assert report.taken_fee == Decimal("0.021")
+    assert report.notional_value == Decimal("21.021")
+    assert exchange.balance("USDT") == Decimal("78.979")
+    assert exchange.balance("BTC") == Decimal(7)
+    asks, _ = exchange.book("BTC/USDT")
+    assert asks == [OrderInfo(price=Decimal(11), quantity=Decimal(1))]
+
+
+def test_buy_with_fee_in_base_currency() -> None:
+    info = SymbolInfo(
+        quantity_increment=Decimal("0.01"),
+        fee_in_base_currency=True,
+        fee=Decimal("0.1"),
+    )
+    exchange = make_exchange(info)
+
+    report = exchange.place_order("BTC/USDT", OrderSide.ASK, order("10", "1"))
+
+    assert report.taken_fee == Decimal("0.001")
+    assert report.notional_value == Decimal(10)
+    assert exchange.balance("BTC") == Decimal("5.999")
+
+
+def test_sell_is_partially_filled_up_to_price() -> None:
+    exchange = make_exchange()
+
+    report = exchange.place_order("BTC/USDT", OrderSide.BID, order("9", "2"))
+
+    assert report.status == OrderStatus.PARTIALLY_FILLED
+    assert report.quantity == Decimal(1)
+    assert report.notional_value == Decimal("8.991")
+    assert exchange.balance("BTC") == Decimal(4)
+    assert exchange.balance("USDT") == Decimal("108.991")
+
+    report = exchange.place_order("BTC/USDT", OrderSide.BID, order("9", "1"))
+    assert report.status == OrderStatus.EXPIRED
+    assert report.quantity == Decimal(0)
+
+
+def test_rejections_change_nothing() -> None:
+    exchange = make_exchange()
+
+    for side, payload, error in [
+        (OrderSide.ASK, order("10", "0.005"), QuantityNotAlignedError),
+        (OrderSide.ASK, order("10", "0.4"), NotionalLessThanMinNotionalError),
+        (OrderSide.ASK, order("10.1", "1"), PriceNotAlignedError),
+        (OrderSide.ASK, order("11", "10.01"), QuantityGreaterThanMaxQuantityError),
+        (OrderSide.ASK, order("11", "9.1"), InsufficientBalanceError),
+        (OrderSide.BID, order("8", "6"), InsufficientBalanceError),
+    ]:
+        report = exchange.place_order("BTC/USDT", side, payload)
+        assert report.status == OrderStatus.REJECTED
+        assert isinstance(report.error, error)
+
+    assert exchange.balance("USDT") == Decimal(100)
+    assert exchange.balance("BTC") == Decimal(5)
+    assert len(exchange.book("BTC/USDT")[0]) == 2
+
+
+def test_execute_arbitrage_result_with_latency() -> None:
+    ask_exchange = make_exchange(latency=lambda: 0.001)
+    bid_exchange = SimulatedExchange("b", latency=lambda: 0.002)
+    bid_exchange.add_symbol("BTC/USDT", SYMBOL, "BTC", "USDT")
+    bid_exchange.set_book(
+        "BTC/USDT", asks=[], bids=[OrderInfo(price=Decimal(12), quantity=Decimal(3))]
+    )
+    bid_exchange.deposit("BTC", Decimal(1))
+
+    result = arbitrage(
+        ArbitragePayload(
+            symbol=SYMBOL,
+            order=OrderInfo(price=Decimal(10), quantity=Decimal(1)),
+            balance=ask_exchange.balance("USDT"),
+        ),
+        ArbitragePayload(
+            symbol=SYMBOL,
+            order=OrderInfo(price=Decimal(12), quantity=Decimal(3)),
+            balance=bid_exchange.balance("BTC"),
+        ),
+    )
+
+    ask_report, bid_report = asyncio.run(
+        execute(ask_exchange, bid_exchange, "BTC/USDT", result)
+    )
+
+    assert ask_report.status == bid_report.status == OrderStatus.FILLED
+    assert ask_report.notional_value == result.ask_order.notional_value
+    assert bid_report.notional_value == result.bid_order.notional_value
+    assert (
+        bid_exchange.balance("USDT") - (Decimal(100) - ask_exchange.balance("USDT"))
+        == result.profit
+    )
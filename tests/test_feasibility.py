@@ -0,0 +1,175 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.enums import OrderSide
+from arbitragepy.exceptions import (
+    ArbitrageError,
+    ImcompabileQuantityIncrementsError,
+    NotionalLessThanMinNotionalError,
+    QuantityLessThanMinQuantityError,
+)
+from arbitragepy.feasibility import NegativeCache, find_infeasibility
+from arbitragepy.fee_schedule import FeeSchedule, FeeTier
+from arbitragepy.models import ArbitragePayload, OrderInfo, SymbolInfo
+from arbitragepy.reactor import ArbitrageReactor
+
+SYMBOL = SymbolInfo(
+    quantity_increment=Decimal("0.01"),
+    min_quantity=Decimal(1),
+    min_notional=Decimal(10),
+    fee=Decimal("0.1"),
+)
+
+
+def make_payloads(
+    ask_balance: str | None,
+    bid_balance: str | None,
+    ask_price: str = "10",
+    bid_price: str = "11",
+    symbol: SymbolInfo = SYMBOL,
+) -> tuple[ArbitragePayload, ArbitragePayload]:
+    return (
+        ArbitragePayload(
+            symbol=symbol,
+            order=OrderInfo(price=Decimal(ask_price), quantity=Decimal(100)),
+            balance=None if ask_balance is None else Decimal(ask_balance),
+        ),
+        ArbitragePayload(
+            symbol=symbol,
+            order=OrderInfo(price=Decimal(bid_price), quantity=Decimal(100)),
+            balance=None if bid_balance is None else Decimal(bid_balance),
+        ),
+    )
+
+
+def test_find_infeasibility() -> None:
+    assert find_infeasibility(*make_payloads(None, None)) is None
+    assert find_infeasibility(*make_payloads("1000", "100")) is None
+
+    infeasibility = find_infeasibility(*make_payloads("5", "100"))
+    assert infeasibility is not None
+    assert isinstance(infeasibility.reason, NotionalLessThanMinNotionalError)
+    assert infeasibility.reason.side is OrderSide.ASK
+
+    infeasibility = find_infeasibility(*make_payloads("1000", "0.5"))
+    assert infeasibility is not None
+    assert isinstance(infeasibility.reason, QuantityLessThanMinQuantityError)
+    assert infeasibility.reason.side is OrderSide.BID
+
+    infeasibility = find_infeasibility(*make_payloads("11", "100", ask_price="12"))
+    assert infeasibility is not None
+    assert infeasibility.min_ask_price == Decimal(12)
+    assert infeasibility.max_bid_price is None
+
+    infeasibility = find_infeasibility(*make_payloads("1000", "1", bid_price="5"))
+    assert infeasibility is not None
+    assert infeasibility.max_bid_price == Decimal(5)
+
+    ask, bid = make_payloads(None, None)
+    bid = ArbitragePayload(
+        symbol=SymbolInfo(quantity_increment=Decimal("0.015")), order=bid.order
+    )
+    infeasibility = find_infeasibility(ask, bid)
+    assert infeasibility is not None
+    assert isinstance(infeasibility.reason, ImcompabileQuantityIncrementsError)
+    assert (
+        find_infeasibility(ask, bid, make_compatible_quantity_increments=False) is None
+    )
+
+
+def test_find_infeasibility_agrees_with_arbitrage() -> None:
+    rng = random.Random(3)
+    for _ in range(2000):
+        symbol = SymbolInfo(
+            quantity_increment=rng.choice([Decimal("0.01"), Decimal("0.1")]),
+            min_quantity=Decimal(rng.randrange(3)),
+            min_notional=Decimal(rng.randrange(30)),
+            fee_in_base_currency=rng.random() < 0.5,
+            fee=Decimal("0.1"),
+        )
+        ask, bid = make_payloads(
+            str(rng.randrange(50)),
+            str(Decimal(rng.randrange(500)) / 100),
+            ask_price=str(rng.randrange(5, 15)),
+            bid_price=str(rng.randrange(5, 15)),
+            symbol=symbol,
+        )
+        if find_infeasibility(ask, bid) is not None:
+            with pytest.raises(ArbitrageError):
+                arbitrage(ask, bid)
+
+
+def test_negative_cache() -> None:
+    cache = NegativeCache()
+    ask, bid = make_payloads("11", "100", ask_price="12")
+
+    assert cache.get("pair", ask, bid) is None
+    reason = cache.record("pair", ask, bid)
+    assert isinstance(reason, QuantityLessThanMinQuantityError)
+    assert cache.get("pair", ask, bid) is reason
+
+    # Verdict holds for higher ask prices only.
+    assert cache.get("pair", *make_payloads("11", "100", ask_price="13")) is reason
+    assert cache.get("pair", *make_payloads("11", "100", ask_price="9")) is None
+    assert len(cache) == 0
+
+    cache.record("pair", ask, bid)
+    assert cache.get("pair", ask, bid, version=1) is None
+
+    cache.record("pair", ask, bid)
+    assert cache.get("pair", *make_payloads("12", "100", ask_price="12")) is None
+
+    assert cache.record("pair", *make_payloads("1000", "100")) is None
+    assert len(cache) == 0
+
+
+def test_reactor_skips_infeasible_pairs() -> None:
+    cache = NegativeCache()
+    reactor = ArbitrageReactor(negative_cache=cache)
+    reactor.add_market("a", "BTC/USDT", SYMBOL, "BTC", "USDT")
+    reactor.add_market("b", "BTC/USDT", SYMBOL, "BTC", "USDT")
+    reactor.update_balance("a", "USDT", Decimal(5))
+    reactor.update_balance("b", "BTC", Decimal(100))
+    ask = OrderInfo(price=Decimal(10), quantity=Decimal(100))
+    bid = OrderInfo(price=Decimal(11), quantity=Decimal(100))
+    reactor.update_quote("a", "BTC/USDT", ask, bid)
+    reactor.update_quote("b", "BTC/USDT", ask, bid)
+
+    ctx = reactor.pair(("BTC/USDT", "a", "b"))
+    assert isinstance(ctx.error, ArbitrageError)
+    assert len(cache) == 1
+
+    # Cached reason is returned without running arbitrage.
+    reactor.update_quote("b", "BTC/USDT", ask, bid)
+    error = ctx.error
+    assert isinstance(error, NotionalLessThanMinNotionalError)
+    reactor.update_quote("b", "BTC/USDT", ask, bid)
+    assert ctx.error is error
+
+    reactor.update_balance("a", "USDT", Decimal(1000))
+    assert ctx.result is not None
+
+
+def test_negative_cache_with_fee_schedule() -> None:
+    schedule = FeeSchedule(
+        [
+            FeeTier(Decimal(0), Decimal("0.1"), Decimal("0.1")),
+            FeeTier(Decimal(1000), Decimal(0), Decimal("0.05")),
+        ]
+    )
+    symbol = SymbolInfo(
+        quantity_increment=Decimal("0.01"),
+        min_quantity=Decimal(1),
+        fee_schedule=schedule,
+    )
+    cache = NegativeCache()
+    ask, bid = make_payloads("11", "100", ask_price="12", symbol=symbol)
+
+    assert cache.record("pair", ask, bid) is not None
+    assert cache.get("pair", ask, bid) is not None
+
+    schedule.set_volume(Decimal(5000))
+    assert cache.get("pair", ask, bid) is None
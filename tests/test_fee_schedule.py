@@ -0,0 +1,90 @@
+from dataclasses import replace
+from decimal import Decimal
+
+import pytest
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.enums import Liquidity
+from arbitragepy.fee_schedule import FeeSchedule, FeeTier
+from arbitragepy.models import ArbitragePayload, OrderInfo, SymbolInfo
+
+TIERS = [
+    FeeTier(
+        min_volume=Decimal(1_000_000), maker_fee=Decimal(0), taker_fee=Decimal("0.04")
+    ),
+    FeeTier(min_volume=Decimal(0), maker_fee=Decimal("0.1"), taker_fee=Decimal("0.1")),
+    FeeTier(
+        min_volume=Decimal(50_000), maker_fee=Decimal("0.08"), taker_fee=Decimal("0.09")
+    ),
+]
+
+
+def test_fee_schedule() -> None:
+    schedule = FeeSchedule(TIERS)
+
+    assert [tier.min_volume for tier in schedule.tiers] == [0, 50_000, 1_000_000]
+    assert schedule.tier == 0
+    assert schedule.version == 0
+    assert schedule.maker_fee == Decimal("0.1")
+    assert schedule.taker_fee == Decimal("0.1")
+    assert schedule.fee(Liquidity.MAKER) == Decimal("0.1")
+
+    assert schedule.set_volume(Decimal(60_000))
+    assert schedule.tier == 1
+    assert schedule.version == 1
+    assert schedule.fee(Liquidity.MAKER) == Decimal("0.08")
+    assert schedule.fee(Liquidity.TAKER) == Decimal("0.09")
+
+    # Volume inside the same tier does not change version.
+    assert not schedule.set_volume(Decimal(70_000))
+    assert schedule.volume == Decimal(70_000)
+    assert schedule.version == 1
+
+    assert schedule.set_volume(Decimal(1_000_000))
+    assert schedule.taker_fee == Decimal("0.04")
+    assert schedule.set_tier(0)
+    assert schedule.taker_fee == Decimal("0.1")
+    assert schedule.version == 3
+
+
+def test_fee_schedule_initial_volume() -> None:
+    assert FeeSchedule(TIERS, volume=Decimal(2_000_000)).tier == 2
+    assert FeeSchedule(TIERS[:1], volume=Decimal(5)).tier == 0
+
+
+def test_fee_schedule_errors() -> None:
+    with pytest.raises(ValueError):
+        FeeSchedule([])
+    with pytest.raises(IndexError):
+        FeeSchedule(TIERS).set_tier(3)
+
+
+def test_arbitrage_with_fee_schedule() -> None:
+    schedule = FeeSchedule(TIERS)
+    symbol = SymbolInfo(
+        quantity_increment=Decimal("0.01"), fee=Decimal(5), fee_schedule=schedule
+    )
+    ask = ArbitragePayload(
+        symbol=symbol, order=OrderInfo(price=Decimal(100), quantity=Decimal(2))
+    )
+    bid = ArbitragePayload(
+        symbol=symbol, order=OrderInfo(price=Decimal(101), quantity=Decimal(3))
+    )
+
+    def with_fee(fee: str) -> ArbitragePayload:
+        return replace(
+            ask, symbol=SymbolInfo(quantity_increment=Decimal("0.01"), fee=Decimal(fee))
+        )
+
+    assert symbol.taker_fee == Decimal("0.1")
+    result = arbitrage(ask, bid)
+    assert result == arbitrage(
+        with_fee("0.1"), replace(bid, symbol=with_fee("0.1").symbol)
+    )
+
+    schedule.set_volume(Decimal(1_000_000))
+    assert symbol.taker_fee == Decimal("0.04")
+    assert arbitrage(ask, bid).profit > result.profit
+    assert arbitrage(ask, bid) == arbitrage(
+        with_fee("0.04"), replace(bid, symbol=with_fee("0.04").symbol)
+    )
@@ -0,0 +1,181 @@
+import threading
+from decimal import Decimal
+
+import pytest
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.exceptions import InsufficientBalanceError
+from arbitragepy.ledger import BalanceLedger
+from arbitragepy.models import ArbitragePayload, OrderInfo, SymbolInfo
+from arbitragepy.reactor import ArbitrageReactor
+
+SYMBOL = SymbolInfo(quantity_increment=Decimal("0.01"), fee=Decimal("0.1"))
+
+
+def test_balance_ledger_reserve_commit_release() -> None:
+    ledger = BalanceLedger()
+    ledger.set_balance("a", "USDT", Decimal(100))
+    ledger.set_balance("b", "BTC", Decimal(2))
+
+    reservation = ledger.reserve({("a", "USDT"): Decimal(60), ("b", "BTC"): Decimal(1)})
+    assert ledger.available("a", "USDT") == Decimal(40)
+    assert ledger.reserved("b", "BTC") == Decimal(1)
+
+    with pytest.raises(InsufficientBalanceError) as exc_info:
+        ledger.reserve({("a", "USDT"): Decimal(10), ("b", "BTC"): Decimal(2)})
+    assert exc_info.value.available == Decimal(1)
+    # Nothing is reserved if one of balances is insufficient.
+    assert ledger.available("a", "USDT") == Decimal(40)
+
+    ledger.commit(
+        reservation, spent={("a", "USDT"): Decimal(50), ("b", "BTC"): Decimal(1)}
+    )
+    assert ledger.available("a", "USDT") == Decimal(50)
+    assert ledger.reserved("a", "USDT") == Decimal(0)
+    assert ledger.available("b", "BTC") == Decimal(1)
+
+    with pytest.raises(ValueError):
+        ledger.release(reservation)
+
+    reservation = ledger.reserve({("b", "BTC"): Decimal(1)})
+    ledger.release(reservation)
+    assert ledger.available("b", "BTC") == Decimal(1)
+
+    with pytest.raises(InsufficientBalanceError):
+        ledger.reserve({("c", "BTC"): Decimal(1)})
+
+
+def test_balance_ledger_concurrent_reservations() -> None:
+    ledger = BalanceLedger()
+    ledger.set_balance("a", "USDT", Decimal(1000))
+    reservations = []
+    failures = []
+
+    def worker() -> None:
+        for _ in range(200):
+            try:
+                reservations.append(ledger.reserve({("a", "USDT"): Decimal(1)}))
+            except InsufficientBalanceError:
+                failures.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(reservations) == 1000
+    assert len(failures) == 600
+    assert ledger.available("a", "USDT") == Decimal(0)
+
+
+def test_balance_ledger_feeds_reactor() -> None:
+    reactor = ArbitrageReactor()
+    reactor.add_market("a", "BTC/USDT", SYMBOL, "BTC", "USDT")
+    reactor.add_market("b", "BTC/USDT", SYMBOL, "BTC", "USDT")
+    ledger = BalanceLedger(on_change=reactor.update_balance)
+    ledger.set_balance("a", "USDT", Decimal(2000))
+    ledger.set_balance("b", "BTC", Decimal(65))
+    reactor.update_quote(
+        "a",
+        "BTC/USDT",
+        OrderInfo(price=Decimal("10.5"), quantity=Decimal("100.15")),
+        None,
+    )
+    reactor.update_quote(
+        "b",
+        "BTC/USDT",
+        None,
+        OrderInfo(price=Decimal("11.5"), quantity=Decimal("50.3")),
+    )
+
+    result = reactor.pair(("BTC/USDT", "a", "b")).result
+    assert result is not None
+    assert result == arbitrage(
+        ArbitragePayload(
+            symbol=SYMBOL,
+            order=OrderInfo(price=Decimal("10.5"), quantity=Decimal("100.15")),
+            balance=Decimal(2000),
+        ),
+        ArbitragePayload(
+            symbol=SYMBOL,
+            order=OrderInfo(price=Decimal("11.5"), quantity=Decimal("50.3")),
+            balance=Decimal(65),
+        ),
+    )
+
+    ledger.reserve_result(result, "a", "USDT", "b", "BTC")
+    assert (
+        reactor.balance("a", "USDT") == Decimal(2000) - result.ask_order.notional_value
+    )
+    assert reactor.balance("b", "BTC") == Decimal(65) - result.bid_order.quantity
+    new_result = reactor.pair(("BTC/USDT", "a", "b")).result
+    assert new_result is not None
+    assert new_result.ask_order.quantity == Decimal("14.7")
+
+
+def test_balance_ledger_releases_reservation_if_notification_fails() -> None:
+    calls = []
+
+    def on_change(venue: str, currency: str, balance: Decimal) -> None:
+        calls.append((venue, currency, balance))
+        if balance == 0:
+            raise RuntimeError("subscriber failed")
+
+    ledger = BalanceLedger(on_change=on_change)
+    ledger.set_balance("a", "USDT", Decimal(100))
+    ledger.set_balance("b", "BTC", Decimal(2))
+
+    with pytest.raises(RuntimeError):
+        ledger.reserve({("a", "USDT"): Decimal(100), ("b", "BTC"): Decimal(1)})
+
+    assert ledger.available("a", "USDT") == Decimal(100)
+    assert ledger.available("b", "BTC") == Decimal(2)
+    # Both accounts were notified of the reservation and of its release.
+    assert calls[-2:] == [("a", "USDT", Decimal(100)), ("b", "BTC", Decimal(2))]
+    assert ("b", "BTC", Decimal(1)) in calls
+
+
+def test_balance_ledger_notifies_every_account_if_notifications_fail() -> None:
+    calls = []
+    failing = threading.Event()
+
+    def on_change(venue: str, currency: str, balance: Decimal) -> None:
+        if failing.is_set():
+            calls.append((venue, currency, balance))
+            raise RuntimeError(venue)
+
+    ledger = BalanceLedger(on_change=on_change)
+    ledger.set_balance("a", "USDT", Decimal(100))
+    ledger.set_balance("b", "BTC", Decimal(2))
+    reservation = ledger.reserve({("a", "USDT"): Decimal(10), ("b", "BTC"): Decimal(1)})
+
+    failing.set()
+    with pytest.raises(RuntimeError, match="b"):
+        ledger.release(reservation)
+
+    assert calls == [("a", "USDT", Decimal(100)), ("b", "BTC", Decimal(2))]
+
+
+def test_balance_ledger_last_notification_has_latest_balance() -> None:
+    notified: dict[tuple[str, str], Decimal] = {}
+    ledger = BalanceLedger(
+        on_change=lambda venue, currency, balance: notified.__setitem__(
+            (venue, currency), balance
+        )
+    )
+    ledger.set_balance("a", "USDT", Decimal(1000))
+
+    def worker() -> None:
+        for _ in range(200):
+            reservation = ledger.reserve({("a", "USDT"): Decimal(1)})
+            ledger.commit(reservation, spent={("a", "USDT"): Decimal("0.5")})
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert ledger.available("a", "USDT") == Decimal(200)
+    assert notified[("a", "USDT")] == Decimal(200)
@@ -0,0 +1,52 @@
+from decimal import Decimal
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.matrix import best_pairs, spread_matrix
+from arbitragepy.models import ArbitragePayload, OrderInfo, SymbolInfo
+
+
+def D(s: str) -> Decimal:
+    return Decimal(s)
+
+
+def test_spread_matrix() -> None:
+    asks = [[D("10.5"), D("11.2"), None], [D("100"), D("101"), D("99")]]
+    bids = [[D("10.4"), D("11.5"), None], [D("99"), D("100"), D("98")]]
+    quantities = [[D("100.15"), D("50.3"), None], [D("1"), D("2"), D("3")]]
+    fees = [[D("0.1"), D("0.1"), D("0.1")], [D("0"), D("0"), D("0")]]
+    increments = [[D("0.01"), D("0.01"), D("0.01")], [D("0.1"), D("0.3"), D("1")]]
+
+    matrix = spread_matrix(asks, quantities, bids, quantities, fees, increments)
+
+    expected = arbitrage(
+        ask=ArbitragePayload(
+            symbol=SymbolInfo(quantity_increment=D("0.01"), fee=D("0.1")),
+            order=OrderInfo(price=D("10.5"), quantity=D("100.15")),
+        ),
+        bid=ArbitragePayload(
+            symbol=SymbolInfo(quantity_increment=D("0.01"), fee=D("0.1")),
+            order=OrderInfo(price=D("11.5"), quantity=D("50.3")),
+        ),
+    )
+    assert matrix.spreads[0][0][1] == expected.spread
+    assert matrix.quantities[0][0][1] == expected.ask_order.quantity
+    assert matrix.spreads[0][0][0] is None
+    assert matrix.spreads[0][0][2] is None
+    assert matrix.spreads[0][2][0] is None
+
+    # 0.3 and 0.1 increments are compatible, 0.3 and 1 are not.
+    assert matrix.quantities[1][0][1] == D("0.9")
+    assert matrix.spreads[1][1][2] is None
+    assert matrix.spreads[1][2][0] == D("0")
+
+
+def test_best_pairs() -> None:
+    asks = [[D("10"), D("11")], [D("10"), None]]
+    bids = [[D("9"), D("10.5")], [D("9"), None]]
+    quantities = [[D("1"), D("1")], [D("1"), None]]
+    fees = [[D("0"), D("0")], [D("0"), D("0")]]
+    increments = [[D("0.1"), D("0.1")], [D("0.1"), D("0.1")]]
+
+    matrix = spread_matrix(asks, quantities, bids, quantities, fees, increments)
+
+    assert best_pairs(matrix) == [(0, 1, D("5")), None]
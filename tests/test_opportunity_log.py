@@ -0,0 +1,123 @@
+from dataclasses import replace
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.enums import FsyncPolicy
+from arbitragepy.models import ArbitragePayload, OrderInfo, SymbolInfo
+from arbitragepy.opportunity_log import (
+    OpportunityLogReader,
+    OpportunityLogWriter,
+    log_files,
+)
+
+RESULT = arbitrage(
+    ask=ArbitragePayload(
+        symbol=SymbolInfo(quantity_increment=Decimal("0.01"), fee=Decimal("0.1")),
+        order=OrderInfo(price=Decimal("10.5"), quantity=Decimal("100.15")),
+    ),
+    bid=ArbitragePayload(
+        symbol=SymbolInfo(quantity_increment=Decimal("0.01"), fee=Decimal("0.1")),
+        order=OrderInfo(price=Decimal("11.5"), quantity=Decimal("50.3")),
+    ),
+)
+
+
+def test_opportunity_log_round_trip(tmp_path: Path) -> None:
+    with OpportunityLogWriter(tmp_path, batch_size=3) as writer:
+        for i in range(10):
+            writer.append(RESULT, timestamp_ns=i)
+
+    (path,) = log_files(tmp_path)
+    with OpportunityLogReader(path) as reader:
+        assert len(reader) == 10
+        record = reader[-1]
+
+    assert record.timestamp_ns == 9
+    assert record.result.ask_order == RESULT.ask_order
+    assert record.result.bid_order == RESULT.bid_order
+    assert record.result.profit == RESULT.profit
+    assert record.result.spread == Decimal("9.30498073")
+
+
+def test_opportunity_log_rotation(tmp_path: Path) -> None:
+    with OpportunityLogWriter(
+        tmp_path, max_file_size=16 + 88 * 4, fsync=FsyncPolicy.ON_FLUSH
+    ) as writer:
+        for i in range(10):
+            writer.append(RESULT, timestamp_ns=i)
+
+    paths = log_files(tmp_path)
+    assert [p.name for p in paths] == [
+        "opportunities-000000.arblog",
+        "opportunities-000001.arblog",
+        "opportunities-000002.arblog",
+    ]
+    timestamps = []
+    for path in paths:
+        with OpportunityLogReader(path) as reader:
+            timestamps.extend(record.timestamp_ns for record in reader)
+    assert timestamps == list(range(10))
+
+    # New writer never appends to existing files.
+    with OpportunityLogWriter(tmp_path) as writer:
+        assert writer.path.name == "opportunities-000003.arblog"
+
+
+def test_opportunity_log_filter(tmp_path: Path) -> None:
+    with OpportunityLogWriter(tmp_path) as writer:
+        for i in range(100):
+            writer.append(RESULT, timestamp_ns=i)
+
+    with OpportunityLogReader(log_files(tmp_path)[0]) as reader:
+        threshold = reader.to_fixed(Decimal(95))
+        assert list(reader.filter("timestamp_ns", lambda v: v >= 95)) == list(
+            range(95, 100)
+        )
+        assert list(reader.filter("profit", lambda v: v > threshold)) == []
+
+
+def test_opportunity_log_reader_with_invalid_file(tmp_path: Path) -> None:
+    path = tmp_path / "invalid.arblog"
+    path.write_bytes(b"x" * 32)
+
+    with pytest.raises(ValueError):
+        OpportunityLogReader(path)
+
+
+def test_opportunity_log_reader_with_truncated_file(tmp_path: Path) -> None:
+    with OpportunityLogWriter(tmp_path) as writer:
+        writer.append(RESULT, timestamp_ns=1)
+        writer.append(RESULT, timestamp_ns=2)
+    (path,) = log_files(tmp_path)
+    data = path.read_bytes()
+
+    for size in [0, 5]:
+        path.write_bytes(data[:size])
+        with pytest.raises(ValueError, match="header"):
+            OpportunityLogReader(path)
+
+    # Incomplete last record is ignored.
+    path.write_bytes(data[:-1])
+    with OpportunityLogReader(path) as reader:
+        assert [record.timestamp_ns for record in reader] == [1]
+
+
+def test_opportunity_log_rejects_values_out_of_range(tmp_path: Path) -> None:
+    too_large = replace(
+        RESULT, ask_order=replace(RESULT.ask_order, notional_value=Decimal("1e11"))
+    )
+
+    with OpportunityLogWriter(tmp_path) as writer:
+        writer.append(RESULT, timestamp_ns=1)
+        with pytest.raises(ValueError, match="int64"):
+            writer.append(too_large, timestamp_ns=2)
+        with pytest.raises(ValueError):
+            writer.append(replace(RESULT, spread=Decimal("inf")), timestamp_ns=3)
+        writer.append(RESULT, timestamp_ns=4)
+
+    (path,) = log_files(tmp_path)
+    with OpportunityLogReader(path) as reader:
+        assert [record.timestamp_ns for record in reader] == [1, 4]
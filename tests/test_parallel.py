@@ -0,0 +1,68 @@
+from decimal import ROUND_DOWN, Context, Decimal, localcontext
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.exceptions import QuantityLessThanMinQuantityError, ZeroQuantityError
+from arbitragepy.models import ArbitragePayload, OrderInfo, SymbolInfo
+from arbitragepy.parallel import ConcurrentEvaluator
+
+SYMBOL = SymbolInfo(quantity_increment=Decimal("0.01"), fee=Decimal("0.1"))
+
+
+def make_pair(ask_quantity: str) -> tuple[ArbitragePayload, ArbitragePayload]:
+    return (
+        ArbitragePayload(
+            symbol=SYMBOL,
+            order=OrderInfo(price=Decimal("10.5"), quantity=Decimal(ask_quantity)),
+        ),
+        ArbitragePayload(
+            symbol=SYMBOL,
+            order=OrderInfo(price=Decimal("11.5"), quantity=Decimal("50.3")),
+        ),
+    )
+
+
+def test_concurrent_evaluator() -> None:
+    pairs = [make_pair(str(i)) for i in range(1, 101)]
+
+    with ConcurrentEvaluator(max_workers=4, chunk_size=7) as evaluator:
+        results = evaluator.evaluate(pairs)
+
+    assert results == [arbitrage(ask, bid) for ask, bid in pairs]
+
+
+def test_concurrent_evaluator_with_rejection() -> None:
+    symbol = SymbolInfo(quantity_increment=Decimal("0.01"), min_quantity=Decimal(1))
+    ask, bid = make_pair("0.5")
+    pair = (
+        ArbitragePayload(symbol=symbol, order=ask.order),
+        ArbitragePayload(symbol=symbol, order=bid.order),
+    )
+
+    with ConcurrentEvaluator(max_workers=2) as evaluator:
+        (result,) = evaluator.evaluate([pair])
+
+    assert isinstance(result, QuantityLessThanMinQuantityError)
+
+
+def test_concurrent_evaluator_rejects_zero_quantity_in_batch() -> None:
+    pairs = [make_pair("1"), make_pair("0.005"), make_pair("2")]
+
+    with ConcurrentEvaluator(max_workers=2, chunk_size=3) as evaluator:
+        first, zero, last = evaluator.evaluate(pairs)
+
+    assert first == arbitrage(*pairs[0])
+    assert isinstance(zero, ZeroQuantityError)
+    assert last == arbitrage(*pairs[2])
+
+
+def test_concurrent_evaluator_uses_own_context() -> None:
+    pairs = [make_pair("100.15")]
+    context = Context(prec=5, rounding=ROUND_DOWN)
+    with localcontext(context):
+        expected = arbitrage(*pairs[0])
+
+    with ConcurrentEvaluator(max_workers=1, context=context) as evaluator:
+        (result,) = evaluator.evaluate(pairs)
+
+    assert result == expected
+    assert result.spread == Decimal("9.3000")
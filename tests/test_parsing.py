@@ -0,0 +1,69 @@
+from decimal import Decimal
+
+import pytest
+
+from arbitragepy.exceptions import QuantityNotAlignedError
+from arbitragepy.models import OrderInfo
+from arbitragepy.parsing import (
+    parse_levels,
+    parse_quantity,
+    parse_scaled,
+    parse_scaled_levels,
+    to_scaled,
+)
+
+
+def test_parse_scaled() -> None:
+    assert parse_scaled("0.00012340", 8) == 12340
+    assert parse_scaled("0.0001234", 8) == 12340
+    assert parse_scaled("0.000123400000", 8) == 12340
+    assert parse_scaled("15", 2) == 1500
+    assert parse_scaled("-1.5", 2) == -150
+    assert parse_scaled(".5", 1) == 5
+
+
+def test_parse_scaled_with_invalid_string() -> None:
+    with pytest.raises(ValueError):
+        parse_scaled("0.001", 2)
+    with pytest.raises(ValueError):
+        parse_scaled("1e-5", 8)
+    with pytest.raises(ValueError):
+        parse_scaled("", 8)
+
+
+def test_to_scaled() -> None:
+    assert to_scaled(Decimal("0.01"), 8) == 1000000
+
+    with pytest.raises(ValueError):
+        to_scaled(Decimal("0.001"), 2)
+
+
+def test_parse_quantity() -> None:
+    assert parse_quantity("50.30", Decimal("0.01")) == Decimal("50.3")
+
+    with pytest.raises(QuantityNotAlignedError) as exc_info:
+        parse_quantity("50.35", Decimal("0.1"))
+    assert exc_info.value.quantity == Decimal("50.35")
+    assert exc_info.value.quantity_increment == Decimal("0.1")
+
+
+def test_parse_levels() -> None:
+    levels = [["10.5", "100.15"], ["10.6", "1.00", "3"]]
+
+    assert parse_levels(levels, Decimal("0.01")) == [
+        OrderInfo(price=Decimal("10.5"), quantity=Decimal("100.15")),
+        OrderInfo(price=Decimal("10.6"), quantity=Decimal(1)),
+    ]
+    with pytest.raises(QuantityNotAlignedError):
+        parse_levels(levels, Decimal("0.1"))
+
+
+def test_parse_scaled_levels() -> None:
+    levels = [["10.5", "100.15"], ["10.6", "1.00"]]
+
+    assert parse_scaled_levels(levels, 2, 4, Decimal("0.01")) == (
+        [1050, 1060],
+        [1001500, 10000],
+    )
+    with pytest.raises(QuantityNotAlignedError):
+        parse_scaled_levels(levels, 2, 4, Decimal("0.1"))
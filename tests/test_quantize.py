@@ -0,0 +1,30 @@
+from decimal import ROUND_FLOOR, ROUND_HALF_EVEN, Decimal
+
+import pytest
+
+from arbitragepy.quantize import get_quantizer, quantize_down, quantize_up
+
+
+@pytest.mark.parametrize(
+    "n, step, up, down",
+    [
+        ("1.2345", "0.01", "1.24", "1.23"),
+        ("1.23", "0.01", "1.23", "1.23"),
+        ("1.2345", "0.05", "1.25", "1.20"),
+        ("1.25", "0.05", "1.25", "1.25"),
+        ("123", "1E+1", "130", "120"),
+        ("-1.2345", "0.01", "-1.24", "-1.23"),
+    ],
+)
+def test_quantize_up_and_down(n: str, step: str, up: str, down: str) -> None:
+    assert quantize_up(Decimal(n), Decimal(step)) == Decimal(up)
+    assert quantize_down(Decimal(n), Decimal(step)) == Decimal(down)
+
+
+def test_get_quantizer_is_cached() -> None:
+    quantizer = get_quantizer(Decimal("0.01"), ROUND_FLOOR)
+
+    assert quantizer is get_quantizer(Decimal("0.01"), ROUND_FLOOR)
+    assert quantizer is not get_quantizer(Decimal("0.01"), ROUND_HALF_EVEN)
+    assert quantizer(Decimal("-1.231")) == Decimal("-1.24")
+    assert str(quantizer(Decimal(2))) == "2.00"
@@ -0,0 +1,93 @@
+import random
+from decimal import Decimal
+
+from arbitragepy.enums import RankBy
+from arbitragepy.models import ArbitrageResult, OrderInfo, OrderPayload, SymbolInfo
+from arbitragepy.ranking import OpportunityHeap
+from arbitragepy.reactor import ArbitrageReactor
+
+ORDER = OrderPayload(
+    price=Decimal(1),
+    quantity=Decimal(1),
+    notional_value=Decimal(1),
+    taken_fee=Decimal(0),
+)
+
+
+def make_result(profit: int, spread: int = 0) -> ArbitrageResult:
+    return ArbitrageResult(
+        ask_order=ORDER, bid_order=ORDER, spread=Decimal(spread), profit=Decimal(profit)
+    )
+
+
+def test_opportunity_heap_update_and_remove() -> None:
+    heap = OpportunityHeap()
+    heap.update("a", make_result(5))
+    heap.update("b", make_result(10))
+    heap.update("c", make_result(7))
+
+    assert heap.peek() == ("b", make_result(10))
+
+    heap.update("b", make_result(1))
+    assert heap.peek() == ("c", make_result(7))
+
+    heap.update("c", make_result(-1))
+    assert "c" not in heap
+    assert [key for key, _ in heap.top(10)] == ["a", "b"]
+
+    heap.remove("a")
+    heap.remove("unknown")
+    assert heap.pop() == ("b", make_result(1))
+    assert heap.pop() is None
+    assert len(heap) == 0
+
+
+def test_opportunity_heap_rank_by_spread() -> None:
+    heap = OpportunityHeap(rank_by=RankBy.SPREAD)
+    heap.update("a", make_result(profit=10, spread=1))
+    heap.update("b", make_result(profit=1, spread=10))
+
+    assert heap.top(1) == [("b", make_result(profit=1, spread=10))]
+
+
+def test_opportunity_heap_top_matches_sort() -> None:
+    rng = random.Random(1)
+    heap = OpportunityHeap()
+    profits = {}
+    for _ in range(2000):
+        key = rng.randrange(100)
+        profit = rng.randrange(-50, 1000)
+        heap.update(key, make_result(profit))
+        if profit > 0:
+            profits[key] = profit
+        else:
+            profits.pop(key, None)
+
+    expected = sorted(profits.values(), reverse=True)[:20]
+    assert [result.profit for _, result in heap.top(20)] == expected
+    assert len(heap) == len(profits)
+
+
+def test_reactor_feeds_opportunity_heap() -> None:
+    heap = OpportunityHeap()
+    reactor = ArbitrageReactor(rankings=[heap])
+    symbol = SymbolInfo(quantity_increment=Decimal("0.01"))
+    reactor.add_market("a", "BTC/USDT", symbol)
+    reactor.add_market("b", "BTC/USDT", symbol)
+
+    reactor.update_quote(
+        "a",
+        "BTC/USDT",
+        OrderInfo(price=Decimal(100), quantity=Decimal(1)),
+        OrderInfo(price=Decimal(99), quantity=Decimal(1)),
+    )
+    reactor.update_quote(
+        "b",
+        "BTC/USDT",
+        OrderInfo(price=Decimal(102), quantity=Decimal(1)),
+        OrderInfo(price=Decimal(101), quantity=Decimal(1)),
+    )
+    assert [key for key, _ in heap.top(5)] == [("BTC/USDT", "a", "b")]
+
+    reactor.update_quote("b", "BTC/USDT", None, None)
+    assert len(heap) == 0
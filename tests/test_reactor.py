@@ -0,0 +1,152 @@
+from decimal import Decimal
+
+import pytest
+
+from arbitragepy.enums import OrderSide
+from arbitragepy.exceptions import QuantityLessThanMinQuantityError, ZeroQuantityError
+from arbitragepy.models import OrderInfo, SymbolInfo
+from arbitragepy.reactor import ArbitrageReactor
+
+SYMBOL = SymbolInfo(quantity_increment=Decimal("0.01"), fee=Decimal("0.1"))
+
+
+def make_reactor() -> ArbitrageReactor:
+    reactor = ArbitrageReactor()
+    for venue in ("a", "b", "c"):
+        reactor.add_market(venue, "BTC/USDT", SYMBOL, "BTC", "USDT")
+    reactor.add_market("a", "ETH/USDT", SYMBOL, "ETH", "USDT")
+    reactor.add_market("b", "ETH/USDT", SYMBOL, "ETH", "USDT")
+    return reactor
+
+
+def quote(ask: str, bid: str) -> tuple[OrderInfo, OrderInfo]:
+    return (
+        OrderInfo(price=Decimal(ask), quantity=Decimal(1)),
+        OrderInfo(price=Decimal(bid), quantity=Decimal(1)),
+    )
+
+
+def test_reactor_reevaluates_only_affected_pairs() -> None:
+    reactor = make_reactor()
+
+    evaluated = reactor.update_quote("a", "BTC/USDT", *quote("100", "99"))
+
+    assert len(reactor.pairs()) == 8
+    assert {ctx.pair_id for ctx in evaluated} == {
+        ("BTC/USDT", "a", "b"),
+        ("BTC/USDT", "a", "c"),
+        ("BTC/USDT", "b", "a"),
+        ("BTC/USDT", "c", "a"),
+    }
+
+
+def test_reactor_add_existing_market() -> None:
+    reactor = make_reactor()
+
+    with pytest.raises(ValueError):
+        reactor.add_market("a", "BTC/USDT", SYMBOL)
+
+
+def test_reactor_maintains_best_pair() -> None:
+    reactor = make_reactor()
+    reactor.update_quote("a", "BTC/USDT", *quote("100", "99"))
+    reactor.update_quote("b", "BTC/USDT", *quote("102", "101"))
+    reactor.update_quote("c", "BTC/USDT", *quote("104", "103"))
+
+    best = reactor.best("BTC/USDT")
+    assert best is not None
+    assert best.pair_id == ("BTC/USDT", "a", "c")
+    assert reactor.best("ETH/USDT") is None
+
+    # The best pair gets worse, so the next one should be selected.
+    reactor.update_quote("c", "BTC/USDT", *quote("104", "100.5"))
+    best = reactor.best("BTC/USDT")
+    assert best is not None
+    assert best.pair_id == ("BTC/USDT", "a", "b")
+
+    reactor.update_quote("b", "BTC/USDT", *quote("102", "99"))
+    assert reactor.best("BTC/USDT") is not None
+    reactor.update_quote("c", "BTC/USDT", None, None)
+    assert reactor.best("BTC/USDT") is None
+
+
+def test_reactor_uses_balances() -> None:
+    reactor = make_reactor()
+    reactor.update_quote("a", "ETH/USDT", *quote("100", "99"))
+    reactor.update_quote("b", "ETH/USDT", *quote("102", "101"))
+
+    ctx = reactor.pair(("ETH/USDT", "a", "b"))
+    assert ctx.result is not None
+    assert ctx.result.ask_order.quantity == Decimal(1)
+
+    reactor.update_balance("b", "ETH", Decimal("0.5"))
+    evaluated = reactor.update_balance("a", "USDT", Decimal(10))
+
+    assert ctx in evaluated
+    assert len(evaluated) == 3
+    assert ctx.result is not None
+    assert ctx.result.ask_order.quantity == Decimal("0.09")
+
+    assert reactor.best("ETH/USDT") is ctx
+
+
+def test_reactor_stores_rejection() -> None:
+    reactor = ArbitrageReactor()
+    symbol = SymbolInfo(quantity_increment=Decimal("0.01"), min_quantity=Decimal(2))
+    reactor.add_market("a", "BTC/USDT", symbol)
+    reactor.add_market("b", "BTC/USDT", symbol)
+    reactor.update_quote("a", "BTC/USDT", *quote("100", "99"))
+    reactor.update_quote("b", "BTC/USDT", *quote("102", "101"))
+
+    ctx = reactor.pair(("BTC/USDT", "a", "b"))
+    assert ctx.result is None
+    assert isinstance(ctx.error, QuantityLessThanMinQuantityError)
+    assert reactor.best("BTC/USDT") is None
+
+
+def test_reactor_rejects_pairs_sized_to_zero() -> None:
+    reactor = make_reactor()
+    reactor.update_quote("a", "ETH/USDT", *quote("100", "99"))
+    reactor.update_quote("b", "ETH/USDT", *quote("102", "101"))
+    reactor.update_balance("b", "ETH", Decimal("0.5"))
+
+    evaluated = reactor.update_balance("a", "USDT", Decimal(0))
+
+    ctx = reactor.pair(("ETH/USDT", "a", "b"))
+    assert ctx in evaluated
+    assert ctx.result is None
+    assert isinstance(ctx.error, ZeroQuantityError)
+    assert reactor.best("ETH/USDT") is None
+
+    # Order quantity below the increment.
+    reactor.update_quote("b", "BTC/USDT", *quote("102", "101"))
+    evaluated = reactor.update_quote(
+        "a",
+        "BTC/USDT",
+        OrderInfo(price=Decimal(100), quantity=Decimal("0.005")),
+        OrderInfo(price=Decimal(99), quantity=Decimal(1)),
+    )
+
+    ctx = reactor.pair(("BTC/USDT", "a", "b"))
+    assert ctx in evaluated
+    assert ctx.result is None
+    assert isinstance(ctx.error, ZeroQuantityError)
+    assert ctx.error.side is OrderSide.ASK
+    assert ctx.error.quantity_increment == Decimal("0.01")
+
+
+def test_reactor_rejects_zero_quantity_after_price_rounding() -> None:
+    symbol = SymbolInfo(quantity_increment=Decimal(1), price_precision=Decimal("0.01"))
+    reactor = ArbitrageReactor()
+    reactor.add_market("a", "BTC/USDT", symbol, "BTC", "USDT")
+    reactor.add_market("b", "BTC/USDT", symbol, "BTC", "USDT")
+    reactor.update_balance("a", "USDT", Decimal("10.005"))
+    reactor.update_balance("b", "BTC", Decimal(5))
+    reactor.update_quote("b", "BTC/USDT", *quote("20", "20"))
+
+    # 10.005 buys 1 at 10.001 but not at 10.01 after rounding the price up.
+    reactor.update_quote("a", "BTC/USDT", *quote("10.001", "10"))
+
+    ctx = reactor.pair(("BTC/USDT", "a", "b"))
+    assert ctx.result is None
+    assert isinstance(ctx.error, ZeroQuantityError)
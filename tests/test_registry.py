@@ -0,0 +1,179 @@
+import gc
+import json
+import os
+import weakref
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from arbitragepy.fee_schedule import FeeTier
+from arbitragepy.models import SymbolInfo
+from arbitragepy.registry import SymbolRegistry, symbol_info_from_dict
+
+BTC = {"quantity_increment": "0.00001", "min_notional": "10", "fee": "0.1"}
+
+
+def write(path: Path, data: object, mtime_ns: int) -> None:
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_symbol_info_from_dict() -> None:
+    assert symbol_info_from_dict(
+        {
+            "quantity_increment": "0.01",
+            "max_quantity": 100,
+            "fee_in_base_currency": True,
+        }
+    ) == SymbolInfo(
+        quantity_increment=Decimal("0.01"),
+        max_quantity=Decimal(100),
+        fee_in_base_currency=True,
+    )
+
+    with pytest.raises(TypeError):
+        symbol_info_from_dict({"quantity_increment": 0.01})
+    with pytest.raises(ValueError):
+        symbol_info_from_dict({"quantity_increment": "0.01", "unknown": 1})
+    with pytest.raises(ValueError, match="quantity_increment"):
+        symbol_info_from_dict({"quantity_increment": "abc"})
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(True, True), (False, False), ("true", True), ("False", False), ("0", False)],
+)
+def test_symbol_info_from_dict_parses_flags(value: object, expected: bool) -> None:
+    info = symbol_info_from_dict(
+        {"quantity_increment": "0.01", "fee_in_base_currency": value}
+    )
+
+    assert info.fee_in_base_currency is expected
+
+
+@pytest.mark.parametrize("value", ["yes", "", 1, None])
+def test_symbol_info_from_dict_rejects_invalid_flags(value: object) -> None:
+    with pytest.raises(ValueError, match="fee_in_base_currency"):
+        symbol_info_from_dict(
+            {"quantity_increment": "0.01", "fee_in_base_currency": value}
+        )
+
+
+def test_symbol_info_from_dict_parses_fee_schedule() -> None:
+    filters = {
+        "quantity_increment": "0.01",
+        "fee_schedule": {
+            "tiers": [
+                {"min_volume": "0", "maker_fee": "0.1", "taker_fee": "0.1"},
+                {"min_volume": 50000, "maker_fee": "0.08", "taker_fee": "0.09"},
+            ],
+            "volume": "60000",
+        },
+    }
+
+    info = symbol_info_from_dict(filters)
+
+    assert info.fee_schedule is not None
+    assert info.fee_schedule.tiers[1] == FeeTier(
+        min_volume=Decimal(50000), maker_fee=Decimal("0.08"), taker_fee=Decimal("0.09")
+    )
+    assert info.taker_fee == Decimal("0.09")
+    # Schedules are mutable, so symbols do not share them.
+    assert symbol_info_from_dict(filters).fee_schedule is not info.fee_schedule
+
+
+@pytest.mark.parametrize(
+    ("schedule", "error"),
+    [
+        ([], ValueError),
+        ({"tiers": []}, ValueError),
+        ({"tiers": [{"min_volume": "0", "taker_fee": "0.1"}]}, ValueError),
+        (
+            {"tiers": [{"min_volume": "0", "maker_fee": "0.1", "taker_fee": 0.1}]},
+            TypeError,
+        ),
+        ({"tiers": [], "unknown": 1}, ValueError),
+    ],
+)
+def test_symbol_info_from_dict_rejects_invalid_fee_schedule(
+    schedule: object, error: type[Exception]
+) -> None:
+    with pytest.raises(error, match="fee_schedule"):
+        symbol_info_from_dict({"quantity_increment": "0.01", "fee_schedule": schedule})
+
+
+def test_symbol_registry_interns_symbol_infos(tmp_path: Path) -> None:
+    write(tmp_path / "a.json", {"BTC/USDT": BTC}, 1)
+    write(
+        tmp_path / "b.json",
+        {"BTC/USDT": BTC, "ETH/USDT": {"quantity_increment": "0.1"}},
+        1,
+    )
+
+    registry = SymbolRegistry(tmp_path)
+
+    assert registry.version == 1
+    assert sorted(registry.venues()) == ["a", "b"]
+    assert registry.get("a", "BTC/USDT") is registry.get("b", "BTC/USDT")
+    assert registry.get("b", "ETH/USDT").quantity_increment == Decimal("0.1")
+    assert len(list(registry)) == 3
+    with pytest.raises(KeyError):
+        registry.get("a", "ETH/USDT")
+
+
+def test_symbol_registry_reload(tmp_path: Path) -> None:
+    write(tmp_path / "a.json", {"BTC/USDT": BTC}, 1)
+    write(tmp_path / "b.json", {"BTC/USDT": BTC}, 1)
+    registry = SymbolRegistry(tmp_path)
+    b_symbols = registry.symbols("b")
+    btc = registry.get("a", "BTC/USDT")
+
+    assert not registry.reload()
+    assert registry.version == 1
+
+    write(tmp_path / "a.json", {"BTC/USDT": {**BTC, "fee": "0.2"}}, 2)
+    assert registry.reload()
+    assert registry.version == 2
+    assert registry.get("a", "BTC/USDT").fee == Decimal("0.2")
+    assert registry.symbols("b") == b_symbols
+
+    write(tmp_path / "a.json", {"BTC/USDT": BTC}, 3)
+    (tmp_path / "b.json").unlink()
+    assert registry.reload()
+    assert registry.get("a", "BTC/USDT") is btc
+    assert registry.venues() == ["a"]
+
+
+def test_symbol_registry_keeps_symbols_on_invalid_file(tmp_path: Path) -> None:
+    write(tmp_path / "a.json", {"BTC/USDT": BTC}, 1)
+    registry = SymbolRegistry(tmp_path)
+
+    write(tmp_path / "a.json", {"BTC/USDT": {"quantity_increment": 0.1}}, 2)
+    with pytest.raises(TypeError):
+        registry.reload()
+
+    assert registry.version == 1
+    assert registry.get("a", "BTC/USDT").fee == Decimal("0.1")
+
+
+@pytest.mark.parametrize("data", [["BTC/USDT"], "BTC/USDT", {"BTC/USDT": ["0.1"]}])
+def test_symbol_registry_rejects_files_which_are_not_objects(
+    tmp_path: Path, data: object
+) -> None:
+    write(tmp_path / "a.json", data, 1)
+
+    with pytest.raises(TypeError, match="must"):
+        SymbolRegistry(tmp_path)
+
+
+def test_symbol_registry_forgets_unused_infos(tmp_path: Path) -> None:
+    write(tmp_path / "a.json", {"BTC/USDT": BTC}, 1)
+    registry = SymbolRegistry(tmp_path)
+    old = weakref.ref(registry.get("a", "BTC/USDT"))
+
+    write(tmp_path / "a.json", {"BTC/USDT": {**BTC, "fee": "0.2"}}, 2)
+    assert registry.reload()
+    gc.collect()
+
+    assert old() is None
@@ -0,0 +1,89 @@
+import multiprocessing
+from decimal import Decimal
+
+import pytest
+
+from arbitragepy.models import OrderInfo
+from arbitragepy.shared_quotes import SharedQuoteTable
+
+KEYS = [("a", "BTC/USDT"), ("b", "BTC/USDT")]
+ASK = OrderInfo(price=Decimal("10.5"), quantity=Decimal("100.15"))
+BID = OrderInfo(price=Decimal("10.4"), quantity=Decimal("0.00012340"))
+
+
+def read_in_child(name: str) -> tuple[OrderInfo | None, OrderInfo | None]:
+    with SharedQuoteTable.attach(name, KEYS) as table:
+        return table.read("a", "BTC/USDT")
+
+
+def test_shared_quote_table() -> None:
+    table = SharedQuoteTable.create(KEYS)
+    try:
+        assert table.read("a", "BTC/USDT") == (None, None)
+
+        table.write("a", "BTC/USDT", ASK, BID)
+        table.write("b", "BTC/USDT", None, BID)
+
+        with SharedQuoteTable.attach(table.name, KEYS) as reader:
+            assert reader.read("a", "BTC/USDT") == (ASK, BID)
+            assert reader.read("b", "BTC/USDT") == (None, BID)
+            assert reader.read_scaled("a", "BTC/USDT") == (
+                1050000000,
+                10015000000,
+                1040000000,
+                12340,
+            )
+    finally:
+        table.close()
+        table.unlink()
+
+
+def test_shared_quote_table_in_another_process() -> None:
+    table = SharedQuoteTable.create(KEYS)
+    try:
+        table.write("a", "BTC/USDT", ASK, BID)
+
+        with multiprocessing.get_context("spawn").Pool(1) as pool:
+            assert pool.apply(read_in_child, (table.name,)) == (ASK, BID)
+    finally:
+        table.close()
+        table.unlink()
+
+
+def test_shared_quote_table_attach_with_other_keys() -> None:
+    table = SharedQuoteTable.create(KEYS)
+    try:
+        with pytest.raises(ValueError):
+            SharedQuoteTable.attach(table.name, KEYS[:1])
+    finally:
+        table.close()
+        table.unlink()
+
+
+def test_shared_quote_table_rejects_values_out_of_range() -> None:
+    table = SharedQuoteTable.create(KEYS)
+    try:
+        table.write("a", "BTC/USDT", ASK, BID)
+
+        too_big = OrderInfo(price=Decimal("2e11"), quantity=Decimal(1))
+        with pytest.raises(ValueError):
+            table.write("a", "BTC/USDT", too_big, BID)
+
+        assert table.read("a", "BTC/USDT", timeout=0.1) == (ASK, BID)
+    finally:
+        table.close()
+        table.unlink()
+
+
+def test_shared_quote_table_read_times_out_on_dead_writer() -> None:
+    table = SharedQuoteTable.create(KEYS)
+    try:
+        # Writer died after making the sequence odd.
+        table._values[3] += 1
+
+        with pytest.raises(TimeoutError):
+            table.read_scaled("a", "BTC/USDT", timeout=0.01)
+        assert table.read("b", "BTC/USDT") == (None, None)
+    finally:
+        table.close()
+        table.unlink()
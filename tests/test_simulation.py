@@ -0,0 +1,96 @@
+from decimal import Decimal
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.models import ArbitragePayload, OrderInfo, SymbolInfo
+from arbitragepy.simulation import (
+    RandomFillModel,
+    ScriptedFillModel,
+    simulate_execution,
+)
+
+SYMBOL = SymbolInfo(quantity_increment=Decimal("0.01"), fee=Decimal("0.1"))
+ASK_LEVELS = [
+    OrderInfo(price=Decimal("10.5"), quantity=Decimal("100.15")),
+    OrderInfo(price=Decimal("11.6"), quantity=Decimal(100)),
+]
+BID_LEVELS = [
+    OrderInfo(price=Decimal("11.5"), quantity=Decimal("50.3")),
+    OrderInfo(price=Decimal(10), quantity=Decimal(100)),
+]
+PLANNED = arbitrage(
+    ask=ArbitragePayload(symbol=SYMBOL, order=ASK_LEVELS[0]),
+    bid=ArbitragePayload(symbol=SYMBOL, order=BID_LEVELS[0]),
+)
+
+
+def test_simulate_execution_with_full_fills() -> None:
+    """Should realize planned profit if order book does not change."""
+
+    result = simulate_execution(
+        SYMBOL,
+        ASK_LEVELS,
+        SYMBOL,
+        BID_LEVELS,
+        PLANNED,
+        fill_model=ScriptedFillModel([[Decimal(1)]]),
+        scenarios=10,
+    )
+
+    assert result.profits == (PLANNED.profit,) * 10
+    assert result.mean_profit == PLANNED.profit
+    assert result.value_at_risk == Decimal(0)
+    assert result.loss_probability == Decimal(0)
+    assert result.mean_unhedged_quantity == Decimal(0)
+
+
+def test_simulate_execution_with_vanished_top_levels() -> None:
+    """Should take the next levels and lose money if top levels vanished."""
+
+    result = simulate_execution(
+        SYMBOL,
+        ASK_LEVELS,
+        SYMBOL,
+        BID_LEVELS,
+        PLANNED,
+        fill_model=ScriptedFillModel([[Decimal(1)]]),
+        bid_fill_model=ScriptedFillModel([[Decimal(1)], [Decimal(0)]]),
+        scenarios=4,
+    )
+
+    assert result.profits[0] == PLANNED.profit
+    assert result.profits[1] < 0
+    assert result.loss_probability == Decimal("0.5")
+    assert result.value_at_risk == -result.profits[1]
+
+
+def test_simulate_execution_with_partial_bid_fill() -> None:
+    """Should carry unsold base currency at cost."""
+
+    result = simulate_execution(
+        SYMBOL,
+        ASK_LEVELS[:1],
+        SYMBOL,
+        BID_LEVELS[:1],
+        PLANNED,
+        fill_model=ScriptedFillModel([[Decimal(1)]]),
+        bid_fill_model=ScriptedFillModel([[Decimal("0.5")]]),
+        scenarios=1,
+    )
+
+    assert result.mean_unhedged_quantity == Decimal("25.15")
+    assert result.profits[0] > 0
+
+
+def test_simulate_execution_is_reproducible() -> None:
+    model = RandomFillModel(vanish_probability=0.3, min_fill_ratio=Decimal("0.2"))
+
+    first = simulate_execution(
+        SYMBOL, ASK_LEVELS, SYMBOL, BID_LEVELS, PLANNED, model, seed=7
+    )
+    second = simulate_execution(
+        SYMBOL, ASK_LEVELS, SYMBOL, BID_LEVELS, PLANNED, model, seed=7
+    )
+
+    assert first == second
+    assert len(first.profits) == 1000
+    assert 0 < first.loss_probability < 1
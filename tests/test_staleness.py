@@ -0,0 +1,105 @@
+import random
+from decimal import Decimal
+
+from arbitragepy.models import OrderInfo, SymbolInfo
+from arbitragepy.ranking import OpportunityHeap
+from arbitragepy.reactor import ArbitrageReactor
+from arbitragepy.staleness import QuoteStalenessIndex, TimerWheel
+
+SYMBOL = SymbolInfo(quantity_increment=Decimal("0.01"))
+
+
+def test_timer_wheel_matches_brute_force() -> None:
+    rng = random.Random(3)
+    wheel = TimerWheel(slot_bits=2, levels=3, now=5)
+    deadlines: dict[int, int] = {}
+
+    now = 5
+    for _ in range(2000):
+        action = rng.random()
+        key = rng.randrange(50)
+        if action < 0.5:
+            deadline = now + rng.choice([-1, 0, 1, 3, 17, 64, 200])
+            wheel.schedule(key, deadline)
+            deadlines[key] = deadline
+        elif action < 0.6:
+            wheel.cancel(key)
+            deadlines.pop(key, None)
+        else:
+            now += rng.choice([0, 1, 2, 5, 30, 100])
+            expected = {k for k, d in deadlines.items() if d <= now}
+            assert set(wheel.advance(now)) == expected
+            for k in expected:
+                del deadlines[k]
+        assert len(wheel) == len(deadlines)
+
+
+def test_timer_wheel_skips_time_when_empty() -> None:
+    wheel = TimerWheel()
+
+    assert wheel.advance(10**12) == []
+    wheel.schedule("a", 10**12 + 5)
+    assert wheel.advance(10**12 + 4) == []
+    assert wheel.advance(10**12 + 5) == ["a"]
+
+
+def make_index() -> tuple[QuoteStalenessIndex, ArbitrageReactor, OpportunityHeap]:
+    heap = OpportunityHeap()
+    reactor = ArbitrageReactor(rankings=[heap])
+    for venue in ("a", "b"):
+        reactor.add_market(venue, "BTC/USDT", SYMBOL)
+    index = QuoteStalenessIndex(
+        reactor, max_age_ns={"a": 100, "b": 1000}, tick_ns=10, clock=lambda: 0
+    )
+    return index, reactor, heap
+
+
+def quote(ask: str, bid: str) -> tuple[OrderInfo, OrderInfo]:
+    return (
+        OrderInfo(price=Decimal(ask), quantity=Decimal(1)),
+        OrderInfo(price=Decimal(bid), quantity=Decimal(1)),
+    )
+
+
+def test_expired_quotes_are_withdrawn_from_reactor_and_rankings() -> None:
+    index, reactor, heap = make_index()
+    index.update_quote("a", "BTC/USDT", *quote("100", "99"), timestamp_ns=0)
+    index.update_quote("b", "BTC/USDT", *quote("111", "110"), timestamp_ns=50)
+    assert ("BTC/USDT", "a", "b") in heap
+    assert reactor.best("BTC/USDT") is not None
+
+    assert index.expire(now_ns=90) == []
+    assert index.is_live("a", "BTC/USDT")
+
+    evaluated = index.expire(now_ns=100)
+    assert {ctx.pair_id for ctx in evaluated} == {
+        ("BTC/USDT", "a", "b"),
+        ("BTC/USDT", "b", "a"),
+    }
+    assert not index.is_live("a", "BTC/USDT")
+    assert index.is_live("b", "BTC/USDT")
+    assert len(heap) == 0
+    assert reactor.best("BTC/USDT") is None
+
+    index.update_quote("a", "BTC/USDT", *quote("100", "99"), timestamp_ns=150)
+    assert ("BTC/USDT", "a", "b") in heap
+
+
+def test_update_postpones_expiry_and_collects_stats() -> None:
+    index, _, _ = make_index()
+    for timestamp in (0, 60, 120, 300):
+        index.update_quote("a", "BTC/USDT", *quote("100", "99"), timestamp_ns=timestamp)
+        assert index.expire(now_ns=timestamp + 90) == []
+    index.update_quote("b", "BTC/USDT", *quote("100", "99"), timestamp_ns=0)
+
+    index.expire(now_ns=400)
+
+    assert index.timestamp("a", "BTC/USDT") == 300
+    stats = index.stats()
+    assert stats["a"].updates == 4
+    assert stats["a"].expirations == 1
+    assert stats["a"].live == 0
+    assert stats["a"].mean_update_interval_ns == 100
+    assert stats["a"].max_update_interval_ns == 180
+    assert stats["b"].live == 1
+    assert stats["b"].expirations == 0
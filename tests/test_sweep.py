@@ -0,0 +1,145 @@
+from dataclasses import replace
+from decimal import Decimal
+
+import pytest
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.exceptions import ArbitrageError
+from arbitragepy.models import ArbitragePayload, OrderInfo, SymbolInfo
+from arbitragepy.parallel import ConcurrentEvaluator
+from arbitragepy.sweep import sweep
+
+SYMBOL = SymbolInfo(quantity_increment=Decimal("0.01"), fee=Decimal("0.1"))
+
+PAIRS = [
+    (
+        ArbitragePayload(
+            symbol=SYMBOL,
+            order=OrderInfo(price=Decimal(100), quantity=Decimal(quantity)),
+            balance=Decimal(1000),
+        ),
+        ArbitragePayload(
+            symbol=SYMBOL,
+            order=OrderInfo(price=Decimal(bid_price), quantity=Decimal(5)),
+            balance=Decimal(10),
+        ),
+    )
+    for quantity, bid_price in [("2", "101"), ("3", "100.5"), ("1", "103"), ("4", "99")]
+]
+
+FEES = [Decimal(0), Decimal("0.1"), Decimal("0.5")]
+BALANCES = [Decimal(150), None]
+SPREADS = [Decimal(0), Decimal("0.5"), Decimal(2)]
+
+
+def expected_cell(
+    fee: Decimal, balance: Decimal | None, min_spread: Decimal
+) -> tuple[int, Decimal]:
+    count = 0
+    profit = Decimal(0)
+    for ask, bid in PAIRS:
+        ask = replace(ask, symbol=replace(SYMBOL, fee=fee), balance=balance)
+        bid = replace(bid, symbol=replace(SYMBOL, fee=fee))
+        try:
+            result = arbitrage(ask, bid)
+        except ArbitrageError:
+            continue
+        if result.profit > 0 and result.spread >= min_spread:
+            count += 1
+            profit += result.profit
+    return count, profit
+
+
+def test_sweep() -> None:
+    result = sweep(
+        PAIRS,
+        ask_fees=FEES,
+        bid_fees=FEES,
+        ask_balances=BALANCES,
+        min_spreads=SPREADS,
+    )
+
+    assert result.axes == {
+        "ask_fee": tuple(FEES),
+        "bid_fee": tuple(FEES),
+        "ask_balance": tuple(BALANCES),
+        "min_spread": tuple(SPREADS),
+    }
+    assert len(result) == 3 * 3 * 2 * 3
+    assert result.cells[1].params == {
+        "ask_fee": Decimal(0),
+        "bid_fee": Decimal(0),
+        "ask_balance": Decimal(150),
+        "min_spread": Decimal("0.5"),
+    }
+    for fee in FEES:
+        for balance in BALANCES:
+            for min_spread in SPREADS:
+                cell = result.cell(
+                    ask_fee=fee, bid_fee=fee, ask_balance=balance, min_spread=min_spread
+                )
+                assert (cell.opportunities, cell.profit) == expected_cell(
+                    fee, balance, min_spread
+                )
+
+    cell = result.cell(
+        ask_fee=Decimal(0), bid_fee=Decimal(0), ask_balance=None, min_spread=Decimal(0)
+    )
+    assert cell.opportunities == 3
+    assert cell.profit == Decimal(2) + Decimal("1.5") + Decimal(3)
+
+
+def test_sweep_without_axes() -> None:
+    result = sweep(PAIRS)
+
+    assert result.axes == {}
+    assert len(result) == 1
+    assert result.cell().params == {}
+    assert result.cell().opportunities == 3
+
+
+def test_sweep_skips_incompatible_pairs() -> None:
+    ask, bid = PAIRS[0]
+    ask = replace(ask, symbol=replace(SYMBOL, quantity_increment=Decimal("0.02")))
+    bid = replace(bid, symbol=replace(SYMBOL, quantity_increment=Decimal("0.03")))
+
+    result = sweep([(ask, bid)], ask_fees=FEES)
+
+    assert [cell.opportunities for cell in result] == [0, 0, 0]
+    assert [cell.rejected for cell in result] == [1, 1, 1]
+
+    result = sweep([(ask, bid)], make_compatible_quantity_increments=False)
+    assert result.cell().rejected == 0
+    with ConcurrentEvaluator(max_workers=1) as evaluator:
+        assert (
+            sweep(
+                [(ask, bid)],
+                make_compatible_quantity_increments=False,
+                evaluator=evaluator,
+            )
+            == result
+        )
+
+
+def test_sweep_counts_zero_quantity_as_rejected() -> None:
+    result = sweep(PAIRS, ask_balances=[Decimal(1000), Decimal("0.05")])
+
+    assert result.cell(ask_balance=Decimal(1000)).rejected == 0
+    cell = result.cell(ask_balance=Decimal("0.05"))
+    assert (cell.opportunities, cell.profit, cell.rejected) == (0, 0, len(PAIRS))
+
+
+def test_sweep_with_evaluator() -> None:
+    with ConcurrentEvaluator(max_workers=2, chunk_size=1) as evaluator:
+        result = sweep(PAIRS, bid_fees=FEES, min_spreads=SPREADS, evaluator=evaluator)
+
+    assert result == sweep(PAIRS, bid_fees=FEES, min_spreads=SPREADS)
+
+
+def test_sweep_cell_with_unknown_value() -> None:
+    result = sweep(PAIRS, ask_fees=FEES)
+
+    with pytest.raises(ValueError):
+        result.cell(ask_fee=Decimal(7))
+    with pytest.raises(KeyError):
+        result.cell()
@@ -0,0 +1,168 @@
+import io
+import json
+from dataclasses import replace
+from decimal import Decimal
+from pathlib import Path
+
+from arbitragepy.cli import load_symbols, scan
+from arbitragepy.fee_schedule import FeeSchedule, FeeTier
+from arbitragepy.models import SymbolInfo
+from arbitragepy.registry import SymbolRegistry
+from arbitragepy.synthetic import (
+    MarketGenerator,
+    SyntheticSymbol,
+    read_quotes,
+    write_quotes,
+)
+
+BTC = SyntheticSymbol(
+    name="BTC/USDT",
+    info=SymbolInfo(
+        quantity_increment=Decimal("0.0001"),
+        min_quantity=Decimal("0.001"),
+        max_quantity=Decimal("0.05"),
+    ),
+    price=Decimal(26000),
+    tick_size=Decimal("0.01"),
+)
+ETH = SyntheticSymbol(
+    name="ETH/USDT",
+    info=SymbolInfo(quantity_increment=Decimal("0.001"), fee=Decimal("0.1")),
+    price=Decimal("1600.5"),
+    tick_size=Decimal("0.05"),
+    volatility=Decimal(0),
+)
+
+
+def make_generator(seed: int = 1, **kwargs) -> MarketGenerator:
+    return MarketGenerator(["a", "b", "c"], [BTC, ETH], seed=seed, **kwargs)
+
+
+def rows(generator: MarketGenerator, size: int) -> list[tuple[int, ...]]:
+    batch = generator.batch(size)
+    return list(
+        zip(
+            batch.market,
+            batch.ask_price,
+            batch.ask_quantity,
+            batch.bid_price,
+            batch.bid_quantity,
+        )
+    )
+
+
+def test_generator_is_deterministic() -> None:
+    assert rows(make_generator(), 1000) == rows(make_generator(), 1000)
+    assert rows(make_generator(), 1000) != rows(make_generator(seed=2), 1000)
+
+
+def test_quotes_match_symbol_constraints() -> None:
+    generator = make_generator(crossed_probability=0)
+    for market, ask_price, ask_qty, bid_price, bid_qty in rows(generator, 10000):
+        symbol = generator.symbols[market // len(generator.venues)]
+        tick = int(symbol.tick_size.scaleb(generator.scale))
+        increment = int(symbol.info.quantity_increment.scaleb(generator.scale))
+        assert 0 < bid_price < ask_price
+        assert ask_price % tick == bid_price % tick == 0
+        for quantity in (ask_qty, bid_qty):
+            assert quantity % increment == 0
+            quantity = Decimal(quantity).scaleb(-generator.scale)
+            assert symbol.info.min_quantity <= quantity <= symbol.info.max_quantity
+
+
+def test_crossed_quotes() -> None:
+    generator = MarketGenerator(["a", "b"], [ETH], crossed_probability=1)
+    best_ask = {}
+    best_bid = {}
+    crossed = 0
+    for market, ask_price, _, bid_price, _ in rows(generator, 100):
+        best_ask[market] = ask_price
+        best_bid[market] = bid_price
+        if len(best_ask) == 2 and (max(best_bid.values()) > min(best_ask.values())):
+            crossed += 1
+    assert crossed > 0
+
+
+def test_ladder() -> None:
+    asks, bids = make_generator().ladder(1, depth=5)
+
+    assert len(asks) == len(bids) == 5
+    assert bids[0].price < asks[0].price
+    assert [a.price for a in asks] == sorted(a.price for a in asks)
+    assert [b.price for b in bids] == sorted((b.price for b in bids), reverse=True)
+    assert asks[1].price - asks[0].price == ETH.tick_size
+    assert all(a.quantity % ETH.info.quantity_increment == 0 for a in asks)
+
+
+def test_write_and_read_quotes() -> None:
+    generator = make_generator()
+    expected = rows(make_generator(), 2500)
+
+    file = io.BytesIO()
+    assert write_quotes(file, generator.batches(1000, 2), generator.scale) == 2000
+    assert write_quotes(io.BytesIO(), generator.batches(500, 1), 8) == 500
+    file.seek(0)
+
+    batches = list(read_quotes(file, batch_size=700))
+    assert [len(batch) for batch in batches] == [700, 700, 600]
+    actual = [
+        row
+        for batch in batches
+        for row in zip(
+            batch.market,
+            batch.ask_price,
+            batch.ask_quantity,
+            batch.bid_price,
+            batch.bid_quantity,
+        )
+    ]
+    assert actual == expected[:2000]
+
+
+def test_output_is_accepted_by_scan(tmp_path: Path) -> None:
+    generator = make_generator(crossed_probability=0.5)
+    generator.write_symbols(tmp_path)
+    assert sorted(SymbolRegistry(tmp_path).venues()) == ["a", "b", "c"]
+    assert SymbolRegistry(tmp_path).get("a", "BTC/USDT") == BTC.info
+
+    quotes = io.StringIO()
+    generator.write_jsonl(quotes, generator.batch(200))
+    lines = quotes.getvalue().splitlines(keepends=True)
+    assert json.loads(lines[0]).keys() == {"venue", "symbol", "ask", "bid"}
+
+    output = io.StringIO()
+    stats = scan(lines, load_symbols(tmp_path), output)
+    assert stats.events == 200
+    assert stats.opportunities > 0
+
+
+def test_write_symbols_keeps_fee_schedule(tmp_path: Path) -> None:
+    schedule = FeeSchedule(
+        [
+            FeeTier(
+                min_volume=Decimal(0),
+                maker_fee=Decimal("0.1"),
+                taker_fee=Decimal("0.1"),
+            ),
+            FeeTier(
+                min_volume=Decimal(1000000),
+                maker_fee=Decimal("0.02"),
+                taker_fee=Decimal("0.04"),
+            ),
+        ],
+        volume=Decimal(2500000),
+    )
+    symbol = SyntheticSymbol(
+        name="BTC/USDT",
+        info=replace(BTC.info, fee_schedule=schedule),
+        price=BTC.price,
+        tick_size=BTC.tick_size,
+    )
+
+    MarketGenerator(["a"], [symbol]).write_symbols(tmp_path)
+
+    loaded = SymbolRegistry(tmp_path).get("a", "BTC/USDT").fee_schedule
+    assert loaded is not None
+    assert loaded.tiers == schedule.tiers
+    assert loaded.volume == schedule.volume
+    assert loaded.taker_fee == Decimal("0.04")
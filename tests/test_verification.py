@@ -0,0 +1,116 @@
+from dataclasses import replace
+from decimal import Decimal
+
+import pytest
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.models import ArbitragePayload, ArbitrageResult
+from arbitragepy.verification import (
+    Engine,
+    backend_engine,
+    default_engines,
+    generate_cases,
+    outcome_of,
+    verify,
+)
+
+
+def test_generate_cases() -> None:
+    cases = generate_cases(2000, seed=7)
+
+    assert cases == generate_cases(2000, seed=7)
+    assert cases != generate_cases(2000, seed=8)
+    symbols = [payload.symbol for case in cases for payload in case]
+    assert any(not symbol.max_quantity.is_finite() for symbol in symbols)
+    assert any(symbol.max_quantity.is_finite() for symbol in symbols)
+    assert any(symbol.fee_in_base_currency for symbol in symbols)
+    assert any(symbol.quantity_increment == Decimal("0.03") for symbol in symbols)
+    assert all(symbol.price_precision is None for symbol in symbols)
+    assert any(payload.balance is None for case in cases for payload in case)
+
+    outcomes = {
+        outcome if isinstance(outcome, str) else "result"
+        for outcome in (outcome_of(arbitrage, ask, bid) for ask, bid in cases)
+    }
+    assert {
+        "result",
+        "ImcompabileQuantityIncrementsError",
+        "QuantityLessThanMinQuantityError",
+        "NotionalLessThanMinNotionalError",
+    } <= outcomes
+
+
+def test_generate_cases_with_precision() -> None:
+    cases = generate_cases(100, precision=True)
+
+    assert all(ask.symbol.price_precision is not None for ask, _ in cases)
+    assert all(bid.symbol.notional_precision is not None for _, bid in cases)
+
+
+def test_verify_default_engines() -> None:
+    report = verify(generate_cases(2000, seed=1))
+
+    assert report.ok
+    assert [engine.name for engine in report.engines] == [
+        engine.name for engine in default_engines()
+    ]
+    assert all(engine.cases == 2000 for engine in report.engines)
+    assert report.reference.cases_per_second > 0
+    assert "scaled8" in report.format()
+
+
+def test_verify_reports_mismatches() -> None:
+    def broken(ask: ArbitragePayload, bid: ArbitragePayload) -> ArbitrageResult:
+        result = arbitrage(ask, bid)
+        return replace(result, profit=result.profit + Decimal("0.0001"))
+
+    cases = generate_cases(200, seed=2)
+    report = verify(
+        cases,
+        [
+            Engine(name="broken", function=broken),
+            Engine(name="tolerant", function=broken, tolerance=Decimal("0.001")),
+        ],
+    )
+
+    broken_report, tolerant_report = report.engines
+    assert not report.ok
+    results = [
+        i
+        for i, (ask, bid) in enumerate(cases)
+        if not isinstance(outcome_of(arbitrage, ask, bid), str)
+    ]
+    assert [mismatch.index for mismatch in broken_report.mismatches] == results
+    mismatch = broken_report.mismatches[0]
+    assert (mismatch.ask, mismatch.bid) == cases[mismatch.index]
+    assert mismatch.actual.profit - mismatch.expected.profit == Decimal("0.0001")
+    assert tolerant_report.mismatches == []
+
+
+def test_verify_reports_different_rejections() -> None:
+    def rejects(ask: ArbitragePayload, bid: ArbitragePayload) -> ArbitrageResult:
+        raise ZeroDivisionError
+
+    report = verify(
+        generate_cases(50, seed=3), [Engine(name="rejects", function=rejects)]
+    )
+
+    assert all(
+        mismatch.actual == "ArithmeticError"
+        for mismatch in report.engines[0].mismatches
+    )
+    assert len(report.engines[0].mismatches) > 0
+
+
+@pytest.mark.parametrize("precision", [False, True])
+def test_verify_numpy_backend(precision: bool) -> None:
+    pytest.importorskip("numpy")
+    from arbitragepy.backends import numpy_backend
+
+    report = verify(
+        generate_cases(2000, seed=4, precision=precision),
+        [backend_engine(numpy_backend(), tolerance=Decimal("1e-6"))],
+    )
+
+    assert report.engines[0].cases == 2000
+    assert report.engines[0].mismatches == []
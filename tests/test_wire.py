@@ -0,0 +1,157 @@
+import pickle
+from decimal import Decimal
+
+import pytest
+
+from arbitragepy.arbitrage import arbitrage
+from arbitragepy.enums import OrderSide, RecordKind
+from arbitragepy.exceptions import (
+    ArbitrageError,
+    ImcompabileQuantityIncrementsError,
+    NotionalLessThanMinNotionalError,
+    QuantityLessThanMinQuantityError,
+    ZeroQuantityError,
+)
+from arbitragepy.models import ArbitrageResult, OrderPayload
+from arbitragepy.verification import generate_cases
+from arbitragepy.wire import (
+    RECORD_SIZE,
+    RecordView,
+    decode_outcome,
+    encode_outcome,
+    pack_outcomes,
+    unpack_outcomes,
+)
+
+ORDER = OrderPayload(
+    price=Decimal("10.50"),
+    quantity=Decimal("-0"),
+    notional_value=Decimal("1E+30"),
+    taken_fee=Decimal("1.5E-12"),
+)
+RESULT = ArbitrageResult(
+    ask_order=ORDER,
+    bid_order=OrderPayload(
+        price=Decimal("Infinity"),
+        quantity=Decimal(12345678901234567890123456789012345678),
+        notional_value=Decimal("-0.00000001"),
+        taken_fee=Decimal("0E-8"),
+    ),
+    spread=Decimal("NaN"),
+    profit=Decimal("-3.14"),
+)
+REJECTIONS = [
+    ImcompabileQuantityIncrementsError(Decimal("0.02"), Decimal("0.03")),
+    QuantityLessThanMinQuantityError(OrderSide.ASK, Decimal("0.5"), Decimal(1)),
+    NotionalLessThanMinNotionalError(OrderSide.BID, Decimal("9.99"), Decimal(10)),
+    ZeroQuantityError(OrderSide.ASK, Decimal("0.001")),
+]
+
+
+def outcomes() -> list[ArbitrageResult | ArbitrageError]:
+    results: list[ArbitrageResult | ArbitrageError] = []
+    for ask, bid in generate_cases(500):
+        try:
+            results.append(arbitrage(ask, bid))
+        except ArbitrageError as e:
+            results.append(e)
+        except ArithmeticError:
+            pass
+    return results
+
+
+def assert_same(
+    expected: ArbitrageResult | ArbitrageError, actual: ArbitrageResult | ArbitrageError
+) -> None:
+    assert type(actual) is type(expected)
+    if isinstance(expected, ArbitrageError):
+        assert vars(actual) == vars(expected)
+        assert str(actual) == str(expected)
+    else:
+        # Exponents are preserved too.
+        assert repr(actual) == repr(expected)
+
+
+def test_encode_outcome() -> None:
+    data = encode_outcome(RESULT)
+
+    assert len(data) == RECORD_SIZE
+    assert len(data) < len(pickle.dumps(RESULT))
+    assert repr(decode_outcome(data)) == repr(RESULT)
+
+
+@pytest.mark.parametrize("rejection", REJECTIONS)
+def test_encode_rejection(rejection: ArbitrageError) -> None:
+    assert_same(rejection, decode_outcome(encode_outcome(rejection)))
+
+
+def test_encode_not_fitting_values() -> None:
+    with pytest.raises(ValueError):
+        encode_outcome(ImcompabileQuantityIncrementsError(Decimal(2**128), Decimal(1)))
+    with pytest.raises(ValueError):
+        encode_outcome(
+            ImcompabileQuantityIncrementsError(Decimal("1E-3000000000"), Decimal(1))
+        )
+    with pytest.raises(TypeError):
+        encode_outcome(ArbitrageError())  # type: ignore[arg-type]
+
+
+def test_decode_unknown_kind() -> None:
+    with pytest.raises(ValueError):
+        decode_outcome(bytes(RECORD_SIZE))
+
+
+def test_pack_outcomes() -> None:
+    expected = outcomes()
+    buffer = bytearray(RECORD_SIZE * (len(expected) + 1))
+
+    written = pack_outcomes(buffer, expected, offset=RECORD_SIZE)
+
+    assert written == RECORD_SIZE * len(expected)
+    actual = unpack_outcomes(buffer, offset=RECORD_SIZE)
+    assert len(actual) == len(expected)
+    for e, a in zip(expected, actual):
+        assert_same(e, a)
+    results = [e for e in expected if isinstance(e, ArbitrageResult)]
+    assert [a for a in actual if isinstance(a, ArbitrageResult)] == results
+    assert unpack_outcomes(buffer, offset=RECORD_SIZE, count=2) == actual[:2]
+
+
+def test_pack_outcomes_into_small_buffer() -> None:
+    buffer = bytearray(RECORD_SIZE)
+
+    with pytest.raises(ValueError):
+        pack_outcomes(buffer, [RESULT, RESULT])
+    assert buffer == bytearray(RECORD_SIZE)
+
+
+def test_record_view() -> None:
+    expected = [RESULT, *REJECTIONS]
+    buffer = bytearray(RECORD_SIZE * len(expected))
+    pack_outcomes(buffer, expected)
+
+    view = RecordView(buffer)
+
+    assert len(view) == 5
+    assert [view.kind(i) for i in range(5)] == [
+        RecordKind.RESULT,
+        RecordKind.INCOMPATIBLE_QUANTITY_INCREMENTS,
+        RecordKind.QUANTITY_LESS_THAN_MIN_QUANTITY,
+        RecordKind.NOTIONAL_LESS_THAN_MIN_NOTIONAL,
+        RecordKind.ZERO_QUANTITY,
+    ]
+    assert view.value(0, "profit") == Decimal("-3.14")
+    assert str(view.value(0, "ask_quantity")) == "-0"
+    assert view.value(-2, "ask_price") == Decimal("9.99")
+    assert view.value(-1, "ask_price") == Decimal("0.001")
+    assert repr(view[0]) == repr(RESULT)
+    for e, a in zip(expected, view):
+        assert_same(e, a)
+    with pytest.raises(IndexError):
+        view[5]
+
+    # View shares memory with the buffer.
+    pack_outcomes(buffer, [REJECTIONS[0]])
+    assert view.kind(0) == RecordKind.INCOMPATIBLE_QUANTITY_INCREMENTS
+    view.release()
+    buffer.extend(bytes(RECORD_SIZE))